@@ -0,0 +1,140 @@
+"""Memory and allocation benchmark of the device model.
+
+Builds the object graph of a fleet of devices from the full points catalog
+(bac0_points_dump.txt) and compares it with the plain-class and dict based
+representation used before DeviceProperty and Tag got __slots__ and interning,
+and the device state got its array based store.
+
+usage: python benchmarks/memory.py [number-of-devices]
+"""
+import os
+import sys
+import tracemalloc
+from struct import pack
+from typing import Callable, List, Tuple
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# run from anywhere, with the package and the catalog generator of this checkout
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "scripts"))
+
+from flexit_bacnet.bacnet import CtxTag, DeviceProperty, ReadValue, TAG_CLOSE, TAG_OPEN  # noqa: E402
+from flexit_bacnet.state import DeviceStateStore, StateLayout  # noqa: E402
+from generate_catalog import parse  # noqa: E402
+
+DUMP_PATH = os.path.join(ROOT, "bac0_points_dump.txt")
+
+
+class LegacyTag:
+    def __init__(self, number: int, is_context: bool, length_type: int):
+        self.number = number
+        self.is_context = is_context
+        self.length_type = length_type
+
+    @property
+    def int(self) -> int:
+        ctx = 8 if self.is_context else 0
+        return self.number << 4 | ctx | self.length_type
+
+    def pack(self) -> bytes:
+        return pack("!B", self.int)
+
+
+class LegacyDeviceProperty:
+    def __init__(self, object_type, instance_id, read_values=None, priority=None, write_type=None):
+        self.object_type = object_type
+        self.instance_id = instance_id
+        self.read_values = read_values or [ReadValue.PRESENT_VALUE]
+        self.priority = priority
+        self.write_type = write_type
+
+    @property
+    def object_identifier(self):
+        return (self.object_type, self.instance_id)
+
+
+def read_catalog() -> List[Tuple[int, int]]:
+    return [(object_type, instance_id) for _, object_type, instance_id, *_ in parse(DUMP_PATH)]
+
+
+def measure(build: Callable[[], object]) -> Tuple[int, int]:
+    """Return size in bytes and number of memory blocks allocated by build()."""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    result = build()
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    del result
+
+    return sum(s.size_diff for s in stats), sum(s.count_diff for s in stats)
+
+
+def main():
+    devices = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    points = read_catalog()
+
+    def legacy_fleet():
+        return [[LegacyDeviceProperty(t, i) for t, i in points] for _ in range(devices)]
+
+    def fleet():
+        return [[DeviceProperty(t, i) for t, i in points] for _ in range(devices)]
+
+    # tags of the read access spec of every point
+    def legacy_tags():
+        tags = []
+        for _ in range(devices * len(points)):
+            tags.append(LegacyTag(0, True, 4))
+            tags.append(LegacyTag(1, True, TAG_OPEN))
+            tags.append(LegacyTag(0, True, 1))
+            tags.append(LegacyTag(1, True, TAG_CLOSE))
+        return tags
+
+    def tags():
+        tags = []
+        for _ in range(devices * len(points)):
+            tags.append(CtxTag(0, 4))
+            tags.append(CtxTag(1, TAG_OPEN))
+            tags.append(CtxTag(0, 1))
+            tags.append(CtxTag(1, TAG_CLOSE))
+        return tags
+
+    # values as read from the device, floats of analog objects and integers of the others
+    device_state = {
+        (t, i): [(ReadValue.PRESENT_VALUE, float(i) if t <= 2 else i)] for t, i in points
+    }
+    layout = StateLayout(DeviceProperty(t, i) for t, i in points)
+
+    def legacy_states():
+        return [{k: list(v) for k, v in device_state.items()} for _ in range(devices)]
+
+    def states():
+        stores = []
+        for _ in range(devices):
+            store = DeviceStateStore(layout)
+            store.update(device_state)
+            stores.append(store)
+        return stores
+
+    print(f"{devices} devices x {len(points)} points")
+    for name, legacy, current in (
+        ("device properties", legacy_fleet, fleet),
+        ("tags", legacy_tags, tags),
+        ("device states", legacy_states, states),
+    ):
+        legacy_size, legacy_blocks = measure(legacy)
+        size, blocks = measure(current)
+
+        print(
+            f"{name:>20}: {legacy_size / 2**20:8.1f} MiB, {legacy_blocks:9d} blocks"
+            f" -> {size / 2**20:8.1f} MiB, {blocks:9d} blocks"
+            f" ({100 * (1 - size / legacy_size):.0f}% less memory)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,31 @@
+from flexit_bacnet.bacnet import AbortResponse
+from flexit_bacnet.bacnet import BACnetError
+from flexit_bacnet.bacnet import BACnetTransport
 from flexit_bacnet.bacnet import DecodingError
+from flexit_bacnet.bacnet import DiscoveredDevice
+from flexit_bacnet.bacnet import ErrorResponse
+from flexit_bacnet.bacnet import RejectResponse
 from flexit_bacnet.bacnet import discover
+from flexit_bacnet.bacnet import discover_devices
+from flexit_bacnet.bacnet import discover_iter
+from flexit_bacnet.cache import CachedDevice
+from flexit_bacnet.cache import DeviceCache
+from flexit_bacnet.catalog import CATALOG
+from flexit_bacnet.catalog import Point
+from flexit_bacnet.catalog import PointCatalog
+from flexit_bacnet.device import Deadband
 from flexit_bacnet.device import FlexitBACnet
+from flexit_bacnet.device import PropertyChange
+from flexit_bacnet.device import WriteRefresh
+from flexit_bacnet.fleet import CycleSummary
+from flexit_bacnet.fleet import FlexitFleet
+from flexit_bacnet.fleet import PollResult
+from flexit_bacnet.fleet import PollStatus
 from flexit_bacnet.nordic import *
+from flexit_bacnet.profile import PointProfile
+from flexit_bacnet.profile import ProfileCache
+from flexit_bacnet.retry import RetryPolicy
+from flexit_bacnet.scheduler import PollScheduler
+from flexit_bacnet.sharding import HashRing
+from flexit_bacnet.sharding import ShardedFleet
+from flexit_bacnet.sharding import WorkerError
@@ -1,10 +1,25 @@
 import asyncio
+import ipaddress
 import os
 import socket
 
+from contextlib import asynccontextmanager
 from enum import IntEnum
-from struct import pack, unpack
-from typing import Any, Dict, List, Optional, Tuple
+from struct import pack, unpack, unpack_from
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy, RTTEstimator
 
 
 DEBUG = os.getenv("DEBUG") is not None
@@ -15,12 +30,84 @@ class APDUType(IntEnum):
     UNCONFIRMED_REQ = 1
     SIMPLE_ACK = 2
     COMPLEX_ACK = 3
+    SEGMENT_ACK = 4
+    ERROR = 5
+    REJECT = 6
+    ABORT = 7
 
 
 class PDUFlags(IntEnum):
     SEGMENTED_RESPONSE_ACCEPTED = 2
     MORE_SEGMENTS = 4
     SEGMENTED_REQUEST = 8
+    SEGMENTED_MESSAGE = 8
+
+
+class SegmentACKFlags(IntEnum):
+    SERVER = 1
+    NEGATIVE_ACK = 2
+
+
+class ErrorClass(IntEnum):
+    DEVICE = 0
+    OBJECT = 1
+    PROPERTY = 2
+    RESOURCES = 3
+    SECURITY = 4
+    SERVICES = 5
+    VT = 6
+    COMMUNICATION = 7
+
+
+class ErrorCode(IntEnum):
+    OTHER = 0
+    CONFIGURATION_IN_PROGRESS = 2
+    DEVICE_BUSY = 3
+    INVALID_DATA_TYPE = 9
+    MISSING_REQUIRED_PARAMETER = 16
+    NO_SPACE_TO_WRITE_PROPERTY = 20
+    OPERATIONAL_PROBLEM = 25
+    READ_ACCESS_DENIED = 27
+    SERVICE_REQUEST_DENIED = 29
+    TIMEOUT = 30
+    UNKNOWN_OBJECT = 31
+    UNKNOWN_PROPERTY = 32
+    VALUE_OUT_OF_RANGE = 37
+    WRITE_ACCESS_DENIED = 40
+    INVALID_ARRAY_INDEX = 42
+    COV_SUBSCRIPTION_FAILED = 43
+    NOT_COV_PROPERTY = 44
+    OPTIONAL_FUNCTIONALITY_NOT_SUPPORTED = 45
+    DATATYPE_NOT_SUPPORTED = 47
+    PROPERTY_IS_NOT_AN_ARRAY = 50
+
+
+class RejectReason(IntEnum):
+    OTHER = 0
+    BUFFER_OVERFLOW = 1
+    INCONSISTENT_PARAMETERS = 2
+    INVALID_PARAMETER_DATA_TYPE = 3
+    INVALID_TAG = 4
+    MISSING_REQUIRED_PARAMETER = 5
+    PARAMETER_OUT_OF_RANGE = 6
+    TOO_MANY_ARGUMENTS = 7
+    UNDEFINED_ENUMERATION = 8
+    UNRECOGNIZED_SERVICE = 9
+
+
+class AbortReason(IntEnum):
+    OTHER = 0
+    BUFFER_OVERFLOW = 1
+    INVALID_APDU_IN_THIS_STATE = 2
+    PREEMPTED_BY_HIGHER_PRIORITY_TASK = 3
+    SEGMENTATION_NOT_SUPPORTED = 4
+    SECURITY_ERROR = 5
+    INSUFFICIENT_SECURITY = 6
+    WINDOW_SIZE_OUT_OF_RANGE = 7
+    APPLICATION_EXCEEDED_REPLY_TIME = 8
+    OUT_OF_RESOURCES = 9
+    TSM_TIMEOUT = 10
+    APDU_TOO_LONG = 11
 
 
 # max 16 segments
@@ -28,10 +115,23 @@ MAX_RESPONSE_SEGMENTS = 4
 
 # max 1024 octets
 MAX_APDU_SIZE = 4
+MAX_APDU_LENGTH = 1024
 
-# use static invoke ID
+# the smallest APDU every device must accept
+MIN_APDU_LENGTH = 50
+
+# the largest window size allowed by the standard
+MAX_WINDOW_SIZE = 127
+
+# default invoke ID, used when the request is built outside of BACnetClient
 INVOKE_ID = 1
 
+# invoke IDs are a single octet, allocated in a rolling fashion
+MAX_INVOKE_ID = 255
+
+# default number of requests a single client can have in flight at the same time
+DEFAULT_MAX_IN_FLIGHT = 4
+
 TAG_OBJECT_TYPE_SHIFT = 22
 TAG_INSTANCE_ID_MASK = 0x3FFFFF
 
@@ -42,21 +142,44 @@ TAG_NO_PROPERTY_ACCESS_ERROR = 5
 
 PROPERTY_ACCESS_ERROR_SIZE = 4
 
+# sizes (in octets) used to estimate encoded requests and responses
+OBJECT_IDENTIFIER_SIZE = 5
+CONFIRMED_REQUEST_HEADER_SIZE = 4
+COMPLEX_ACK_HEADER_SIZE = 3
+ESTIMATED_STRING_SIZE = 64
+
 
 class ServiceChoice(IntEnum):
+    CONFIRMED_COV_NOTIFICATION = 1
+    SUBSCRIBE_COV = 5
     READ_PROPERTY_MULTIPLE = 14
     WRITE_PROPERTY = 15
+    WRITE_PROPERTY_MULTIPLE = 16
 
 
 class UnconfirmedServiceChoice(IntEnum):
+    I_AM = 0
+    UNCONFIRMED_COV_NOTIFICATION = 2
     UNCONFIRMED_PRIVATE_TRANSFER = 4
+    WHO_IS = 8
+
+
+class Segmentation(IntEnum):
+    SEGMENTED_BOTH = 0
+    SEGMENTED_TRANSMIT = 1
+    SEGMENTED_RECEIVE = 2
+    NO_SEGMENTATION = 3
 
 
 BVLC_TYPE = 0x81
 BVLC_FUNCTION_UNICAST = 0x0A
 BVLC_FUNCTION_BROADCAST = 0x0B
+BVLC_FUNCTION_FORWARDED_NPDU = 0x04
 BVLC_LENGTH = 4
 
+# original source address (B/IP address and port) in the forwarded NPDU
+BVLC_ORIGINAL_SOURCE_LENGTH = 6
+
 NPDU_VERSION = 1
 NPDU_EXPECT_REPLY = 4
 NPDU = pack("!BB", NPDU_VERSION, NPDU_EXPECT_REPLY)
@@ -72,6 +195,8 @@ class ObjectType(IntEnum):
     ANALOG_INPUT = 0
     ANALOG_OUTPUT = 1
     ANALOG_VALUE = 2
+    BINARY_INPUT = 3
+    BINARY_OUTPUT = 4
     BINARY_VALUE = 5
     DEVICE = 8
     MULTI_STATE_VALUE = 19
@@ -87,29 +212,91 @@ ObjectProperties = List[Tuple[ReadValue, Any]]
 DeviceState = Dict[ObjectIdentifier, ObjectProperties]
 
 
+# tag numbers, which fit into the initial octet of the tag
+MAX_TAG_NUMBER = 14
+MAX_LENGTH_TYPE = 7
+
+
 class Tag:
-    def __init__(self, number: int, is_context: bool, length_type: int):
-        self.number = number
-        self.is_context = is_context
-        self.length_type = length_type
+    """Immutable single-octet tag.
 
-    @property
-    def int(self) -> int:
-        ctx = 8 if self.is_context else 0
-        return self.number << 4 | ctx | self.length_type
+    All tags are precomputed, so Tag(...) returns a shared instance instead of allocating a new one.
+    """
+
+    __slots__ = ("number", "is_context", "length_type", "int", "_packed")
+
+    number: int
+    is_context: bool
+    length_type: int
+    int: int
+    _packed: bytes
+
+    def __new__(cls, number: int, is_context: bool, length_type: int) -> "Tag":
+        if not (0 <= number <= MAX_TAG_NUMBER and 0 <= length_type <= MAX_LENGTH_TYPE):
+            raise ValueError(f"unsupported tag: {number}, {length_type}")
+
+        return _TAGS[number << 4 | (8 if is_context else 0) | length_type]
+
+    @classmethod
+    def _create(cls, number: int, is_context: bool, length_type: int) -> "Tag":
+        tag = object.__new__(cls)
+
+        value = number << 4 | (8 if is_context else 0) | length_type
+        for name, v in (
+            ("number", number),
+            ("is_context", is_context),
+            ("length_type", length_type),
+            ("int", value),
+            ("_packed", bytes((value,))),
+        ):
+            object.__setattr__(tag, name, v)
+
+        return tag
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Tag):
+            return self.int == other.int
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self.int
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.number}, {self.length_type})"
+
+    def __reduce__(self):
+        return Tag, (self.number, self.is_context, self.length_type)
 
     def pack(self) -> bytes:
-        return pack("!B", self.int)
+        return self._packed
 
 
 class CtxTag(Tag):
-    def __init__(self, number: int, length_type: int):
-        super().__init__(number=number, is_context=True, length_type=length_type)
+    __slots__ = ()
+
+    def __new__(cls, number: int, length_type: int) -> "CtxTag":
+        return Tag.__new__(cls, number, True, length_type)
 
 
 class AppTag(Tag):
-    def __init__(self, number: int, length_type: int):
-        super().__init__(number=number, is_context=False, length_type=length_type)
+    __slots__ = ()
+
+    def __new__(cls, number: int, length_type: int) -> "AppTag":
+        return Tag.__new__(cls, number, False, length_type)
+
+
+# all tags, indexed by their encoded octet
+_TAGS = tuple(
+    (CtxTag if value & 8 else AppTag)._create(value >> 4, bool(value & 8), value & 7)
+    for value in range((MAX_TAG_NUMBER + 1) << 4)
+)
 
 
 class WriteType(IntEnum):
@@ -122,24 +309,146 @@ class DecodingError(Exception):
     pass
 
 
+class BACnetError(DecodingError):
+    """Device responded to the request with Error, Reject or Abort PDU.
+
+    Derives from DecodingError, which was raised for such responses before.
+    """
+
+
+def _enum_or_int(enum: Any, value: int) -> Any:
+    try:
+        return enum(value)
+    except ValueError:
+        return value
+
+
+class ErrorResponse(BACnetError):
+    def __init__(self, service_choice: int, error_class: int, error_code: int):
+        self.service_choice = service_choice
+        self.error_class = _enum_or_int(ErrorClass, error_class)
+        self.error_code = _enum_or_int(ErrorCode, error_code)
+
+        super().__init__(
+            f"error response to service {service_choice}: {self.error_class!r}, {self.error_code!r}"
+        )
+
+
+class RejectResponse(BACnetError):
+    def __init__(self, reason: int):
+        self.reason = _enum_or_int(RejectReason, reason)
+
+        super().__init__(f"request rejected: {self.reason!r}")
+
+
+class AbortResponse(BACnetError):
+    def __init__(self, reason: int, server: bool = True):
+        self.reason = _enum_or_int(AbortReason, reason)
+        self.server = server
+
+        super().__init__(f"request aborted: {self.reason!r}")
+
+
+# shared instances of the equal device properties, object identifiers and lists of read values
+_INTERNED: Dict[Any, Any] = {}
+
+
+def _intern(value: Any) -> Any:
+    return _INTERNED.setdefault(value, value)
+
+
 class DeviceProperty:
-    def __init__(
-        self,
+    """BACnet object property of the device.
+
+    Properties are interned: creating a property equal to an existing one returns the existing
+    instance, so they can be compared by identity and used as dict keys, and must not be modified.
+    """
+
+    __slots__ = (
+        "object_type",
+        "instance_id",
+        "read_values",
+        "priority",
+        "write_type",
+        "_object_identifier",
+        "_read_access_spec",
+    )
+
+    object_type: ObjectType
+    instance_id: int
+    read_values: Tuple[ReadValue, ...]
+    priority: Optional[int]
+    write_type: Optional[WriteType]
+
+    def __new__(
+        cls,
         object_type: ObjectType,
         instance_id: int,
-        read_values: Optional[List[ReadValue]] = None,
+        read_values: Optional[Sequence[ReadValue]] = None,
         priority: Optional[int] = None,
         write_type: Optional[WriteType] = None,
-    ):
-        self.object_type = object_type
-        self.instance_id = instance_id
-        self.read_values = read_values or [ReadValue.PRESENT_VALUE]
-        self.priority = priority
-        self.write_type = write_type
+    ) -> "DeviceProperty":
+        read_values = tuple(read_values or (ReadValue.PRESENT_VALUE,))
+
+        key = (cls, object_type, instance_id, read_values, priority, write_type)
+        device_property = _INTERNED.get(key)
+        if device_property is not None:
+            return device_property
+
+        device_property = object.__new__(cls)
+        device_property.object_type = object_type
+        device_property.instance_id = instance_id
+        device_property.read_values = _intern(read_values)
+        device_property.priority = priority
+        device_property.write_type = write_type
+
+        device_property._object_identifier = _intern((object_type, instance_id))
+        device_property._read_access_spec = None
+
+        return _INTERNED.setdefault(key, device_property)
+
+    def __reduce__(self):
+        return type(self), (
+            self.object_type,
+            self.instance_id,
+            self.read_values,
+            self.priority,
+            self.write_type,
+        )
+
+    def __repr__(self) -> str:
+        return f"DeviceProperty({self.object_type!r}, {self.instance_id})"
 
     @property
     def object_identifier(self) -> ObjectIdentifier:
-        return (self.object_type, self.instance_id)
+        return self._object_identifier
+
+    # read_access_spec_size returns encoded size of the read access spec
+    def read_access_spec_size(self) -> int:
+        return OBJECT_IDENTIFIER_SIZE + 2 + 2 * len(self.read_values)
+
+    # read_access_result_size returns estimated size of the read access result in the response
+    def read_access_result_size(self) -> int:
+        size = OBJECT_IDENTIFIER_SIZE + 2
+
+        for read_value in self.read_values:
+            if read_value in (ReadValue.OBJECT_NAME, ReadValue.DESCRIPTION):
+                value_size = ESTIMATED_STRING_SIZE
+            elif self.object_type in (
+                ObjectType.ANALOG_INPUT,
+                ObjectType.ANALOG_OUTPUT,
+                ObjectType.ANALOG_VALUE,
+            ):
+                value_size = 5
+            elif self.object_type == ObjectType.POSITIVE_INTEGER_VALUE:
+                value_size = 3
+            else:
+                value_size = 2
+
+            # property identifier, opening and closing tags, and the value or the error
+            size += 2 + 2 + max(value_size, PROPERTY_ACCESS_ERROR_SIZE)
+
+        return size
 
     def apdu_object_identifier(self) -> bytes:
         apdu = CtxTag(0, 4).pack()
@@ -148,6 +457,9 @@ class DeviceProperty:
 
     # read_access_spec returns APDU's read access spec for read-property-multiple service
     def read_access_spec(self) -> bytes:
+        if self._read_access_spec is not None:
+            return self._read_access_spec
+
         # object-identifier definition
         apdu = self.apdu_object_identifier()
 
@@ -159,24 +471,32 @@ class DeviceProperty:
 
         apdu += CtxTag(1, TAG_CLOSE).pack()
 
+        self._read_access_spec = apdu
+
         return apdu
 
         # read_access_spec returns APDU's read access spec for read-property-multiple service
 
+    # encode_value returns application tagged present value to be written
+    def encode_value(self, value: Any) -> bytes:
+        if self.object_type == ObjectType.ANALOG_VALUE:
+            return pack("!Bf", AppTag(WriteType.Real, 4).int, value)
+
+        if self.object_type == ObjectType.BINARY_VALUE:
+            return pack("!BB", AppTag(WriteType.Enumerated, 1).int, value)
+
+        # unsigned integers are encoded with the minimal number of octets
+        length = max(1, (int(value).bit_length() + 7) // 8)
+
+        return AppTag(WriteType.UnsignedInt, length).pack() + int(value).to_bytes(length, "big")
+
     def write_access_spec(self, value: Any) -> bytes:
         # object-identifier definition
         apdu = self.apdu_object_identifier()
         apdu += pack("!BB", CtxTag(1, 1).int, ReadValue.PRESENT_VALUE)
 
         apdu += CtxTag(3, TAG_OPEN).pack()
-
-        if self.object_type == ObjectType.ANALOG_VALUE:
-            apdu += pack("!Bf", AppTag(WriteType.Real, 4).int, value)
-        elif self.object_type == ObjectType.BINARY_VALUE:
-            apdu += pack("!BB", AppTag(WriteType.Enumerated, 1).int, value)
-        else:
-            apdu += pack("!BB", AppTag(WriteType.UnsignedInt, 1).int, value)
-
+        apdu += self.encode_value(value)
         apdu += CtxTag(3, TAG_CLOSE).pack()
 
         if self.priority is not None:
@@ -184,14 +504,37 @@ class DeviceProperty:
 
         return apdu
 
+    # write_access_specification returns APDU's write access specification
+    # for write-property-multiple service
+    def write_access_specification(self, value: Any) -> bytes:
+        # object-identifier definition
+        apdu = self.apdu_object_identifier()
+
+        # list of property values
+        apdu += CtxTag(1, TAG_OPEN).pack()
+        apdu += pack("!BB", CtxTag(0, 1).int, ReadValue.PRESENT_VALUE)
+
+        apdu += CtxTag(2, TAG_OPEN).pack()
+        apdu += self.encode_value(value)
+        apdu += CtxTag(2, TAG_CLOSE).pack()
+
+        if self.priority is not None:
+            apdu += pack("!BB", CtxTag(3, 1).int, self.priority)
+
+        apdu += CtxTag(1, TAG_CLOSE).pack()
+
+        return apdu
+
 
 # _read_property_multiple returns request payload for read-property-multiple service
-def _read_property_multiple(device_properties: List[DeviceProperty]) -> bytes:
+def _read_property_multiple(
+    device_properties: Sequence[DeviceProperty], invoke_id: int = INVOKE_ID
+) -> bytes:
     apdu = pack(
         "!BBBB",
         APDUType.CONFIRMED_REQ << 4 | PDUFlags.SEGMENTED_RESPONSE_ACCEPTED,
         MAX_RESPONSE_SEGMENTS << 4 | MAX_APDU_SIZE,
-        INVOKE_ID,
+        invoke_id,
         ServiceChoice.READ_PROPERTY_MULTIPLE,
     )
 
@@ -204,29 +547,99 @@ def _read_property_multiple(device_properties: List[DeviceProperty]) -> bytes:
     return bvlc + NPDU + apdu
 
 
+# _plan_read_property_multiple splits device properties into the smallest number of chunks,
+# so both request and (estimated) response for each chunk fit into a single APDU
+def _plan_read_property_multiple(
+    device_properties: List[DeviceProperty], max_apdu_length: int = MAX_APDU_LENGTH
+) -> List[List[DeviceProperty]]:
+    request_budget = max_apdu_length - CONFIRMED_REQUEST_HEADER_SIZE
+    response_budget = max_apdu_length - COMPLEX_ACK_HEADER_SIZE
+
+    chunks: List[List[DeviceProperty]] = []
+    request_sizes: List[int] = []
+    response_sizes: List[int] = []
+
+    # first-fit decreasing, largest responses are placed first
+    for dp in sorted(device_properties, key=lambda dp: -dp.read_access_result_size()):
+        request_size = dp.read_access_spec_size()
+        response_size = dp.read_access_result_size()
+
+        for i, chunk in enumerate(chunks):
+            if (
+                request_sizes[i] + request_size <= request_budget
+                and response_sizes[i] + response_size <= response_budget
+            ):
+                chunk.append(dp)
+                request_sizes[i] += request_size
+                response_sizes[i] += response_size
+                break
+        else:
+            chunks.append([dp])
+            request_sizes.append(request_size)
+            response_sizes.append(response_size)
+
+    return chunks
+
+
+# position of the invoke ID in the confirmed request frame
+INVOKE_ID_INDEX = BVLC_LENGTH + len(NPDU) + 2
+
+# number of distinct property lists for which compiled requests are kept by each client,
+# e.g. the lists of due properties with a poll scheduler
+COMPILED_REQUESTS_CACHE_SIZE = 16
+
+# CompiledRequest is a chunk of device properties and its encoded request frame
+CompiledRequest = Tuple[Tuple[DeviceProperty, ...], bytes]
+
+
+# _compile_read_property_multiple plans and encodes read-property-multiple requests
+# for the given property list, clients keep them so repeated polls only need to patch
+# in the invoke ID
+def _compile_read_property_multiple(
+    device_properties: Tuple[DeviceProperty, ...], max_apdu_length: int = MAX_APDU_LENGTH
+) -> Tuple[CompiledRequest, ...]:
+    return tuple(
+        (tuple(chunk), _read_property_multiple(chunk))
+        for chunk in _plan_read_property_multiple(list(device_properties), max_apdu_length)
+    )
+
+
+# _with_invoke_id returns a copy of the compiled request frame with the invoke ID set
+def _with_invoke_id(request: bytes, invoke_id: int) -> bytes:
+    frame = bytearray(request)
+    frame[INVOKE_ID_INDEX] = invoke_id
+    return bytes(frame)
+
+
+# PropertyErrors maps the properties, which were read as property access errors, to the error code
+PropertyErrors = Dict[Tuple[ObjectIdentifier, ReadValue], int]
+
+
 # _parse_read_property_multiple_response and return DeviceState
-def _parse_read_property_multiple_response(response: bytes) -> DeviceState:
+def _parse_read_property_multiple_response(
+    response: bytes, invoke_id: int = INVOKE_ID, errors: Optional[PropertyErrors] = None
+) -> DeviceState:
     bvlc_type, bvlc_function, _ = unpack("!BBH", response[0:4])
     if bvlc_type != BVLC_TYPE or bvlc_function != BVLC_FUNCTION_UNICAST:
         raise DecodingError("unexpected response")
 
     apdu_start_index = BVLC_LENGTH + len(NPDU)
-    apdu = response[apdu_start_index:]
 
-    apdu_type = apdu[0] >> 4
+    apdu_type = response[apdu_start_index] >> 4
 
     if apdu_type != APDUType.COMPLEX_ACK:
+        _raise_for_error_pdu(response, apdu_start_index, invoke_id)
         raise DecodingError(f"unsupported response type: {apdu_type}")
 
-    invoke_id = apdu[1]
-    if invoke_id != INVOKE_ID:
-        raise DecodingError(f"unexpected invoke ID: {invoke_id}")
+    if response[apdu_start_index + 1] != invoke_id:
+        raise DecodingError(f"unexpected invoke ID: {response[apdu_start_index + 1]}")
 
-    service_choice = apdu[2]
+    service_choice = response[apdu_start_index + 2]
     if service_choice != ServiceChoice.READ_PROPERTY_MULTIPLE:
         raise DecodingError(f"unexpected service choice: {service_choice}")
 
-    decoder = BACnetDecoder(apdu, 3)
+    # decode the APDU in place, without copying it out of the response
+    decoder = BACnetDecoder(response, apdu_start_index + 3)
 
     device_state = {}
 
@@ -235,36 +648,73 @@ def _parse_read_property_multiple_response(response: bytes) -> DeviceState:
         object_id = (object_type, instance_number)
         device_state[object_id] = decoder.parse_list_of_results()
 
+        if decoder.property_errors:
+            if errors is not None:
+                errors.update(
+                    ((object_id, read_value), error_code)
+                    for read_value, error_code in decoder.property_errors
+                )
+
+            decoder.property_errors.clear()
+
     return device_state
 
 
+# application tags of the values decoded by BACnetDecoder
+APP_TAG_BOOLEAN = 1
+APP_TAG_UNSIGNED_INT = 2
+APP_TAG_REAL = 4
+APP_TAG_CHARACTER_STRING = 7
+APP_TAG_ENUMERATED = 9
+APP_TAG_OBJECT_IDENTIFIER = 12
+
+# encoded tag octets checked by the fast path of BACnetDecoder.parse_list_of_results
+_PROPERTY_IDENTIFIER_TAG = 2 << 4 | 8 | 1
+_PROPERTY_VALUE_OPEN_TAG = TAG_NO_PROPERTY_VALUE << 4 | 8 | TAG_OPEN
+_PROPERTY_VALUE_CLOSE_TAG = TAG_NO_PROPERTY_VALUE << 4 | 8 | TAG_CLOSE
+_PROPERTY_ACCESS_ERROR_OPEN_TAG = TAG_NO_PROPERTY_ACCESS_ERROR << 4 | 8 | TAG_OPEN
+_PROPERTY_ACCESS_ERROR_CLOSE_TAG = TAG_NO_PROPERTY_ACCESS_ERROR << 4 | 8 | TAG_CLOSE
+_REAL_TAG = APP_TAG_REAL << 4 | 4
+_ENUMERATED_TAG = APP_TAG_ENUMERATED << 4 | 1
+_UNSIGNED_INT_TAG = APP_TAG_UNSIGNED_INT << 4 | 1
+_OBJECT_IDENTIFIER_TAG = 8 | 4
+_LIST_OF_RESULTS_OPEN_TAG = 1 << 4 | 8 | TAG_OPEN
+_LIST_OF_RESULTS_CLOSE_TAG = 1 << 4 | 8 | TAG_CLOSE
+
+_READ_VALUES = {read_value.value: read_value for read_value in ReadValue}
+_OBJECT_TYPES = {object_type.value: object_type for object_type in ObjectType}
+
+
 class BACnetDecoder:
     def __init__(self, data: bytes, offset: int = 0):
-        self.data = data
+        self.data = memoryview(data)
         self.i = offset
 
+        # read values of the results, which were property access errors (decoded as 0),
+        # with the error codes
+        self.property_errors: List[Tuple[ReadValue, int]] = []
+
+        # error code, if the last value decoded by read_value() was a property access error
+        self.value_error: Optional[int] = None
+
     def eof(self) -> bool:
         return self.i >= len(self.data)
 
-    def read_bytes(self, n: int) -> bytes:
-        if self.i + n > len(self.data):
+    def _advance(self, n: int) -> int:
+        i = self.i
+        if i + n > len(self.data):
             raise DecodingError("unexpected EOF")
 
-        data = self.data[self.i : self.i + n]
+        self.i = i + n
 
-        self.i += n
+        return i
 
-        return data
+    def read_bytes(self, n: int) -> bytes:
+        i = self._advance(n)
+        return self.data[i : i + n].tobytes()
 
     def read_byte(self) -> int:
-        if self.i + 1 > len(self.data):
-            raise DecodingError("unexpected EOF")
-
-        byte = self.data[self.i]
-
-        self.i += 1
-
-        return byte
+        return self.data[self._advance(1)]
 
     # read_tag returns tag number, class and type/length.
     # class=0 -> context specific tag
@@ -297,27 +747,86 @@ class BACnetDecoder:
 
         return tag_number, tag_type_length
 
-    def parse_object_identifier(self) -> Tuple[ObjectType, int]:
-        tag_number, tag_length = self.read_context_tag()
+    def parse_object_identifier(self, expected_tag_number: int = 0) -> Tuple[ObjectType, int]:
+        i = self.i
 
-        if tag_number != 0:
-            raise DecodingError("unexpected tag")
+        if (
+            expected_tag_number == 0
+            and i + 5 <= len(self.data)
+            and self.data[i] == _OBJECT_IDENTIFIER_TAG
+        ):
+            self.i = i + 1
+        else:
+            tag_number, tag_length = self.read_context_tag()
+
+            if tag_number != expected_tag_number:
+                raise DecodingError("unexpected tag")
+
+            if tag_length != 4:
+                raise DecodingError(f"unsupported object identifier size: {tag_length}")
 
-        data = unpack("!I", self.read_bytes(tag_length))[0]
+        data = unpack_from("!I", self.data, self._advance(4))[0]
 
-        object_type = ObjectType(data >> TAG_OBJECT_TYPE_SHIFT)
-        instance_number = data & 0x3FFFFF
+        object_type = _OBJECT_TYPES.get(data >> TAG_OBJECT_TYPE_SHIFT)
+        if object_type is None:
+            # raises ValueError, as for any other unsupported object type
+            object_type = ObjectType(data >> TAG_OBJECT_TYPE_SHIFT)
+
+        instance_number = data & TAG_INSTANCE_ID_MASK
 
         return object_type, instance_number
 
     def parse_list_of_results(self) -> ObjectProperties:
-        opening_tag_number, tag_type = self.read_context_tag()
-        if tag_type != TAG_OPEN:
-            raise DecodingError("expected opening tag")
+        data = self.data
+        size = len(data)
+
+        if self.i < size and data[self.i] == _LIST_OF_RESULTS_OPEN_TAG:
+            self.i += 1
+            opening_tag_number = 1
+            closing_tag = _LIST_OF_RESULTS_CLOSE_TAG
+        else:
+            opening_tag_number, tag_type = self.read_context_tag()
+            if tag_type != TAG_OPEN:
+                raise DecodingError("expected opening tag")
+
+            closing_tag = opening_tag_number << 4 | 8 | TAG_CLOSE
 
         results = []
 
         while True:
+            i = self.i
+
+            # fast path for single-octet property identifiers followed by
+            # REAL, ENUMERATED or UNSIGNED present value, or by a property access error
+            if i + 6 <= size and data[i] == _PROPERTY_IDENTIFIER_TAG:
+                read_value = _READ_VALUES.get(data[i + 1])
+                result_tag = data[i + 2]
+
+                if read_value is not None and result_tag == _PROPERTY_VALUE_OPEN_TAG:
+                    value_tag = data[i + 3]
+
+                    if value_tag == _REAL_TAG:
+                        if i + 9 <= size and data[i + 8] == _PROPERTY_VALUE_CLOSE_TAG:
+                            results.append((read_value, unpack_from("!f", data, i + 4)[0]))
+                            self.i = i + 9
+                            continue
+                    elif value_tag == _ENUMERATED_TAG or value_tag == _UNSIGNED_INT_TAG:
+                        if data[i + 5] == _PROPERTY_VALUE_CLOSE_TAG:
+                            results.append((read_value, data[i + 4]))
+                            self.i = i + 6
+                            continue
+                elif read_value is not None and result_tag == _PROPERTY_ACCESS_ERROR_OPEN_TAG:
+                    end = i + 3 + PROPERTY_ACCESS_ERROR_SIZE
+                    if end < size and data[end] == _PROPERTY_ACCESS_ERROR_CLOSE_TAG:
+                        results.append((read_value, 0))
+                        self.property_errors.append((read_value, data[end - 1]))
+                        self.i = end + 1
+                        continue
+
+            if i < size and data[i] == closing_tag:
+                self.i = i + 1
+                break
+
             tag_number, tag_type = self.read_context_tag()
             if tag_number == opening_tag_number and tag_type == TAG_CLOSE:
                 break
@@ -325,11 +834,11 @@ class BACnetDecoder:
             if tag_number != 2:
                 raise DecodingError("unexpected tag")
 
-            data = self.read_byte()
-
-            read_value = ReadValue(data)
+            read_value = ReadValue(self.read_byte())
 
             value = self.read_value()
+            if self.value_error is not None:
+                self.property_errors.append((read_value, self.value_error))
 
             results.append((read_value, value))
 
@@ -342,18 +851,19 @@ class BACnetDecoder:
             raise DecodingError("expected opening tag")
 
         value: Any = 0
+        self.value_error = None
 
         if opening_tag_number == TAG_NO_PROPERTY_VALUE:
             tag_number, tag_length = self.read_application_tag()
 
-            value = {
-                2: self.parse_unsinged_int,
-                4: self.parse_float,
-                7: self.parse_string,
-                9: self.parse_enumarated_value,
-            }[tag_number](tag_length)
+            parser = self._VALUE_PARSERS.get(tag_number)
+            if parser is None:
+                raise KeyError(tag_number)
+
+            value = parser(self, tag_length)
         elif opening_tag_number == TAG_NO_PROPERTY_ACCESS_ERROR:
-            self.read_bytes(PROPERTY_ACCESS_ERROR_SIZE)
+            # error class and error code, each an enumerated value of a single octet
+            self.value_error = self.data[self._advance(PROPERTY_ACCESS_ERROR_SIZE) + 3]
 
         # check the closing tag
         tag_number, tag_type = self.read_context_tag()
@@ -362,22 +872,91 @@ class BACnetDecoder:
 
         return value
 
+    # parse_context_unsigned_int returns unsigned integer tagged with the expected context tag
+    def parse_context_unsigned_int(self, expected_tag_number: int) -> int:
+        tag_number, tag_length = self.read_context_tag()
+        if tag_number != expected_tag_number:
+            raise DecodingError("unexpected tag")
+
+        return self.parse_unsinged_int(tag_length)
+
+    # next_context_tag_is returns True if the next octet is the given context tag,
+    # without consuming it
+    def next_context_tag_is(self, tag_number: int, tag_type: Optional[int] = None) -> bool:
+        if self.eof():
+            return False
+
+        byte = self.data[self.i]
+
+        return (
+            byte >> 4 == tag_number
+            and byte & 8 != 0
+            and (tag_type is None or byte & 7 == tag_type)
+        )
+
+    # parse_list_of_values returns property values of a COV notification,
+    # values of unsupported properties are skipped
+    def parse_list_of_values(self, opening_tag_number: int) -> ObjectProperties:
+        tag_number, tag_type = self.read_context_tag()
+        if tag_number != opening_tag_number or tag_type != TAG_OPEN:
+            raise DecodingError("expected opening tag")
+
+        results = []
+
+        while not self.next_context_tag_is(opening_tag_number, TAG_CLOSE):
+            property_identifier = self.parse_context_unsigned_int(0)
+
+            # optional property array index
+            if self.next_context_tag_is(1) and not self.next_context_tag_is(1, TAG_OPEN):
+                self.parse_context_unsigned_int(1)
+
+            tag_number, tag_type = self.read_context_tag()
+            if tag_number != 2 or tag_type != TAG_OPEN:
+                raise DecodingError("expected opening tag")
+
+            value = None
+            while not self.next_context_tag_is(2, TAG_CLOSE):
+                tag_number, tag_length = self.read_application_tag()
+
+                parser = self._VALUE_PARSERS.get(tag_number)
+                if parser is None:
+                    # skip values which are not supported, e.g. status flags
+                    self._advance(tag_length if tag_number != APP_TAG_BOOLEAN else 0)
+                elif value is None:
+                    value = parser(self, tag_length)
+                else:
+                    parser(self, tag_length)
+
+            self.read_context_tag()
+
+            # optional priority
+            if self.next_context_tag_is(3):
+                self.parse_context_unsigned_int(3)
+
+            read_value = _READ_VALUES.get(property_identifier)
+            if read_value is not None and value is not None:
+                results.append((read_value, value))
+
+        self.read_context_tag()
+
+        return results
+
     def parse_enumarated_value(self, length: int) -> int:
-        return self.read_byte()
+        return self.parse_unsinged_int(length)
 
     def parse_unsinged_int(self, length: int) -> int:
-        value = 0
-        for i in range(length):
-            value <<= 8
-            value |= self.read_byte()
+        i = self._advance(length)
 
-        return value
+        if length == 1:
+            return self.data[i]
+
+        return int.from_bytes(self.data[i : i + length], "big")
 
     def parse_float(self, length: int) -> float:
         if length != 4:
             raise DecodingError(f"unsupported float size: {length}")
 
-        return unpack("!f", self.read_bytes(length))[0]
+        return unpack_from("!f", self.data, self._advance(length))[0]
 
     def parse_string(self, length: int) -> str:
         encoding = self.read_byte()
@@ -385,15 +964,27 @@ class BACnetDecoder:
         if encoding != 0:
             raise DecodingError(f"unsupported encoding: {encoding}")
 
-        return self.read_bytes(length - 1).decode("utf-8")
+        i = self._advance(length - 1)
+
+        return str(self.data[i : i + length - 1], "utf-8")
 
+    # parsers of application tagged values, indexed by the application tag number
+    _VALUE_PARSERS = {
+        APP_TAG_UNSIGNED_INT: parse_unsinged_int,
+        APP_TAG_REAL: parse_float,
+        APP_TAG_CHARACTER_STRING: parse_string,
+        APP_TAG_ENUMERATED: parse_enumarated_value,
+    }
 
-def _write_property(device_property: DeviceProperty, value: Any) -> bytes:
+
+def _write_property(
+    device_property: DeviceProperty, value: Any, invoke_id: int = INVOKE_ID
+) -> bytes:
     apdu = pack(
         "!BBBB",
         APDUType.CONFIRMED_REQ << 4 | PDUFlags.SEGMENTED_RESPONSE_ACCEPTED,
         MAX_RESPONSE_SEGMENTS << 4 | MAX_APDU_SIZE,
-        INVOKE_ID,
+        invoke_id,
         ServiceChoice.WRITE_PROPERTY,
     )
 
@@ -404,8 +995,90 @@ def _write_property(device_property: DeviceProperty, value: Any) -> bytes:
     return bvlc + NPDU + apdu
 
 
+def _write_property_multiple(
+    values: Sequence[Tuple[DeviceProperty, Any]], invoke_id: int = INVOKE_ID
+) -> bytes:
+    apdu = pack(
+        "!BBBB",
+        APDUType.CONFIRMED_REQ << 4 | PDUFlags.SEGMENTED_RESPONSE_ACCEPTED,
+        MAX_RESPONSE_SEGMENTS << 4 | MAX_APDU_SIZE,
+        invoke_id,
+        ServiceChoice.WRITE_PROPERTY_MULTIPLE,
+    )
+
+    # for each device property, build write access specification and append to the APDU
+    for device_property, value in values:
+        apdu += device_property.write_access_specification(value)
+
+    bvlc = pack("!BBH", BVLC_TYPE, BVLC_FUNCTION_UNICAST, BVLC_LENGTH + len(NPDU) + len(apdu))
+
+    return bvlc + NPDU + apdu
+
+
+# reasons to abort the request, after which it is retried in smaller requests
+TOO_LARGE_ABORT_REASONS = (
+    AbortReason.SEGMENTATION_NOT_SUPPORTED,
+    AbortReason.BUFFER_OVERFLOW,
+    AbortReason.APDU_TOO_LONG,
+)
+
+
+# _is_too_large returns True, if the device could not handle the request or response size
+def _is_too_large(exc: BACnetError) -> bool:
+    if isinstance(exc, AbortResponse):
+        return exc.reason in TOO_LARGE_ABORT_REASONS
+
+    return isinstance(exc, RejectResponse) and exc.reason == RejectReason.BUFFER_OVERFLOW
+
+
+# _raise_for_error_pdu raises BACnetError, if the response is Error, Reject or Abort PDU
+def _raise_for_error_pdu(response: bytes, apdu_start_index: int, invoke_id: int):
+    apdu_type = response[apdu_start_index] >> 4
+    if apdu_type not in (APDUType.ERROR, APDUType.REJECT, APDUType.ABORT):
+        return
+
+    if len(response) < apdu_start_index + 3:
+        raise DecodingError("unexpected EOF")
+
+    if response[apdu_start_index + 1] != invoke_id:
+        raise DecodingError(f"unexpected invoke ID: {response[apdu_start_index + 1]}")
+
+    if apdu_type == APDUType.REJECT:
+        raise RejectResponse(response[apdu_start_index + 2])
+
+    if apdu_type == APDUType.ABORT:
+        raise AbortResponse(response[apdu_start_index + 2], bool(response[apdu_start_index] & 1))
+
+    service_choice = response[apdu_start_index + 2]
+
+    decoder = BACnetDecoder(response, apdu_start_index + 3)
+
+    # some services (e.g. write-property-multiple) enclose the error in context tag 0
+    if decoder.next_context_tag_is(0, TAG_OPEN):
+        decoder.read_context_tag()
+
+    values = []
+    for _ in range(2):
+        tag_number, tag_length = decoder.read_application_tag()
+        if tag_number != APP_TAG_ENUMERATED:
+            raise DecodingError("expected enumerated error class and code")
+
+        values.append(decoder.parse_enumarated_value(tag_length))
+
+    raise ErrorResponse(service_choice, *values)
+
+
 # _parse_write_property_response and check for errors
-def _parse_write_property_response(response: bytes):
+def _parse_write_property_response(response: bytes, invoke_id: int = INVOKE_ID):
+    _parse_simple_ack(response, invoke_id, ServiceChoice.WRITE_PROPERTY)
+
+
+# _parse_write_property_multiple_response and check for errors
+def _parse_write_property_multiple_response(response: bytes, invoke_id: int = INVOKE_ID):
+    _parse_simple_ack(response, invoke_id, ServiceChoice.WRITE_PROPERTY_MULTIPLE)
+
+
+def _parse_simple_ack(response: bytes, invoke_id: int, expected_service_choice: int):
     bvlc_type, bvlc_function, _ = unpack("!BBH", response[0:4])
     if bvlc_type != BVLC_TYPE or bvlc_function != BVLC_FUNCTION_UNICAST:
         raise DecodingError("unexpected response")
@@ -415,107 +1088,791 @@ def _parse_write_property_response(response: bytes):
     apdu_type = apdu[0] >> 4
 
     if apdu_type != APDUType.SIMPLE_ACK:
+        _raise_for_error_pdu(response, BVLC_LENGTH + len(NPDU), invoke_id)
         raise DecodingError(f"unsupported response type: {apdu_type}")
 
-    invoke_id = apdu[1]
-    if invoke_id != INVOKE_ID:
-        raise DecodingError(f"unexpected invoke ID: {invoke_id}")
+    if apdu[1] != invoke_id:
+        raise DecodingError(f"unexpected invoke ID: {apdu[1]}")
 
     service_choice = apdu[2]
-    if service_choice != ServiceChoice.WRITE_PROPERTY:
+    if service_choice != expected_service_choice:
         raise DecodingError(f"unexpected service choice: {service_choice}")
 
 
+# subscriber process identifier used for COV subscriptions
+DEFAULT_SUBSCRIBER_PROCESS_ID = 1
+
+# COV subscription lifetime in seconds
+DEFAULT_COV_LIFETIME = 300
+
+
+def _encode_context_unsigned_int(tag_number: int, value: int) -> bytes:
+    length = max(1, (value.bit_length() + 7) // 8)
+    return CtxTag(tag_number, length).pack() + value.to_bytes(length, "big")
+
+
+def _subscribe_cov(
+    device_property: DeviceProperty,
+    subscriber_process_id: int = DEFAULT_SUBSCRIBER_PROCESS_ID,
+    confirmed: bool = False,
+    lifetime: Optional[int] = DEFAULT_COV_LIFETIME,
+    cancel: bool = False,
+    invoke_id: int = INVOKE_ID,
+) -> bytes:
+    apdu = pack(
+        "!BBBB",
+        APDUType.CONFIRMED_REQ << 4 | PDUFlags.SEGMENTED_RESPONSE_ACCEPTED,
+        MAX_RESPONSE_SEGMENTS << 4 | MAX_APDU_SIZE,
+        invoke_id,
+        ServiceChoice.SUBSCRIBE_COV,
+    )
+
+    apdu += _encode_context_unsigned_int(0, subscriber_process_id)
+
+    # monitored object identifier
+    apdu += CtxTag(1, 4).pack()
+    apdu += pack("!I", device_property.object_type << TAG_OBJECT_TYPE_SHIFT | device_property.instance_id)
+
+    # subscription is cancelled by omitting both notification type and lifetime
+    if not cancel:
+        apdu += pack("!BB", CtxTag(2, 1).int, 1 if confirmed else 0)
+
+        # no lifetime means indefinite subscription
+        if lifetime is not None:
+            apdu += _encode_context_unsigned_int(3, lifetime)
+
+    bvlc = pack("!BBH", BVLC_TYPE, BVLC_FUNCTION_UNICAST, BVLC_LENGTH + len(NPDU) + len(apdu))
+
+    return bvlc + NPDU + apdu
+
+
+# _parse_subscribe_cov_response and check for errors
+def _parse_subscribe_cov_response(response: bytes, invoke_id: int = INVOKE_ID):
+    _parse_simple_ack(response, invoke_id, ServiceChoice.SUBSCRIBE_COV)
+
+
+class COVNotification(NamedTuple):
+    subscriber_process_id: int
+    device_identifier: ObjectIdentifier
+    object_identifier: ObjectIdentifier
+    time_remaining: int
+    values: ObjectProperties
+
+    # invoke ID of a confirmed notification, which needs to be acknowledged
+    invoke_id: Optional[int] = None
+
+
+# _parse_cov_notification returns the COV notification, or None if the request is not one
+def _parse_cov_notification(request: bytes) -> Optional[COVNotification]:
+    apdu_start_index = BVLC_LENGTH + len(NPDU)
+    if len(request) < apdu_start_index + 2:
+        return None
+
+    pdu_type = request[apdu_start_index]
+
+    if pdu_type >> 4 == APDUType.UNCONFIRMED_REQ:
+        if request[apdu_start_index + 1] != UnconfirmedServiceChoice.UNCONFIRMED_COV_NOTIFICATION:
+            return None
+
+        invoke_id = None
+        decoder = BACnetDecoder(request, apdu_start_index + 2)
+    elif pdu_type >> 4 == APDUType.CONFIRMED_REQ and pdu_type & PDUFlags.SEGMENTED_REQUEST == 0:
+        if len(request) < apdu_start_index + 4:
+            return None
+
+        if request[apdu_start_index + 3] != ServiceChoice.CONFIRMED_COV_NOTIFICATION:
+            return None
+
+        invoke_id = request[apdu_start_index + 2]
+        decoder = BACnetDecoder(request, apdu_start_index + 4)
+    else:
+        return None
+
+    return COVNotification(
+        subscriber_process_id=decoder.parse_context_unsigned_int(0),
+        device_identifier=decoder.parse_object_identifier(1),
+        object_identifier=decoder.parse_object_identifier(2),
+        time_remaining=decoder.parse_context_unsigned_int(3),
+        values=decoder.parse_list_of_values(4),
+        invoke_id=invoke_id,
+    )
+
+
+def _cov_notification_ack(invoke_id: int) -> bytes:
+    apdu = pack(
+        "!BBB",
+        APDUType.SIMPLE_ACK << 4,
+        invoke_id,
+        ServiceChoice.CONFIRMED_COV_NOTIFICATION,
+    )
+
+    bvlc = pack("!BBH", BVLC_TYPE, BVLC_FUNCTION_UNICAST, BVLC_LENGTH + len(NPDU) + len(apdu))
+
+    return bvlc + NPDU + apdu
+
+
 DEFAULT_BACNET_PORT = 47808
 
 
-class BACnetRequest:
-    _transport: asyncio.DatagramTransport
+class SegmentedResponse:
+    """Reassembles a segmented ComplexACK, acknowledging the segments window by window."""
+
+    def __init__(self):
+        self.segments: List[bytes] = []
+        self.header = b""
+        self.last_sequence_number = 0
+        self.initial_sequence_number = 0
+        self.window_size = 1
+
+    @staticmethod
+    def is_segmented(response: bytes) -> bool:
+        apdu_start_index = BVLC_LENGTH + len(NPDU)
+        if len(response) <= apdu_start_index:
+            return False
+
+        pdu_type = response[apdu_start_index]
+
+        return (
+            pdu_type >> 4 == APDUType.COMPLEX_ACK
+            and pdu_type & PDUFlags.SEGMENTED_MESSAGE != 0
+        )
+
+    # segment_received stores the segment and returns a tuple of
+    # SegmentACK to send back (if any) and the reassembled response (once complete)
+    def segment_received(self, response: bytes) -> Tuple[Optional[bytes], Optional[bytes]]:
+        apdu_start_index = BVLC_LENGTH + len(NPDU)
+        if len(response) < apdu_start_index + 5:
+            raise DecodingError("segment too short")
+
+        pdu_type, invoke_id, sequence_number, window_size, service_choice = unpack(
+            "!BBBBB", response[apdu_start_index : apdu_start_index + 5]
+        )
+        more_follows = pdu_type & PDUFlags.MORE_SEGMENTS != 0
+
+        if not self.segments:
+            if sequence_number != 0:
+                # wait for the first segment to be retransmitted
+                return None, None
+
+            # the first segment is always acknowledged separately,
+            # which also establishes the actual window size
+            self.window_size = min(max(window_size, 1), MAX_WINDOW_SIZE)
+            self.header = response[:apdu_start_index] + pack(
+                "!BBB", APDUType.COMPLEX_ACK << 4, invoke_id, service_choice
+            )
+        elif sequence_number != (self.last_sequence_number + 1) % 256:
+            # segment is duplicated or out of order, request retransmission
+            # starting from the segment following the last one received
+            self.initial_sequence_number = self.last_sequence_number
+            return self._segment_ack(invoke_id, negative=True), None
+
+        self.segments.append(response[apdu_start_index + 5 :])
+        self.last_sequence_number = sequence_number
+
+        window_full = (
+            len(self.segments) == 1
+            or sequence_number == (self.initial_sequence_number + self.window_size) % 256
+        )
+
+        if not more_follows:
+            return self._segment_ack(invoke_id), self._reassembled()
+
+        if window_full:
+            self.initial_sequence_number = sequence_number
+            return self._segment_ack(invoke_id), None
+
+        return None, None
+
+    def _reassembled(self) -> bytes:
+        apdu = self.header[BVLC_LENGTH:] + b"".join(self.segments)
+
+        # BVLC length of the first segment is replaced with the length of the whole response
+        return self.header[:2] + pack("!H", BVLC_LENGTH + len(apdu)) + apdu
+
+    def _segment_ack(self, invoke_id: int, negative: bool = False) -> bytes:
+        apdu = pack(
+            "!BBBB",
+            APDUType.SEGMENT_ACK << 4 | (SegmentACKFlags.NEGATIVE_ACK if negative else 0),
+            invoke_id,
+            self.last_sequence_number,
+            self.window_size,
+        )
+
+        bvlc = pack("!BBH", BVLC_TYPE, BVLC_FUNCTION_UNICAST, BVLC_LENGTH + len(NPDU) + len(apdu))
+
+        return bvlc + NPDU + apdu
+
+
+# Address is a resolved (IP address, port) pair of a remote device
+Address = Tuple[str, int]
+
+
+class BACnetTransport(asyncio.DatagramProtocol):
+    """Long-lived datagram endpoint, which can be shared by many clients.
+
+    A single UDP socket is bound to the local address and port, and responses
+    are routed back to the waiting request by their source address and invoke ID.
+    Invoke IDs are allocated per remote address by the transport, so several clients
+    of the same device may share it.
+    """
+
+    def __init__(self, local_address: str = "0.0.0.0", local_port: int = 0):
+        self.local_address = local_address
+        self.local_port = local_port
+
+        self._transport: Optional[asyncio.DatagramTransport] = None
+        self._pending: Dict[Tuple[Address, int], asyncio.Future] = {}
+        self._segmented: Dict[Tuple[Address, int], SegmentedResponse] = {}
+        self._listeners: Dict[Address, List[Callable[[bytes], None]]] = {}
+
+        # invoke IDs in use, and the next one to try, for each remote address
+        self._invoke_ids: Dict[Address, Set[int]] = {}
+        self._next_invoke_id: Dict[Address, int] = {}
+
+        # key of the request being sent, errors of sendto() are reported for it
+        self._sending: Optional[Tuple[Address, int]] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._transport is not None and not self._transport.is_closing()
+
+    async def open(self):
+        if self.is_open:
+            return
+
+        loop = asyncio.get_running_loop()
+
+        await loop.create_datagram_endpoint(
+            lambda: self, local_addr=(self.local_address, self.local_port)
+        )
+
+    def close(self):
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
 
-    # response is the response payload
-    response: bytes
+    async def __aenter__(self) -> "BACnetTransport":
+        await self.open()
+        return self
 
-    # exception is the exception that occurred during the request
-    exception: Exception
+    async def __aexit__(self, *exc_info):
+        self.close()
 
-    def __init__(self, request: bytes, done: asyncio.Future = None):
-        self.request = request
+    async def resolve(self, address: str, port: int) -> Address:
+        """Resolve the device address, so it can be matched against response's source."""
+        try:
+            return str(ipaddress.ip_address(address)), port
+        except ValueError:
+            pass
+
+        loop = asyncio.get_running_loop()
 
-        if done is None:
-            done = asyncio.get_running_loop().create_future()
+        family = socket.AF_INET6 if ":" in self.local_address else socket.AF_INET
+        addr_info = await loop.getaddrinfo(address, port, family=family, type=socket.SOCK_DGRAM)
 
-        self.done = done
+        return addr_info[0][4][:2]
 
     def connection_made(self, transport: asyncio.DatagramTransport):
         self._transport = transport
-        self._transport.sendto(self.request)
+
+    def add_listener(self, address: Address, listener: Callable[[bytes], None]):
+        """Pass requests initiated by the device (e.g. COV notifications) to the listener."""
+        listeners = self._listeners.setdefault(address, [])
+        if listener not in listeners:
+            listeners.append(listener)
+
+    def remove_listener(self, address: Address, listener: Callable[[bytes], None]):
+        listeners = self._listeners.get(address, [])
+        if listener in listeners:
+            listeners.remove(listener)
+
+        if not listeners:
+            self._listeners.pop(address, None)
+
+    def allocate_invoke_id(self, address: Address) -> int:
+        """Return an invoke ID not used by any request to the address in flight."""
+        in_use = self._invoke_ids.setdefault(address, set())
+        if len(in_use) > MAX_INVOKE_ID:
+            raise ValueError(f"no free invoke ID for {address}")
+
+        invoke_id = self._next_invoke_id.get(address, 0)
+        while invoke_id in in_use:
+            invoke_id = (invoke_id + 1) % (MAX_INVOKE_ID + 1)
+
+        self._next_invoke_id[address] = (invoke_id + 1) % (MAX_INVOKE_ID + 1)
+        in_use.add(invoke_id)
+
+        return invoke_id
+
+    def release_invoke_id(self, address: Address, invoke_id: int):
+        in_use = self._invoke_ids.get(address)
+        if in_use is None:
+            return
+
+        in_use.discard(invoke_id)
+
+        # the next ID is kept, so a late response cannot match a reused ID right away
+        if not in_use:
+            del self._invoke_ids[address]
+
+    def send(self, data: bytes, address: Address):
+        if self.is_open:
+            self._transport.sendto(data, address)
 
     def datagram_received(self, response: bytes, addr: Tuple[str, int]):
-        self.response = response
-        self._transport.close()
+        invoke_id_index = BVLC_LENGTH + len(NPDU) + 1
+        if len(response) <= invoke_id_index:
+            return
+
+        if response[invoke_id_index - 1] >> 4 in (APDUType.CONFIRMED_REQ, APDUType.UNCONFIRMED_REQ):
+            for listener in list(self._listeners.get(addr[:2], ())):
+                listener(response)
+
+            return
+
+        key = (addr[:2], response[invoke_id_index])
+
+        pending = self._pending.get(key)
+        if pending is None or pending.done():
+            return
+
+        if SegmentedResponse.is_segmented(response):
+            segmented = self._segmented.setdefault(key, SegmentedResponse())
+
+            try:
+                segment_ack, response = segmented.segment_received(response)
+            except DecodingError as exc:
+                pending.set_exception(exc)
+                return
+
+            if segment_ack is not None:
+                self._transport.sendto(segment_ack, addr)
+
+            if response is None:
+                return
+
+        pending.set_result(response)
+
+    def _fail_pending(self, exception: Optional[Exception]):
+        for pending in self._pending.values():
+            if not pending.done():
+                pending.set_exception(ConnectionError(exception))
 
     def error_received(self, exception: Exception):
-        self.exception = exception
+        # the socket is shared with other devices, so only the request being sent fails,
+        # errors reported later (e.g. ICMP unreachable) leave the requests to time out
+        pending = self._pending.get(self._sending) if self._sending is not None else None
 
-    def connection_lost(self, exception: Exception):
-        self.exception = exception
-        self.done.set_result(True)
+        if pending is not None and not pending.done():
+            pending.set_exception(ConnectionError(exception))
+        elif DEBUG:
+            print(f"transport error: {exception}")
 
-    def wait(self, timeout: float = 1.0):
-        return asyncio.wait_for(self.done, timeout=timeout)
+    def connection_lost(self, exception: Optional[Exception]):
+        self._transport = None
+        self._fail_pending(exception)
+
+    async def request(
+        self, request: bytes, address: Address, invoke_id: int, timeout: float = 1.0
+    ) -> bytes:
+        await self.open()
+
+        key = (address, invoke_id)
+        if key in self._pending:
+            raise ValueError(f"invoke ID already in use for {address}: {invoke_id}")
+
+        pending = asyncio.get_running_loop().create_future()
+        self._pending[key] = pending
+
+        try:
+            self._sending = key
+
+            try:
+                self._transport.sendto(request, address)
+            finally:
+                self._sending = None
+
+            return await asyncio.wait_for(pending, timeout=timeout)
+        finally:
+            del self._pending[key]
+            self._segmented.pop(key, None)
 
 
 class BACnetClient:
-    def __init__(self, address: str, port: int = DEFAULT_BACNET_PORT):
+    def __init__(
+        self,
+        address: str,
+        port: int = DEFAULT_BACNET_PORT,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        transport: Optional[BACnetTransport] = None,
+        max_apdu_length: int = MAX_APDU_LENGTH,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+    ):
+        """Create a client for a single device.
+
+        transport -- shared transport to send requests through, e.g. when polling
+                     many devices from one socket. The client does not close it.
+        max_apdu_length -- largest APDU accepted by the device, larger reads are
+                           split into multiple concurrent requests.
+        retry_policy -- timeouts and retries of the requests not answered in time.
+        """
+        if max_in_flight < 1 or max_in_flight > MAX_INVOKE_ID:
+            raise ValueError(f"max_in_flight must be between 1 and {MAX_INVOKE_ID}")
+
         self.address = address
         self.port = port
+        self.max_in_flight = max_in_flight
+        self.max_apdu_length = max_apdu_length
+        self.retry_policy = retry_policy
+        self.rtt = RTTEstimator(retry_policy)
+
+        self._transport = transport
+        self._owns_transport = False
+        self._remote: Optional[Address] = None
+        self._window: Optional[asyncio.Semaphore] = None
+
+        # invoke IDs of the requests sent through short-lived transports,
+        # a shared transport allocates them itself
+        self._invoke_ids: Set[int] = set()
+        self._next_invoke_id = 0
+        self._cov_listeners: List[Callable[[COVNotification], None]] = []
+
+        # cleared when the device refuses WritePropertyMultiple, values are then
+        # written one by one
+        self.write_multiple_supported = True
+
+        # compiled requests of the property lists read recently, the least recently read
+        # list first; the device object identifier differs between devices, so the requests
+        # are kept per client, and the cache does not grow with the number of devices
+        self._compiled: Dict[
+            Tuple[Tuple[DeviceProperty, ...], int], Tuple[CompiledRequest, ...]
+        ] = {}
+
+    async def open(self):
+        """Keep a single datagram endpoint open for all subsequent requests.
+
+        Without calling open() or passing a shared transport,
+        a new socket is created for every request.
+        """
+        if self._transport is None:
+            self._transport = BACnetTransport()
+            self._owns_transport = True
+
+        await self._transport.open()
+
+        if self._remote is None:
+            self._remote = await self._transport.resolve(self.address, self.port)
+
+        self._transport.add_listener(self._remote, self._request_received)
+
+    async def close(self):
+        """Close the datagram endpoint opened with open().
+
+        A shared transport passed to the constructor is left open.
+        """
+        if self._transport is not None and self._remote is not None:
+            self._transport.remove_listener(self._remote, self._request_received)
+
+        if self._owns_transport:
+            self._transport.close()
+            self._transport = None
+            self._owns_transport = False
+
+    async def __aenter__(self) -> "BACnetClient":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @asynccontextmanager
+    async def _invoke_id(self) -> AsyncIterator[int]:
+        """Allocate an invoke ID for a single request within the in-flight window."""
+        if self._window is None:
+            self._window = asyncio.Semaphore(self.max_in_flight)
+
+        async with self._window:
+            if self._transport is not None:
+                if self._remote is None:
+                    await self.open()
+
+                # other clients of the same device may share the transport
+                transport, remote = self._transport, self._remote
+                invoke_id = transport.allocate_invoke_id(remote)
+
+                try:
+                    yield invoke_id
+                finally:
+                    transport.release_invoke_id(remote, invoke_id)
+
+                return
+
+            invoke_id = self._next_invoke_id
+            while invoke_id in self._invoke_ids:
+                invoke_id = (invoke_id + 1) % (MAX_INVOKE_ID + 1)
+
+            self._next_invoke_id = (invoke_id + 1) % (MAX_INVOKE_ID + 1)
+            self._invoke_ids.add(invoke_id)
+
+            try:
+                yield invoke_id
+            finally:
+                self._invoke_ids.discard(invoke_id)
+
+    async def _send(self, request: bytes, invoke_id: int) -> bytes:
+        if self._transport is not None:
+            if self._remote is None:
+                await self.open()
+
+            return await self._request(self._transport, self._remote, request, invoke_id)
+
+        # without an open transport, use a short-lived one for this request only
+        async with BACnetTransport() as transport:
+            remote = await transport.resolve(self.address, self.port)
 
-    async def _send(self, request: bytes) -> bytes:
+            return await self._request(transport, remote, request, invoke_id)
+
+    async def _request(
+        self, transport: BACnetTransport, remote: Address, request: bytes, invoke_id: int
+    ) -> bytes:
+        """Send the request, and retransmit it with the same invoke ID until answered."""
         loop = asyncio.get_running_loop()
+        policy = self.retry_policy
+        timeout = self.rtt.timeout
 
-        bacnet_request = BACnetRequest(request)
+        attempt = 0
 
-        transport, _ = await loop.create_datagram_endpoint(
-            lambda: bacnet_request, remote_addr=(self.address, self.port)
-        )
+        while True:
+            sent_at = loop.time()
 
-        try:
-            await bacnet_request.wait(timeout=1.0)
-        finally:
-            transport.close()
+            try:
+                response = await transport.request(
+                    request, remote, invoke_id, timeout=policy.jittered(timeout)
+                )
+            except asyncio.TimeoutError:
+                if attempt == policy.retries:
+                    self.rtt.timed_out()
+                    raise
+
+                attempt += 1
+                timeout = policy.retry_timeout(timeout)
+                continue
 
-        if bacnet_request.exception is not None:
-            raise ConnectionError from bacnet_request.exception
+            # the round-trip time of a retransmitted request is ambiguous (Karn's algorithm)
+            if attempt == 0:
+                self.rtt.sample(loop.time() - sent_at)
 
-        return bacnet_request.response
+            return response
 
     async def read_multiple(
-        self, device_properties: List[DeviceProperty]
+        self,
+        device_properties: List[DeviceProperty],
+        errors: Optional[PropertyErrors] = None,
     ) -> DeviceState:
-        request = _read_property_multiple(device_properties)
+        """Read the properties, values which could not be read are 0.
 
-        if DEBUG:
-            print(f">>> {request.hex()}")
+        errors -- if given, the properties which could not be read are added to it,
+                  with the error codes.
+        """
+        requests = self._compiled_requests(tuple(device_properties))
+
+        if len(requests) == 1:
+            return await self._read_multiple_chunk(*requests[0], errors)
+
+        device_state = {}
+
+        for chunk_state in await asyncio.gather(
+            *[self._read_multiple_chunk(chunk, request, errors) for chunk, request in requests]
+        ):
+            device_state.update(chunk_state)
+
+        return device_state
+
+    def _compiled_requests(
+        self, device_properties: Tuple[DeviceProperty, ...]
+    ) -> Tuple[CompiledRequest, ...]:
+        key = (device_properties, self.max_apdu_length)
+
+        requests = self._compiled.pop(key, None)
+        if requests is None:
+            requests = _compile_read_property_multiple(device_properties, self.max_apdu_length)
+
+            if len(self._compiled) >= COMPILED_REQUESTS_CACHE_SIZE:
+                del self._compiled[next(iter(self._compiled))]
+
+        self._compiled[key] = requests
+
+        return requests
+
+    async def _read_multiple_chunk(
+        self,
+        device_properties: Tuple[DeviceProperty, ...],
+        compiled_request: bytes,
+        errors: Optional[PropertyErrors] = None,
+    ) -> DeviceState:
+        max_apdu_length = self.max_apdu_length
+
+        try:
+            return await self._read_multiple_request(compiled_request, errors)
+        except (AbortResponse, RejectResponse) as exc:
+            if (
+                not _is_too_large(exc)
+                or len(device_properties) == 1
+                or max_apdu_length <= MIN_APDU_LENGTH
+            ):
+                raise
+
+        # the response does not fit into what the device can send,
+        # read the properties in smaller requests from now on
+        self.max_apdu_length = min(self.max_apdu_length, max(MIN_APDU_LENGTH, max_apdu_length // 2))
+
+        return await self.read_multiple(list(device_properties), errors)
+
+    async def _read_multiple_request(
+        self, compiled_request: bytes, errors: Optional[PropertyErrors] = None
+    ) -> DeviceState:
+        async with self._invoke_id() as invoke_id:
+            request = _with_invoke_id(compiled_request, invoke_id)
 
-        response = await self._send(request)
+            if DEBUG:
+                print(f">>> {request.hex()}")
+
+            response = await self._send(request, invoke_id)
 
         if DEBUG:
             print(f"<<< {response.hex()}")
 
         try:
-            return _parse_read_property_multiple_response(response)
+            return _parse_read_property_multiple_response(response, invoke_id, errors)
+        except BACnetError:
+            raise
         except DecodingError as exc:
             raise DecodingError(
                 f"response decoding failed: {exc}\n{response.hex()}"
             ) from exc
 
     async def write(self, device_property: DeviceProperty, value: Any):
-        request = _write_property(device_property, value)
+        async with self._invoke_id() as invoke_id:
+            request = _write_property(device_property, value, invoke_id)
+
+            response = await self._send(request, invoke_id)
+
+        try:
+            return _parse_write_property_response(response, invoke_id)
+        except BACnetError:
+            raise
+        except DecodingError as exc:
+            raise DecodingError(
+                f"response decoding failed: {exc}\n{response.hex()}"
+            ) from exc
+
+    def add_cov_listener(self, listener: Callable[[COVNotification], None]):
+        """Call the listener with every COV notification received from the device."""
+        if listener not in self._cov_listeners:
+            self._cov_listeners.append(listener)
+
+    def remove_cov_listener(self, listener: Callable[[COVNotification], None]):
+        if listener in self._cov_listeners:
+            self._cov_listeners.remove(listener)
+
+    def _request_received(self, request: bytes):
+        try:
+            notification = _parse_cov_notification(request)
+        except (DecodingError, ValueError) as exc:
+            if DEBUG:
+                print(f"invalid COV notification: {exc}\n{request.hex()}")
+            return
+
+        if notification is None:
+            return
+
+        if notification.invoke_id is not None:
+            self._transport.send(_cov_notification_ack(notification.invoke_id), self._remote)
+
+        for listener in list(self._cov_listeners):
+            listener(notification)
 
-        response = await self._send(request)
+    async def subscribe_cov(
+        self,
+        device_property: DeviceProperty,
+        confirmed: bool = False,
+        lifetime: Optional[int] = DEFAULT_COV_LIFETIME,
+        subscriber_process_id: int = DEFAULT_SUBSCRIBER_PROCESS_ID,
+    ):
+        """Subscribe to COV notifications of the device property.
+
+        Notifications are delivered to the client's socket, so the client is opened if needed.
+
+        confirmed -- request confirmed notifications instead of unconfirmed ones.
+        lifetime -- subscription lifetime in seconds, None for indefinite subscription.
+        """
+        await self.open()
+
+        await self._subscribe_cov(device_property, subscriber_process_id, confirmed, lifetime)
+
+    async def unsubscribe_cov(
+        self,
+        device_property: DeviceProperty,
+        subscriber_process_id: int = DEFAULT_SUBSCRIBER_PROCESS_ID,
+    ):
+        """Cancel COV subscription of the device property."""
+        await self._subscribe_cov(device_property, subscriber_process_id, cancel=True)
+
+    async def _subscribe_cov(
+        self,
+        device_property: DeviceProperty,
+        subscriber_process_id: int,
+        confirmed: bool = False,
+        lifetime: Optional[int] = None,
+        cancel: bool = False,
+    ):
+        async with self._invoke_id() as invoke_id:
+            request = _subscribe_cov(
+                device_property, subscriber_process_id, confirmed, lifetime, cancel, invoke_id
+            )
+
+            response = await self._send(request, invoke_id)
 
         try:
-            return _parse_write_property_response(response)
+            return _parse_subscribe_cov_response(response, invoke_id)
+        except BACnetError:
+            raise
+        except DecodingError as exc:
+            raise DecodingError(
+                f"response decoding failed: {exc}\n{response.hex()}"
+            ) from exc
+
+    async def write_multiple(self, values: List[Tuple[DeviceProperty, Any]]):
+        """Write present values of multiple properties in a single request.
+
+        If the device rejects or aborts the request, e.g. because it does not support
+        the service, the values are written one by one, now and in later calls.
+        """
+        if self.write_multiple_supported:
+            try:
+                return await self._write_multiple(values)
+            except (RejectResponse, AbortResponse) as exc:
+                if DEBUG:
+                    print(f"WritePropertyMultiple refused, writing values one by one: {exc}")
+
+                self.write_multiple_supported = False
+
+        for device_property, value in values:
+            await self.write(device_property, value)
+
+    async def _write_multiple(self, values: List[Tuple[DeviceProperty, Any]]):
+        async with self._invoke_id() as invoke_id:
+            request = _write_property_multiple(values, invoke_id)
+
+            if len(request) - BVLC_LENGTH - len(NPDU) > self.max_apdu_length:
+                raise ValueError("too many values to write in a single request")
+
+            response = await self._send(request, invoke_id)
+
+        try:
+            return _parse_write_property_multiple_response(response, invoke_id)
+        except BACnetError:
+            raise
         except DecodingError as exc:
             raise DecodingError(
                 f"response decoding failed: {exc}\n{response.hex()}"
@@ -600,54 +1957,389 @@ def _is_discovery_response(response: bytes) -> bool:
     return True
 
 
-async def _receive_identification_responses(sock: socket.socket, response_ips: set):
-    while True:
-        try:
-            data, addr = sock.recvfrom(1024)
-            if _is_discovery_response(data):
-                response_ips.add(addr[0])
-        except BlockingIOError:
-            await asyncio.sleep(0.1)  # Wait briefly to avoid busy loop
-            continue
-        except Exception as e:
-            print(f"Error receiving data: {e}")
-            break
+def _who_is_request() -> bytes:
+    """Build a Who-Is request for all devices."""
+    apdu = pack("!BB", APDUType.UNCONFIRMED_REQ << 4, UnconfirmedServiceChoice.WHO_IS)
 
+    npdu = pack("!BB", NPDU_VERSION, 0)  # don't expect reply
+    bvlc = pack("!BBH", BVLC_TYPE, BVLC_FUNCTION_BROADCAST, BVLC_LENGTH + len(npdu) + len(apdu))
+
+    return bvlc + npdu + apdu
+
+
+class DiscoveredDevice(NamedTuple):
+    """Device, which responded to Who-Is with I-Am."""
+
+    address: str
+    port: int
+    device_id: int
+    max_apdu_length: int
+    segmentation: Segmentation
+    vendor_id: int
+
+
+# NPDU control bits
+NPDU_NETWORK_LAYER_MESSAGE = 0x80
+NPDU_DESTINATION_SPECIFIED = 0x20
+NPDU_SOURCE_SPECIFIED = 0x08
+
+
+def _skip_npdu(decoder: BACnetDecoder) -> bool:
+    """Skip NPDU, return False if it carries a network layer message instead of APDU."""
+    if decoder.read_byte() != NPDU_VERSION:
+        raise DecodingError("unsupported NPDU version")
+
+    control = decoder.read_byte()
+
+    if control & NPDU_DESTINATION_SPECIFIED:
+        decoder.read_bytes(2)  # DNET
+        decoder.read_bytes(decoder.read_byte())  # DLEN, DADR
+
+    if control & NPDU_SOURCE_SPECIFIED:
+        decoder.read_bytes(2)  # SNET
+        decoder.read_bytes(decoder.read_byte())  # SLEN, SADR
+
+    if control & NPDU_DESTINATION_SPECIFIED:
+        decoder.read_byte()  # hop count
+
+    return not control & NPDU_NETWORK_LAYER_MESSAGE
+
+
+def _parse_i_am(response: bytes, addr: Tuple[str, int]) -> Optional[DiscoveredDevice]:
+    """Return the device, if the response is I-Am (also forwarded by a BBMD)."""
+    if len(response) < BVLC_LENGTH:
+        return None
+
+    bvlc_type, bvlc_function, _ = unpack("!BBH", response[0:4])
+    if bvlc_type != BVLC_TYPE:
+        return None
+
+    decoder = BACnetDecoder(response, BVLC_LENGTH)
+
+    if bvlc_function == BVLC_FUNCTION_FORWARDED_NPDU:
+        original_source = decoder.read_bytes(BVLC_ORIGINAL_SOURCE_LENGTH)
+        addr = (socket.inet_ntoa(original_source[:4]), unpack("!H", original_source[4:])[0])
+    elif bvlc_function not in (BVLC_FUNCTION_UNICAST, BVLC_FUNCTION_BROADCAST):
+        return None
+
+    # a routed reply comes from a device on another BACnet network, which cannot be
+    # reached at the IP address of its router without network layer addressing
+    if decoder.data[decoder.i + 1] & NPDU_SOURCE_SPECIFIED:
+        return None
+
+    if not _skip_npdu(decoder):
+        return None
+
+    if decoder.read_byte() >> 4 != APDUType.UNCONFIRMED_REQ:
+        return None
+
+    if decoder.read_byte() != UnconfirmedServiceChoice.I_AM:
+        return None
+
+    values = []
+    for expected_tag_number in (
+        APP_TAG_OBJECT_IDENTIFIER,
+        APP_TAG_UNSIGNED_INT,
+        APP_TAG_ENUMERATED,
+        APP_TAG_UNSIGNED_INT,
+    ):
+        tag_number, tag_length = decoder.read_application_tag()
+        if tag_number != expected_tag_number:
+            raise DecodingError("unexpected tag")
+
+        values.append(decoder.parse_unsinged_int(tag_length))
+
+    object_identifier, max_apdu_length, segmentation, vendor_id = values
+
+    if object_identifier >> TAG_OBJECT_TYPE_SHIFT != ObjectType.DEVICE:
+        raise DecodingError("expected device object identifier")
+
+    return DiscoveredDevice(
+        address=addr[0],
+        port=addr[1],
+        device_id=object_identifier & TAG_INSTANCE_ID_MASK,
+        max_apdu_length=max_apdu_length,
+        segmentation=_enum_or_int(Segmentation, segmentation),
+        vendor_id=vendor_id,
+    )
+
+
+# the requests are the same for every discovery
+DISCOVERY_REQUEST = _discovery_request()
+WHO_IS_REQUEST = _who_is_request()
 
 BROADCAST_ADDRESS = "255.255.255.255"
 
+# initial and the largest interval between discovery broadcasts in seconds
+DISCOVERY_INTERVAL = 0.1
+MAX_DISCOVERY_INTERVAL = 1.0
 
-async def _send_discovery_request(sock: socket.socket):
-    while True:
-        sock.sendto(_discovery_request(), (BROADCAST_ADDRESS, DEFAULT_BACNET_PORT))
-        await asyncio.sleep(0.1)  # Slight delay between sends
 
+class _DiscoveryProtocol(asyncio.DatagramProtocol):
+    """Queues IP address of each response, with the device (None if the response is not I-Am)."""
 
-async def discover(timeout: float = 2.0) -> List[str]:
-    """
-    Discover devices on the local network.
+    def __init__(self):
+        self.responses: asyncio.Queue = asyncio.Queue()
+
+    def datagram_received(self, data: bytes, addr: Tuple[str, int]):
+        try:
+            device = _parse_i_am(data, addr)
+            if device is not None:
+                self.responses.put_nowait((device.address, device))
+            elif _is_discovery_response(data):
+                self.responses.put_nowait((addr[0], None))
+        except (DecodingError, IndexError, ValueError):
+            return
 
-    Returns a list of IP addresses.
+    def error_received(self, exception: Exception):
+        if DEBUG:
+            print(f"discovery error: {exception}")
+
+
+# ioctl requests and interface flags used to list the local interfaces on Linux
+SIOCGIFFLAGS = 0x8913
+SIOCGIFADDR = 0x8915
+SIOCGIFBRDADDR = 0x8919
+IFF_UP = 0x1
+IFF_BROADCAST = 0x2
+IFF_LOOPBACK = 0x8
+
+
+def _local_interfaces() -> List[Tuple[str, str]]:
+    """Return address and broadcast address of each local IPv4 interface, which is up.
+
+    Interfaces are only listed on Linux, elsewhere the list is empty.
     """
-    response_ips = set()
+    try:
+        import fcntl
+
+        names = [name for _, name in socket.if_nameindex()]
+    except (ImportError, AttributeError, OSError):
+        return []
 
-    # Create a UDP socket
-    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP) as sock:
+    interfaces = []
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        for name in names:
+            ifreq = pack("256s", name.encode()[:15])
+
+            try:
+                flags = unpack_from("H", fcntl.ioctl(sock.fileno(), SIOCGIFFLAGS, ifreq), 16)[0]
+                if not flags & IFF_UP or flags & IFF_LOOPBACK or not flags & IFF_BROADCAST:
+                    continue
+
+                address = fcntl.ioctl(sock.fileno(), SIOCGIFADDR, ifreq)[20:24]
+                broadcast = fcntl.ioctl(sock.fileno(), SIOCGIFBRDADDR, ifreq)[20:24]
+            except OSError:
+                # e.g. the interface has no IPv4 address
+                continue
+
+            interfaces.append((socket.inet_ntoa(address), socket.inet_ntoa(broadcast)))
+
+    return interfaces
+
+
+def _target_address(target: str) -> str:
+    """Return the address to send discovery requests to, for an address or CIDR range."""
+    network = ipaddress.IPv4Network(target, strict=False)
+
+    # a single address is either a host or a directed broadcast address
+    if network.num_addresses == 1:
+        return str(network.network_address)
+
+    return str(network.broadcast_address)
+
+
+def _discovery_socket(host: str, port: int) -> Optional[socket.socket]:
+    """Return a broadcast socket bound to the address, or None if it cannot be bound."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+
+    try:
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        sock.bind(('', DEFAULT_BACNET_PORT))
-        sock.setblocking(False)
+        sock.bind((host, port))
+    except OSError as exc:
+        if DEBUG:
+            print(f"cannot bind discovery socket to {host}:{port}: {exc}")
 
-        # Run sending and receiving tasks concurrently
-        try:
-            receiver = asyncio.create_task(_receive_identification_responses(sock, response_ips))
-            sender = asyncio.create_task(_send_discovery_request(sock))
+        sock.close()
+        return None
 
-            # Wait a bit, so we can collect all device responses
-            await asyncio.sleep(timeout)
-        finally:
-            # cancel the receiver task
-            receiver.cancel()
+    return sock
+
+
+async def _send_discovery_requests(transport: asyncio.DatagramTransport, addresses: List[str]):
+    """Send discovery requests to the addresses, backing off the interval between them."""
+    interval = DISCOVERY_INTERVAL
+
+    while True:
+        for address in addresses:
+            try:
+                transport.sendto(DISCOVERY_REQUEST, (address, DEFAULT_BACNET_PORT))
+                transport.sendto(WHO_IS_REQUEST, (address, DEFAULT_BACNET_PORT))
+            except OSError as exc:
+                # e.g. the network is unreachable, the other addresses are still tried
+                if DEBUG:
+                    print(f"cannot send discovery request to {address}: {exc}")
+
+        await asyncio.sleep(interval)
+        interval = min(MAX_DISCOVERY_INTERVAL, interval * 2)
+
+
+async def _discovery_responses(
+    timeout: float,
+    targets: Sequence[str] = (),
+    interfaces: bool = True,
+) -> AsyncIterator[Tuple[str, Any]]:
+    """Yield IP address and the device (or None) of each response, until the timeout.
+
+    Requests are sent concurrently from a socket per local interface, and to the targets.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+
+    # invalid targets are rejected before any socket is bound
+    addresses = [_target_address(target) for target in targets]
+
+    # sockets with the addresses to send the requests to
+    sockets: List[Tuple[socket.socket, List[str]]] = []
+
+    # devices broadcast I-Am to the standard port, but another application may hold it
+    sock = _discovery_socket("", DEFAULT_BACNET_PORT)
+    if sock is not None:
+        sockets.append((sock, [BROADCAST_ADDRESS]))
+
+    if interfaces:
+        for address, broadcast in _local_interfaces():
+            sock = _discovery_socket(address, 0)
+            if sock is not None:
+                sockets.append((sock, [broadcast]))
+
+    if addresses or not sockets:
+        sock = _discovery_socket("", 0)
+        if sock is not None:
+            sockets.append((sock, addresses or [BROADCAST_ADDRESS]))
+
+    if not sockets:
+        raise OSError("cannot bind any discovery socket")
+
+    protocol = _DiscoveryProtocol()
+    transports: List[asyncio.DatagramTransport] = []
+    senders: List[asyncio.Future] = []
+
+    try:
+        for sock, destinations in sockets:
+            transport, _ = await loop.create_datagram_endpoint(lambda: protocol, sock=sock)
+            transports.append(transport)
+            senders.append(asyncio.ensure_future(_send_discovery_requests(transport, destinations)))
+
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            try:
+                yield await asyncio.wait_for(protocol.responses.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+    finally:
+        for sender in senders:
             sender.cancel()
 
-    return list(response_ips)
+        for sock, _ in sockets[len(transports):]:
+            sock.close()
+
+        for transport in transports:
+            transport.close()
+
+
+async def discover_iter(
+    timeout: float = 2.0,
+    max_devices: Optional[int] = None,
+    until: Optional[Callable[[str], bool]] = None,
+    targets: Sequence[str] = (),
+    interfaces: bool = True,
+) -> AsyncIterator[str]:
+    """
+    Discover devices on the local network.
+
+    Yields IP address of each Flexit unit as soon as it responds to the Flexit discovery
+    request, other BACnet devices answering Who-Is are skipped (see discover_devices()).
+
+    timeout -- stop after this many seconds.
+    max_devices -- stop after this many devices were found.
+    until -- stop after a device, for which it returns True, was found.
+    targets -- also search these subnets (CIDR ranges or directed broadcast addresses)
+               and hosts, e.g. behind routers.
+    interfaces -- broadcast on every local interface, not only the default one.
+    """
+    responses = _discovery_responses(timeout, targets, interfaces)
+    found: Set[str] = set()
+
+    try:
+        async for address, device in responses:
+            if device is not None or address in found:
+                continue
+
+            found.add(address)
+            yield address
+
+            if len(found) == max_devices or (until is not None and until(address)):
+                break
+    finally:
+        await responses.aclose()
+
+
+async def discover_devices(
+    timeout: float = 2.0,
+    max_devices: Optional[int] = None,
+    until: Optional[Callable[[DiscoveredDevice], bool]] = None,
+    targets: Sequence[str] = (),
+    interfaces: bool = True,
+    vendor_id: Optional[int] = None,
+) -> AsyncIterator[DiscoveredDevice]:
+    """
+    Discover BACnet devices on the local network with Who-Is.
+
+    Yields each device as soon as it responds with I-Am, see discover_iter().
+    Devices of any vendor are yielded, unless vendor_id is given.
+    Devices behind BACnet routers (on another BACnet network) are skipped.
+    """
+    responses = _discovery_responses(timeout, targets, interfaces)
+    found: Set[Tuple[str, int, int]] = set()
+
+    try:
+        async for _, device in responses:
+            if device is None or vendor_id not in (None, device.vendor_id):
+                continue
+
+            key = (device.address, device.port, device.device_id)
+            if key in found:
+                continue
+
+            found.add(key)
+            yield device
+
+            if len(found) == max_devices or (until is not None and until(device)):
+                break
+    finally:
+        await responses.aclose()
+
+
+async def discover(
+    timeout: float = 2.0,
+    max_devices: Optional[int] = None,
+    targets: Sequence[str] = (),
+    interfaces: bool = True,
+) -> List[str]:
+    """
+    Discover devices on the local network.
+
+    Returns a list of IP addresses, see discover_iter().
+    """
+    return [
+        address
+        async for address in discover_iter(
+            timeout, max_devices, targets=targets, interfaces=interfaces
+        )
+    ]
@@ -0,0 +1,160 @@
+"""Cache of the known devices, for a fast start without discovery.
+
+The devices are stored in a single JSON file, with what was learned about them:
+device ID, serial number, model and the points they do not support.
+"""
+import asyncio
+import json
+import os
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .bacnet import (
+    DEFAULT_BACNET_PORT,
+    MAX_APDU_LENGTH,
+    DiscoveredDevice,
+    ObjectIdentifier,
+    ObjectType,
+)
+from .profile import PointProfile
+
+# version 2 keys the devices by address and port, version 1 files are read the same way
+CACHE_VERSION = 2
+CACHE_VERSIONS = (1, CACHE_VERSION)
+
+# changes made within this many seconds are saved together
+SAVE_DELAY = 1.0
+
+
+class CachedDevice(NamedTuple):
+    address: str
+    device_id: int
+    port: int = DEFAULT_BACNET_PORT
+    max_apdu_length: int = MAX_APDU_LENGTH
+    device_name: Optional[str] = None
+    serial_number: Optional[str] = None
+    model: Optional[str] = None
+
+    # None until the points are probed
+    unsupported: Optional[Tuple[ObjectIdentifier, ...]] = None
+
+    @property
+    def profile(self) -> Optional[PointProfile]:
+        if self.unsupported is None or not self.serial_number:
+            return None
+
+        return PointProfile(self.serial_number, self.unsupported)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = self._asdict()
+
+        if self.unsupported is not None:
+            data["unsupported"] = sorted([int(t), i] for t, i in self.unsupported)
+
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CachedDevice":
+        data = dict(data)
+
+        if data.get("unsupported") is not None:
+            data["unsupported"] = tuple((ObjectType(t), i) for t, i in data["unsupported"])
+
+        return cls(**data)
+
+
+# CacheKey is the address and port of a device, several devices may share the address,
+# e.g. behind a NAT or a BBMD
+CacheKey = Tuple[str, int]
+
+
+class DeviceCache:
+    """Known devices, keyed by their address and port, stored in the file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._devices: Optional[Dict[CacheKey, CachedDevice]] = None
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+
+    def _load(self) -> Dict[CacheKey, CachedDevice]:
+        if self._devices is not None:
+            return self._devices
+
+        self._devices = {}
+
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+
+            if data.get("version") in CACHE_VERSIONS:
+                for entry in data["devices"]:
+                    device = CachedDevice.from_dict(entry)
+                    self._devices[device.address, device.port] = device
+        except (OSError, ValueError, KeyError, TypeError):
+            # a missing or invalid cache is the same as an empty one
+            self._devices = {}
+
+        return self._devices
+
+    def __iter__(self) -> Iterator[CachedDevice]:
+        return iter(list(self._load().values()))
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def get(self, address: str, port: int = DEFAULT_BACNET_PORT) -> Optional[CachedDevice]:
+        return self._load().get((address, port))
+
+    def add(self, device: CachedDevice) -> None:
+        self._load()[device.address, device.port] = device
+
+    def add_discovered(self, found: DiscoveredDevice) -> CachedDevice:
+        """Add the device found by discover_devices(), keeping what is known about it."""
+        device = self.get(found.address, found.port)
+
+        if device is None or device.device_id != found.device_id:
+            device = CachedDevice(found.address, found.device_id, found.port)
+
+        device = device._replace(max_apdu_length=found.max_apdu_length)
+        self.add(device)
+
+        return device
+
+    def remove(self, address: str, port: int = DEFAULT_BACNET_PORT) -> None:
+        self._load().pop((address, port), None)
+
+    def devices(self) -> List[CachedDevice]:
+        return list(self)
+
+    def save(self) -> None:
+        self._write(self._snapshot())
+
+    def save_soon(self, delay: float = SAVE_DELAY) -> None:
+        """Save the cache in the background, after the changes made within the delay."""
+        if self._save_handle is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        self._save_handle = loop.call_later(delay, self._save_in_background)
+
+    def _save_in_background(self) -> None:
+        self._save_handle = None
+
+        # the snapshot is taken in the event loop, only the file is written in another thread
+        asyncio.get_running_loop().run_in_executor(None, self._write, self._snapshot())
+
+    def _snapshot(self) -> Dict[str, Any]:
+        return {
+            "version": CACHE_VERSION,
+            "devices": [device.to_dict() for device in self._load().values()],
+        }
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # replace the file atomically, so a crash never leaves a partial cache
+        with open(self.path + ".tmp", "w") as f:
+            json.dump(data, f)
+
+        os.replace(self.path + ".tmp", self.path)
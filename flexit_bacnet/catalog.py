@@ -0,0 +1,94 @@
+"""Registry of all the points documented for Flexit Nordic (see bac0_points_dump.txt).
+
+The catalog is loaded on first use, so importing the package does not pay for it:
+
+    from flexit_bacnet import catalog
+
+    catalog.OUTSIDE_AIR_TEMPERATURE  # DeviceProperty
+    catalog.CATALOG["OUTSIDE_AIR_TEMPERATURE"]  # Point
+    catalog.CATALOG.find((ObjectType.ANALOG_INPUT, 1))  # Point
+"""
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from .bacnet import DeviceProperty, ObjectIdentifier, ObjectType
+
+
+class Point(NamedTuple):
+    name: str
+    object_type: ObjectType
+    instance_id: int
+    object_name: str
+    description: str
+    unit: Optional[str]
+
+    @property
+    def object_identifier(self) -> ObjectIdentifier:
+        return self.object_type, self.instance_id
+
+    @property
+    def device_property(self) -> DeviceProperty:
+        return DeviceProperty(self.object_type, self.instance_id)
+
+
+class PointCatalog:
+    """Points indexed by name and by object identifier, loaded lazily."""
+
+    def __init__(self):
+        self._points: Optional[Dict[str, Point]] = None
+        self._object_identifiers: Optional[Dict[ObjectIdentifier, Point]] = None
+
+    def _load(self) -> Dict[str, Point]:
+        if self._points is None:
+            from .catalog_data import POINTS
+
+            points = [
+                Point(name, ObjectType(object_type), instance_id, *rest)
+                for name, object_type, instance_id, *rest in POINTS
+            ]
+
+            self._object_identifiers = {point.object_identifier: point for point in points}
+            self._points = {point.name: point for point in points}
+
+        return self._points
+
+    def __getitem__(self, name: str) -> Point:
+        return self._load()[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._load()
+
+    def __iter__(self) -> Iterator[Point]:
+        return iter(self._load().values())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def names(self) -> List[str]:
+        return list(self._load())
+
+    def find(self, object_identifier: ObjectIdentifier) -> Optional[Point]:
+        """Return the point of the object identifier, or None if it is not documented."""
+        self._load()
+        return self._object_identifiers.get(object_identifier)
+
+    def device_properties(self, names: Optional[Iterable[str]] = None) -> List[DeviceProperty]:
+        """Return properties of the named points, or all points by default."""
+        if names is None:
+            return [point.device_property for point in self]
+
+        return [self[name].device_property for name in names]
+
+
+CATALOG = PointCatalog()
+
+
+def __getattr__(name: str) -> DeviceProperty:
+    # the import system looks up e.g. __path__, which must not load the catalog
+    if not name.startswith("__") and name in CATALOG:
+        return CATALOG[name].device_property
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + CATALOG.names())
@@ -0,0 +1,662 @@
+"""Flexit Nordic point catalog.
+
+Generated by scripts/generate_catalog.py from bac0_points_dump.txt, do not edit.
+
+Each point is a tuple of: name, object type, instance id, object name, description and unit.
+"""
+
+POINTS = (
+    ('OUTSIDE_AIR_TEMPERATURE', 0, 1, "R(1)'TOa", 'Outside air temperature', 'degreesCelsius'),
+    ('SUPPLY_AIR_TEMPERATURE', 0, 4, "R(1)'TSu", 'Supply air temperature', 'degreesCelsius'),
+    ('TACHO_SUPPLY_FAN', 0, 5, "R(1)'FanSuSpdFb", 'Tacho, supply fan', 'revolutionsPerMinute'),
+    ('EXHAUST_AIR_TEMPERATURE', 0, 11, "R(1)'TEh", 'Exhaust air temperature', 'degreesCelsius'),
+    ('TACHO_EXHAUST_FAN', 0, 12, "R(1)'FanEhSpdFb", 'Tacho, exhaust fan', 'revolutionsPerMinute'),
+    ('EXTRACT_AIR_TEMPERATURE', 0, 59, "R(1)'TEx", 'Extract air temperature', 'degreesCelsius'),
+    ('TEMPERATURE_SUPPLY_AIR_AFTER_ROTOR', 0, 71, "R(1)'IOExtnDevEcul'TSuAfHExg", 'Temperature, supply air after rotor', 'degreesCelsius'),
+    ('AIR_FLOW_PRESSURE_EXHAUST_FAN', 0, 72, "R(1)'IOExtnDevEcul'DiffPFanEh", 'Air flow, pressure exhaust fan', 'pascals'),
+    ('AIR_FLOW_PRESSURE_SUPPLY_FAN', 0, 73, "R(1)'IOExtnDevEcul'DiffPFanSu", 'Air flow, pressure supply fan', 'pascals'),
+    ('ROOM_TEMPERATURE', 0, 75, "R(1)'ROpUnDev'TR", 'Room temperature', 'degreesCelsius'),
+    ('AIR_QUALITY_INPUT_VALUE', 0, 77, "R(1)'IOExtnDevEcul'AQualRIn", 'Air quality, input value', 'partsPerMillion'),
+    ('EXTRACT_AIR_PRESSURE', 0, 78, "R(1)'PDuctDevQbm'PEx", 'Extract air pressure', 'pascals'),
+    ('SUPPLY_AIR_PRESSURE', 0, 79, "R(1)'PDuctDevQbm'PSu", 'Supply air pressure', 'pascals'),
+    ('MAXIMUM_ROOM_TEMPERATURE_RF_SYSTEM', 0, 80, "R(1)'FanNodeDev'TRMaxRfqs", 'Maximum room temperature RF system', 'degreesCelsius'),
+    ('MAXIMUM_ROOM_AIR_HUMIDITY_RF_SYSTEM', 0, 81, "R(1)'FanNodeDev'HuRMaxRfqs", 'Maximum room air humidity RF system', 'percent'),
+    ('MAXIMUM_ROOM_AIR_QUALITY_RF_SYSTEM', 0, 82, "R(1)'FanNodeDev'AQualRMaxRfqs", 'Maximum room air quality RF system', 'partsPerMillion'),
+    ('ROOM_TEMPERATURE_VMSH_1', 0, 83, "R(1)'ROpUnDevVmsh1'TRVmsh1", 'Room temperature VMSH 1', 'degreesCelsius'),
+    ('ROOM_AIR_HUMIDITY_VMSH_1', 0, 84, "R(1)'ROpUnDevVmsh1'HuRVmsh1", 'Room air humidity VMSH 1', 'percent'),
+    ('ROOM_DEW_POINT_TEMPERATURE_VMSH_1', 0, 85, "R(1)'ROpUnDevVmsh1'TDwpRVmsh1", 'Room dew point temperature VMSH 1', 'degreesCelsius'),
+    ('ROOM_TEMPERATURE_VMSH_2', 0, 86, "R(1)'ROpUnDevVmsh2'TRVmsh2", 'Room temperature VMSH 2', 'degreesCelsius'),
+    ('ROOM_AIR_HUMIDITY_VMSH_2', 0, 87, "R(1)'ROpUnDevVmsh2'HuRVmsh2", 'Room air humidity VMSH 2', 'percent'),
+    ('ROOM_DEW_POINT_TEMPERATURE_VMSH_2', 0, 88, "R(1)'ROpUnDevVmsh2'TDwpRVmsh2", 'Room dew point temperature VMSH 2', 'degreesCelsius'),
+    ('ROOM_TEMPERATURE_VMSH_3', 0, 89, "R(1)'ROpUnDevVmsh3'TRVmsh3", 'Room temperature VMSH 3', 'degreesCelsius'),
+    ('ROOM_AIR_HUMIDITY_VMSH_3', 0, 90, "R(1)'ROpUnDevVmsh3'HuRVmsh3", 'Room air humidity VMSH 3', 'percent'),
+    ('ROOM_DEW_POINT_TEMPERATURE_VMSH_3', 0, 91, "R(1)'ROpUnDevVmsh3'TDwpRVmsh3", 'Room dew point temperature VMSH 3', 'degreesCelsius'),
+    ('AIR_QUALITY_MAX_VALUE_RF', 0, 92, "R(1)'ROpUnDevVmsc'AQualRVmsc", 'Air quality, max value RF', 'partsPerMillion'),
+    ('INPUTS_STATE_VMC', 0, 93, "R(1)'IOExtnDevVmc'InStaVmc", 'Inputs state VMC', 'noUnits'),
+    ('ROTATING_HEAT_EXCHANGER', 1, 0, "R(1)'RotHExgSpd", 'Rotating heat exchanger', 'percent'),
+    ('FAN_SPEED_SUPPLY_AIR', 1, 3, "R(1)'FanSuSpd", 'Fan speed, supply air', 'percent'),
+    ('FAN_SPEED_EXHAUST_AIR', 1, 4, "R(1)'FanEhSpd", 'Fan speed, exhaust air', 'percent'),
+    ('COOLING_VALVE_POSITION', 1, 28, "R(1)'IOExtnDevEcul'CclVlvPos(1)", 'Cooling, valve position', 'percent'),
+    ('HEATING_BATTERY_ELECTRICAL', 1, 29, "R(1)'HclElPos", 'Heating battery, electrical', 'percent'),
+    ('DIAGNOSTICS_FOR_AUTOMATION_STATION', 2, 0, "Infra'DiagAs", 'Diagnostics for automation station', 'noUnits'),
+    ('DIAGNOSTICS_FOR_KNX_PL_LINK_BUS', 2, 3, "PlnkBus'DiagPlnkBus", 'Diagnostics for KNX PL-Link bus', 'noUnits'),
+    ('RESULT_OF_ROOM_TEMPERATURE', 2, 5, "R(1)'RHvacCoo'TRCol'TRRs", 'Result of room temperature', 'degreesCelsius'),
+    ('ALARM_CODE_TYPE_A', 2, 8, "R(1)'RHvacCoo'AlmFnct'AalmCode", 'Alarm, code type A', 'noUnits'),
+    ('FIRE_ALARM_LIMIT_SUPPLY_AIR', 2, 56, "R(1)'RHvacCoo'SftyCtl'TSuFireAlmLm", 'Fire alarm, limit supply air', 'degreesCelsius'),
+    ('MAINT_ALARM_MAX_LIMIT_SUPPLY_AIR', 2, 57, "R(1)'RHvacCoo'SftyCtl'TSuHiAlmLm", 'Maint.alarm, max limit supply air', 'degreesCelsius'),
+    ('MAINT_ALARM_MIN_LIMIT_SUPPLY_AIR', 2, 58, "R(1)'RHvacCoo'SftyCtl'TSuLoAlmLm", 'Maint.alarm, min limit supply air', 'degreesCelsius'),
+    ('FIRE_ALARM_LIMIT_EXTRACT_AIR', 2, 59, "R(1)'RHvacCoo'SftyCtl'TExFireAlmLm", 'Fire alarm, limit extract air', 'degreesCelsius'),
+    ('PRESENT_COOLING_SETPOINT_FOR_COMFORT', 2, 69, "R(1)'RHvacCoo'TCtlC'PrSpCCmf", 'Present cooling setpoint for comfort', 'degreesCelsius'),
+    ('PRESENT_COOLING_SETPOINT_FOR_PRE_COMFORT', 2, 70, "R(1)'RHvacCoo'TCtlC'PrSpCPcf", 'Present cooling setpoint for pre-comfort', 'degreesCelsius'),
+    ('PRESENT_COOLING_SETPOINT_FOR_ECONOMY', 2, 71, "R(1)'RHvacCoo'TCtlC'PrSpCEco", 'Present cooling setpoint for economy', 'degreesCelsius'),
+    ('PRESENT_COOLING_SETPOINT_FOR_PROTECTION', 2, 72, "R(1)'RHvacCoo'TCtlC'PrSpCPrt", 'Present cooling setpoint for protection', 'degreesCelsius'),
+    ('PRESENT_COOLING_SETPOINT', 2, 73, "R(1)'RHvacCoo'TCtlC'PrSpC", 'Present cooling setpoint', 'degreesCelsius'),
+    ('COOLING_SETPOINT_END_VALUE_SHIFT', 2, 75, "R(1)'RHvacCoo'TCtlC'EndSpShftC", 'Cooling, setpoint end value shift', 'degreesCelsius'),
+    ('COOLING_OUTDOOR_AIR_LIMIT_FOR_RELEASE', 2, 76, "R(1)'RHvacCoo'TCtlC'CLmCmf", 'Cooling, outdoor air limit for release', 'degreesCelsius'),
+    ('COOLING_SETPOINT_START_VALUE_SHIFT', 2, 78, "R(1)'RHvacCoo'TCtlC'SttSpShftC", 'Cooling setpoint start value shift', 'degreesCelsius'),
+    ('COOLING_SETPOINT_FOR_SHIFT', 2, 79, "R(1)'RHvacCoo'TCtlC'SpShftC", 'Cooling, setpoint for shift', 'degreesKelvin'),
+    ('PRESENT_HEATING_SETPOINT_FOR_COMFORT', 2, 96, "R(1)'RHvacCoo'TCtlH'PrSpHCmf", 'Present heating setpoint for comfort', 'degreesCelsius'),
+    ('PRESENT_HEATING_SETPOINT_FOR_PRE_COMFORT', 2, 97, "R(1)'RHvacCoo'TCtlH'PrSpHPcf", 'Present heating setpoint for pre-comfort', 'degreesCelsius'),
+    ('PRESENT_HEATING_SETPOINT_FOR_ECONOMY', 2, 98, "R(1)'RHvacCoo'TCtlH'PrSpHEco", 'Present heating setpoint for economy', 'degreesCelsius'),
+    ('PRESENT_HEATING_SETPOINT_FOR_PROTECTION', 2, 99, "R(1)'RHvacCoo'TCtlH'PrSpHPrt", 'Present heating setpoint for protection', 'degreesCelsius'),
+    ('PRESENT_HEATING_SETPOINT', 2, 100, "R(1)'RHvacCoo'TCtlH'PrSpH", 'Present heating setpoint', 'degreesCelsius'),
+    ('HEATING_SETPOINT_END_VALUE_SHIFT', 2, 102, "R(1)'RHvacCoo'TCtlH'EndSpShftH", 'Heating, setpoint end value shift', 'degreesCelsius'),
+    ('HEATING_LIMIT_COMFORT', 2, 103, "R(1)'RHvacCoo'TCtlH'HLmCmf", 'Heating limit comfort', 'degreesCelsius'),
+    ('OUTS_AIR_TEMP_LIMIT_TO_START_CORRECTION', 2, 104, "R(1)'RHvacCoo'TCtlH'TOaLmSttCorr", 'Outs.air temp.limit to start correction', 'degreesCelsius'),
+    ('HEATING_SETPOINT_START_VALUE_SHIFT', 2, 106, "R(1)'RHvacCoo'TCtlH'SttSpShftH", 'Heating, setpoint start value shift', 'degreesCelsius'),
+    ('HEATING_SETPOINT_FOR_SHIFT', 2, 107, "R(1)'RHvacCoo'TCtlH'SpShftH", 'Heating, setpoint for shift', 'degreesKelvin'),
+    ('ROOM_TEMPERATURE_SETPOINT', 2, 126, "R(1)'RHvacCoo'SpTRDtr'SpTR", 'Room temperature setpoint', 'degreesCelsius'),
+    ('ROOM_TEMPERATURE_SETPOINT_SHIFT', 2, 127, "R(1)'RHvacCoo'SpTRDtr'SpTRShft", 'Room temperature setpoint shift', 'degreesKelvin'),
+    ('ALARM_STATE_CODE_B', 2, 130, "R(1)'RHvacCoo'MntnFnct'BalmCode", 'Alarm, state code B', 'noUnits'),
+    ('EFFECTIVE_ROOM_TEMPERATURE', 2, 131, "R(1)'HVAC'TREff", 'Effective room temperature', 'degreesCelsius'),
+    ('PRESENT_SETPOINT_SUPPLY_TEMPERATURE', 2, 132, "R(1)'HVAC'PrSpTSu", 'Present setpoint supply temperature', 'degreesCelsius'),
+    ('ROTATING_HEAT_EXCHANGER_COOLING_KP', 2, 134, "R(1)'HVAC'Erc'GainRotHxCtrC", 'Rotating heat exchanger, cooling Kp', '623'),
+    ('ROTATING_HEAT_EXCHANGER_HEATING_KP', 2, 135, "R(1)'HVAC'Erc'GainRotHxCtrH", 'Rotating heat exchanger, heating Kp', '623'),
+    ('COOLING_DT_B3_B4_START', 2, 136, "R(1)'HVAC'Erc'DiffTRTOaMinC", 'Cooling, dT B3-B4 start', 'degreesKelvin'),
+    ('DE_ICING_HUMIDITY_COMP_START', 2, 140, "R(1)'HVAC'Erc'SstHuCmpDeic", 'De-icing, humidity comp. Start', 'percent'),
+    ('DE_ICING_HUMIDITY_COMP_END', 2, 142, "R(1)'HVAC'Erc'EndHuCmpDeic", 'De-icing, humidity comp. End', 'percent'),
+    ('ROTARY_HEAT_EXCHANGER_HEATING_REQUEST', 2, 144, "R(1)'HVAC'Erc'RotHExgHReq", 'Rotary heat exchanger heating request', 'percent'),
+    ('ROTARY_HEAT_EXCHANGER_COOLING_REQUEST', 2, 145, "R(1)'HVAC'Erc'RotHExgCReq", 'Rotary heat exchanger cooling request', 'percent'),
+    ('ROTATING_HEAT_EXCHANGER_MIN_SPEED', 2, 147, "R(1)'HVAC'Erc'RotHExgSpdMin", 'Rotating heat exchanger , min speed', 'percent'),
+    ('ROTATING_HEAT_EXCHANGER_MAX_SPEED', 2, 148, "R(1)'HVAC'Erc'RotHExgSpdMax", 'Rotating heat exchanger , max speed', 'percent'),
+    ('SWITCH_ON_POINT_FOR_AIR_FLOW_HOLD_HEAT', 2, 189, "R(1)'HVAC'Hcl'SwiOnAirFlHldH", 'Switch-on point for air flow hold heat.', 'percent'),
+    ('ELECTRIC_HEATER_NOM_POWER', 2, 190, "R(1)'HVAC'Hcl'NomElPwr", 'Electric heater, nom. Power', 'kilowatts'),
+    ('HEATING_COIL_ELECTRIC_POWER', 2, 194, "R(1)'HVAC'Hcl'HclElPwr", 'Heating coil electric power', 'kilowatts'),
+    ('HEATING_COIL_HEATING_REQUEST_MINIMUM', 2, 195, "R(1)'HVAC'Hcl'HclHReqMin", 'Heating coil heating request minimum', 'percent'),
+    ('HEATING_COIL_HEATING_REQUEST', 2, 196, "R(1)'HVAC'Hcl'HclHReq", 'Heating coil heating request', 'percent'),
+    ('SUPPLY_HEATER_KP_ZONE_2', 2, 197, "R(1)'HVAC'Hcl'GainHclTSuCtrH", 'Supply, heater, Kp zone 2', '623'),
+    ('AIR_FILTER_OPERATING_TIME', 2, 285, "R(1)'HVAC'AlmBdl'TiOpFil", 'Air filter, operating time', 'hours'),
+    ('AIR_FILTER_TIME_PERIOD_FOR_EXCHANGE', 2, 286, "R(1)'HVAC'AlmBdl'TiOpFilRpc", 'Air filter, time period for exchange', 'hours'),
+    ('DIAGNOSTICS_FOR_MODBUS', 2, 296, "ModBus'DiagModBus", 'Diagnostics for Modbus', 'noUnits'),
+    ('DIAGNOSTICS_FOR_I_O_BUS', 2, 297, "IOBus'DiagIOBus", 'Diagnostics for I/O bus', 'noUnits'),
+    ('PRESENT_A_ALARM_CODE', 2, 1794, "R(1)'RHvacCoo'AlmFnct'PrAalmCode", 'Present A-Alarm code', 'noUnits'),
+    ('DIAGNOSTICS_FOR_ECUL', 2, 1796, "R(1)'IOExtnDevEcul'DiagEcul", 'Diagnostics for ECUL', 'noUnits'),
+    ('TIME_COUNTER_FIRE', 2, 1814, "R(1)'RHvacCoo'FplcVntOp'OphFplcVnt", 'Time counter, FIRE', 'hours'),
+    ('TIME_COUNTER_COOKER_HOOD', 2, 1820, "R(1)'RHvacCoo'FhVntOp'OphFhVnt", 'Time counter, cooker hood', 'hours'),
+    ('AIR_QUALITY_PRESENT_SETPOINT', 2, 1831, "R(1)'RHvacCoo'VntCtl'PrSpVnt", 'Air quality, present setpoint', 'partsPerMillion'),
+    ('AIR_QUALITY_SETPOINT_HIGH', 2, 1832, "R(1)'RHvacCoo'VntCtl'SpAQualRCmf", 'Air quality, setpoint  HIGH', 'partsPerMillion'),
+    ('AIR_QUALITY_SETPOINT_HOME', 2, 1833, "R(1)'RHvacCoo'VntCtl'SpAQualRPcf", 'Air quality, setpoint  HOME', 'partsPerMillion'),
+    ('AIR_QUALITY_SETPOINT_AWAY', 2, 1834, "R(1)'RHvacCoo'VntCtl'SpAQualREco", 'Air quality, setpoint  AWAY', 'partsPerMillion'),
+    ('LINEAR_SETPOINT_SUPPLY_AIR_HIGH', 2, 1835, "R(1)'RHvacCoo'VntCtl'SpFanSuSpdHi", 'Linear, setpoint supply air HIGH', 'percent'),
+    ('LINEAR_SETPOINT_SUPPLY_AIR_HOME', 2, 1836, "R(1)'RHvacCoo'VntCtl'SpFanSuSpdHome", 'Linear, setpoint supply air HOME', 'percent'),
+    ('LINEAR_SETPOINT_SUPPLY_AIR_AWAY', 2, 1837, "R(1)'RHvacCoo'VntCtl'SpFanSuSpdAway", 'Linear, setpoint supply air AWAY', 'percent'),
+    ('LINEAR_SETPOINT_SUPPLY_AIR_FIRE', 2, 1838, "R(1)'RHvacCoo'VntCtl'SpFanSuSpdFplc", 'Linear, setpoint supply air FIRE', 'percent'),
+    ('LINEAR_SETPOINT_SUPPLY_AIR_COOKER', 2, 1839, "R(1)'RHvacCoo'VntCtl'SpFanSuSpdCkr", 'Linear, setpoint supply air COOKER', 'percent'),
+    ('LINEAR_SETPOINT_EXHAUST_AIR_HIGH', 2, 1840, "R(1)'RHvacCoo'VntCtl'SpFanEhSpdHi", 'Linear, setpoint exhaust air HIGH', 'percent'),
+    ('LINEAR_SETPOINT_EXHAUST_AIR_HOME', 2, 1841, "R(1)'RHvacCoo'VntCtl'SpFanEhSpdHome", 'Linear, setpoint exhaust air HOME', 'percent'),
+    ('LINEAR_SETPOINT_EXHAUST_AIR_AWAY', 2, 1842, "R(1)'RHvacCoo'VntCtl'SpFanEhSpdAway", 'Linear, setpoint exhaust air AWAY', 'percent'),
+    ('LINEAR_SETPOINT_EXHAUST_AIR_FIRE', 2, 1843, "R(1)'RHvacCoo'VntCtl'SpFanEhSpdFplc", 'Linear, setpoint exhaust air FIRE', 'percent'),
+    ('LINEAR_SETPOINT_EXHAUST_AIR_COOKER', 2, 1844, "R(1)'RHvacCoo'VntCtl'SpFanEhSpdCkr", 'Linear, setpoint exhaust air COOKER', 'percent'),
+    ('GAIN_FOR_VENTILATION_CONTROLLER', 2, 1845, "R(1)'RHvacCoo'VntCtl'GainVntCtr", 'Gain for ventilation controller', '625'),
+    ('PRESENT_B_ALARM_CODE', 2, 1846, "R(1)'RHvacCoo'MntnFnct'PrBalmCode", 'Present B-Alarm code', 'noUnits'),
+    ('OPERATING_HOURS_TOTAL_TIME', 2, 1847, "R(1)'HVAC'AlmBdl'OphDev", 'Operating hours, total time', 'hours'),
+    ('DE_ICING_HUMIDITY_COMP_DELTA', 2, 1849, "R(1)'HVAC'Erc'DiffTHuCmpDeic", 'De-icing, humidity comp. Delta', 'degreesKelvin'),
+    ('BELT_BROKEN_DELTA_B3_B6', 2, 1850, "R(1)'HVAC'Erc'DTRotHxBltFlt", 'Belt broken, delta B3-B6', 'degreesKelvin'),
+    ('TIME_COUNTER_OP_TIME_RMC', 2, 1851, "R(1)'HVAC'Erc'OphErc", 'Time counter, op. time RMC', 'hours'),
+    ('DE_ICING_ROTOR_SPEED', 2, 1852, "R(1)'HVAC'Erc'RotHExgSpdDeic", 'De-icing, rotor speed', 'percent'),
+    ('AIR_QUALITY_PRESENT_FAN_CONTROL', 2, 1869, "R(1)'HVAC'FanSu'FanVntReq", 'Air quality, present fan control', 'percent'),
+    ('HUMIDITY_PRESENT_FAN_CONTROL', 2, 1870, "R(1)'HVAC'FanSu'FanDhuReq", 'Humidity, present fan control', 'percent'),
+    ('DE_ICING_SETPOINT_SUPPLY_FAN_SPEED', 2, 1878, "R(1)'HVAC'FanSu'SpFanSuSpdDeic", 'De-icing, setpoint supply fan speed', 'percent'),
+    ('TIME_COUNTER_OP_TIME_EL_HEATER', 2, 1879, "R(1)'HVAC'Hcl'OphHcl", 'Time counter, op. time - El. heater', 'hours'),
+    ('TIME_COUNTER_STOP', 2, 1913, "R(1)'ROpModDtr'OphStop", 'Time counter, STOP', 'hours'),
+    ('TIME_COUNTER_AWAY', 2, 1914, "R(1)'ROpModDtr'OphAway", 'Time counter, AWAY', 'hours'),
+    ('TIME_COUNTER_HOME', 2, 1915, "R(1)'ROpModDtr'OphHome", 'Time counter, HOME', 'hours'),
+    ('TIME_COUNTER_HIGH', 2, 1916, "R(1)'ROpModDtr'OphHi", 'Time counter, HIGH', 'hours'),
+    ('AIR_QUALITY_MAX_VALUE', 2, 1919, "R(1)'RHvacCoo'AQualRCol'AQualRRs", 'Air quality, max value', 'partsPerMillion'),
+    ('AIR_TEMP_SETPOINT', 2, 1920, "R(1)'RHvacCoo'TCtlH'SpTHrv", 'Air temp., setpoint', 'degreesCelsius'),
+    ('AIR_TEMP_DELTA_SETPOINT_HEATING_HOME', 2, 1921, "R(1)'RHvacCoo'TCtlH'DSpHHome", 'Air temp., delta setpoint heating HOME', 'degreesKelvin'),
+    ('SUPPLY_DELTA_HOME', 2, 1922, "R(1)'RHvacCoo'TCtlH'NzTHrv", 'Supply, delta HOME', 'degreesKelvin'),
+    ('AIR_TEMP_DELTA_SETPOINT_COOLING_HOME', 2, 1926, "R(1)'RHvacCoo'TCtlC'DSpCHome", 'Air temp., delta setpoint cooling HOME', 'degreesKelvin'),
+    ('FREE_COOLING_D_B3_SETPOINT_START', 2, 1933, "R(1)'RHvacCoo'FreeCDtr'HysSpTR", 'Free cooling, d B3-setpoint  start', 'degreesKelvin'),
+    ('OUTSIDE_AIR_TEMP_LIMIT', 2, 1934, "R(1)'RHvacCoo'FreeCDtr'TOaLm", 'Outside air temp.limit', 'degreesCelsius'),
+    ('FREE_COOLING_D_B4_SETPOINT', 2, 1935, "R(1)'RHvacCoo'FreeCDtr'HysTOaLm", 'Free cooling, d B4-setpoint', 'degreesKelvin'),
+    ('FREE_COOLING_DT_B3_B4_START', 2, 1936, "R(1)'RHvacCoo'FreeCDtr'DiffTRTOaSwiOn", 'Free cooling, dT B3-B4 start', 'degreesKelvin'),
+    ('FREE_COOLING_DT_B3_B4_STOP', 2, 1937, "R(1)'RHvacCoo'FreeCDtr'DiffTRTOaSwiOf", 'Free cooling, dT B3-B4 stop', 'degreesKelvin'),
+    ('DE_ICING_SETPOINT_FAN_START', 2, 1938, "R(1)'HVAC'Erc'SpTDeicFan", 'De-icing, setpoint fan start', 'degreesCelsius'),
+    ('DE_ICING_SETPOINT_ROTOR_START', 2, 1939, "R(1)'HVAC'Erc'SpTDeicHExg", 'De-icing, setpoint rotor start', 'degreesCelsius'),
+    ('HEAT_EXCHANGER_SKIP_SPEED_END', 2, 1940, "R(1)'HVAC'Erc'RotHxSkipSpdHi", 'Heat exchanger, skip speed end', 'percent'),
+    ('HEAT_EXCHANGER_SKIP_SPEED_START', 2, 1941, "R(1)'HVAC'Erc'RotHxSkipSpdLo", 'Heat exchanger, skip speed start', 'percent'),
+    ('HEAT_EXCHANGER_RAMP_DOWN_START', 2, 1942, "R(1)'HVAC'Erc'TDeicTiOffStt", 'Heat exchanger, ramp down start', 'degreesCelsius'),
+    ('HEAT_EXCHANGER_RAMP_DOWN_END', 2, 1943, "R(1)'HVAC'Erc'TDeicTiOffEnd", 'Heat exchanger, ramp down end', 'degreesCelsius'),
+    ('TACHO_ALARM_LIMIT_FAN_SPEED', 2, 1948, "R(1)'HVAC'FanSu'FanSpdFbFltLm", 'Tacho, alarm limit fan speed', 'revolutionsPerMinute'),
+    ('DE_ICING_SETPOINT_EXHAUST_FAN_SPEED', 2, 1958, "R(1)'HVAC'FanEh'SpFanEhSpdDeic", 'De-icing, setpoint exhaust fan speed', 'percent'),
+    ('SUPPLY_AIR_SETPOINT_FOR_HEATING', 2, 1977, "R(1)'HVAC'Hcl'SpTSuHcl", 'Supply air, setpoint for heating', 'degreesCelsius'),
+    ('BELT_BROKEN_DELTA_B3_B4', 2, 1978, "R(1)'HVAC'Erc'DiffTExTOaMin", 'Belt broken, delta B3-B4', 'degreesKelvin'),
+    ('DIAGNOSTICS_VALUE', 2, 1983, "R(1)'HVAC'DiagVal", 'Diagnostics value', 'noUnits'),
+    ('HEATING_PRESENT_SETPOINT_SHIFT', 2, 1984, "R(1)'RHvacCoo'TCtlH'PrSpShftH", 'Heating, present setpoint shift', 'degreesKelvin'),
+    ('AIR_TEMP_SETPOINT_AWAY', 2, 1985, "R(1)'RHvacCoo'TCtlH'SpTAway", 'Air temp., setpoint AWAY', 'degreesCelsius'),
+    ('SUPPLY_DELTA_AWAY', 2, 1986, "R(1)'RHvacCoo'TCtlH'NzTAway", 'Supply, delta AWAY', 'degreesKelvin'),
+    ('AIR_TEMP_DELTA_SETPOINT_HEATING_AWAY', 2, 1987, "R(1)'RHvacCoo'TCtlH'DSpHAway", 'Air temp., delta setpoint heating AWAY', 'degreesKelvin'),
+    ('COOLING_PRESENT_SETPOINT_SHIFT', 2, 1991, "R(1)'RHvacCoo'TCtlC'PrSpShftC", 'Cooling, present setpoint shift', 'degreesKelvin'),
+    ('AIR_TEMP_DELTA_SETPOINT_COOLING_AWAY', 2, 1992, "R(1)'RHvacCoo'TCtlC'DSpCAway", 'Air temp., delta setpoint cooling AWAY', 'degreesKelvin'),
+    ('AIR_TEMP_SETPOINT_HOME', 2, 1994, "R(1)'RHvacCoo'TCtlH'SpTHome", 'Air temp., setpoint HOME', 'degreesCelsius'),
+    ('HEATING_COIL_POSITION', 2, 1997, "R(1)'HVAC'HclPos", 'Heating coil position', 'percent'),
+    ('TIME_FOR_TEMPORARY_RAPID_VENTILATION', 2, 2004, "R(1)'ROpUnDev'TiTmpRpdVnt", 'Time for temporary rapid ventilation', 'noUnits'),
+    ('REMAINING_TIME_TEMPORARY_VENTILATION_OP', 2, 2005, "R(1)'ROpUnDev'TiRmgTmpVntOp", 'Remaining time temporary ventilation op.', 'noUnits'),
+    ('PRES_SETP_TEMP_FOR_ROOM_OPERATOR_UNIT', 2, 2006, "R(1)'ROpUnDev'PrSpTRu", 'Pres.setp.temp.for room operator unit', 'degreesCelsius'),
+    ('TIME_FOR_TEMPORARY_FIREPLACE_VENTILATION', 2, 2007, "R(1)'ROpUnDev'TiTmpFplcVnt", 'Time for temporary fireplace ventilation', 'noUnits'),
+    ('ROTATING_HEAT_EXCHANGER_EFFICIENCY', 2, 2023, "R(1)'HVAC'Erc'PrHExgEfcy", 'Rotating heat exchanger, efficiency', 'percent'),
+    ('ALARM_NO_OF_DISPLAYED_ALARMS_IN_LIST', 2, 2025, "R(1)'RHvacCoo'AlmBdl'FltListNum", 'Alarm, no of displayed alarms in list', 'noUnits'),
+    ('ALARM_NO_OF_ALARMS_IN_LIST', 2, 2026, "R(1)'RHvacCoo'AlmBdl'FltCnt", 'Alarm, no of alarms in list', 'noUnits'),
+    ('ALARM_ERROR_CODE', 2, 2027, "R(1)'RHvacCoo'AlmBdl'DspyFltList", 'Alarm, error code', 'noUnits'),
+    ('FAULT_COUNTER_1', 2, 2028, "R(1)'RHvacCoo'AlmBdl'FltCnt1", 'Fault counter 1', 'noUnits'),
+    ('FORCED_VENTILATION_REMAINING_TIME', 2, 2031, "R(1)'RHvacCoo'RpdVntOp'TiRmgRpdVnt", 'Forced ventilation, remaining time', 'minutes'),
+    ('SPEED_FIRE_REMAINING_TIME', 2, 2038, "R(1)'RHvacCoo'FplcVntOp'TiRmgFplcVnt", 'Speed FIRE, remaining time', 'minutes'),
+    ('FAULT_CODE_FOR_ROOM_OPERATOR_UNIT', 2, 2039, "R(1)'ROpUnDev'FltCodeRu", 'Fault code for room operator unit', 'noUnits'),
+    ('MAINTENANCE_CODE_FOR_ROOM_OPERATOR_UNIT', 2, 2040, "R(1)'ROpUnDev'MntnCodeRu", 'Maintenance code for room operator unit', 'noUnits'),
+    ('ROOM_AIR_QUALITY', 2, 2042, "R(1)'Modbus'AQualR(2)", 'Room air quality', 'partsPerMillion'),
+    ('DIAGNOSTICS_FOR_QBM', 2, 2053, "R(1)'PDuctDevQbm'DiagQbm", 'Diagnostics for QBM', 'noUnits'),
+    ('RELATIVE_SETPOINT_F_SUPPLY_AIR_FAN_SPEED', 2, 2064, "R(1)'HVAC'FanSu'SpFanSuSpdRel", 'Relative setpoint f.supply air fan speed', 'percent'),
+    ('FREE_COOLING_SETPOINT_ROOM', 2, 2071, "R(1)'RHvacCoo'TCtlH'SpTRFreeC", 'Free cooling, setpoint room', 'degreesCelsius'),
+    ('SETP_SUPPLY_AIR_TEMP_ROTARY_HEAT_EXCH', 2, 2076, "R(1)'HVAC'Erc'SpTSuRotHExg", 'Setp.supply air temp.rotary heat exch.', 'degreesCelsius'),
+    ('DIAGNOSTICS_BRDG', 2, 2078, "R(1)'ComItfDevBrdg'DiagBrdg", 'Diagnostics BRDG', 'noUnits'),
+    ('DIAGNOSTICS_FAN_NODE', 2, 2080, "R(1)'FanNodeDev'DiagFanNode", 'Diagnostics FAN node', 'noUnits'),
+    ('TIME_FOR_TMP_OP_MODE_OUTP_FOR_RF_SYSTEM', 2, 2081, "R(1)'FanNodeDev'TiTmpOpMOutRfq", 'Time for tmp.op.mode outp.for RF system', 'minutes'),
+    ('DIAGNOSTICS_VMN_1', 2, 2082, "R(1)'PshBtnDevVmn1'DiagVmn1", 'Diagnostics VMN 1', 'noUnits'),
+    ('DIAGNOSTICS_VMN_2', 2, 2083, "R(1)'PshBtnDevVmn2'DiagVmn2", 'Diagnostics VMN 2', 'noUnits'),
+    ('DIAGNOSTICS_VMN_3', 2, 2084, "R(1)'PshBtnDevVmn3'DiagVmn3", 'Diagnostics VMN 3', 'noUnits'),
+    ('DIAGNOSTICS_VMSH_1', 2, 2085, "R(1)'ROpUnDevVmsh1'DiagVmsh1", 'Diagnostics VMSH 1', 'noUnits'),
+    ('DIAGNOSTICS_VMSH_2', 2, 2086, "R(1)'ROpUnDevVmsh2'DiagVmsh2", 'Diagnostics VMSH 2', 'noUnits'),
+    ('DIAGNOSTICS_VMSH_3', 2, 2087, "R(1)'ROpUnDevVmsh3'DiagVmsh3", 'Diagnostics VMSH 3', 'noUnits'),
+    ('DIAGNOSTICS_VMSC', 2, 2088, "R(1)'ROpUnDevVmsc'DiagVmsc", 'Diagnostics VMSC', 'noUnits'),
+    ('DIAGNOSTICS_VMC', 2, 2089, "R(1)'IOExtnDevVmc'DiagVmc", 'Diagnostics VMC', 'noUnits'),
+    ('HUMIDITY_LIMIT_MAX_VALUE', 2, 2090, "R(1)'RHvacCoo'HuRelMax", 'Humidity, limit max value', 'percent'),
+    ('FAN_SPEED_MIN', 2, 2091, "R(1)'HVAC'FanSu'FanSpdMinRel", 'Fan speed,  min', 'percent'),
+    ('PROCESS_VAL_1_FOR_ROOM_AIR_QUAL_ON_BOARD', 2, 2098, "R(1)'PrpyExtdCnf'AQualROnbPrcv1(OnbIO)", 'Process val.1 for room air qual,on-board', 'partsPerMillion'),
+    ('PROCESS_VAL_2_FOR_ROOM_AIR_QUAL_ON_BOARD', 2, 2099, "R(1)'PrpyExtdCnf'AQualROnbPrcv2(OnbIO)", 'Process val.2 for room air qual,on-board', 'partsPerMillion'),
+    ('SIGNAL_VAL_1_FOR_ROOM_AIR_QUAL_ON_BOARD', 2, 2100, "R(1)'PrpyExtdCnf'AQualROnbSigv1(OnbIO)", 'Signal val.1 for room air qual.,on-board', 'volts'),
+    ('SIGNAL_VAL_2_FOR_ROOM_AIR_QUAL_ON_BOARD', 2, 2101, "R(1)'PrpyExtdCnf'AQualROnbSigv2(OnbIO)", 'Signal val.2 for room air qual.,on-board', 'volts'),
+    ('PROCESS_VAL_1_FOR_ROOM_AIR_QUALITY_ECU', 2, 2102, "R(1)'PrpyExtdCnf'AQualREcuPrcv1(Ecu)", 'Process val.1 for room air quality, ECU', 'partsPerMillion'),
+    ('PROCESS_VAL_2_FOR_ROOM_AIR_QUALITY_ECU', 2, 2103, "R(1)'PrpyExtdCnf'AQualREcuPrcv2(Ecu)", 'Process val.2 for room air quality, ECU', 'partsPerMillion'),
+    ('SIGNAL_VALUE_1_FOR_ROOM_AIR_QUALITY_ECU', 2, 2104, "R(1)'PrpyExtdCnf'AQualREcuSigv1(Ecu)", 'Signal value 1 for room air quality, ECU', 'millivolts'),
+    ('SIGNAL_VALUE_2_FOR_ROOM_AIR_QUALITY_ECU', 2, 2105, "R(1)'PrpyExtdCnf'AQualREcuSigv2(Ecu)", 'Signal value 2 for room air quality, ECU', 'millivolts'),
+    ('PROCESS_VAL_1_FOR_REL_HUMIDITY_EXTR_AIR', 2, 2106, "R(1)'PrpyExtdCnf'HuRelExPrcv1", 'Process val.1 for rel.humidity extr.air', 'percentRelativeHumidity'),
+    ('PROCESS_VAL_2_FOR_REL_HUMIDITY_EXTR_AIR', 2, 2107, "R(1)'PrpyExtdCnf'HuRelExPrcv2", 'Process val.2 for rel.humidity extr.air', 'percentRelativeHumidity'),
+    ('SIGNAL_VALUE_1_FOR_REL_HUMIDITY_EXTR_AIR', 2, 2108, "R(1)'PrpyExtdCnf'HuRelExSigv1", 'Signal value 1 for rel.humidity extr.air', 'volts'),
+    ('SIGNAL_VALUE_2_FOR_REL_HUMIDITY_EXTR_AIR', 2, 2109, "R(1)'PrpyExtdCnf'HuRelExSigv2", 'Signal value 2 for rel.humidity extr.air', 'volts'),
+    ('ACTUAL_CONFIGURATION_OF_CONTROL_FUNCT_1', 2, 2113, "R(1)'RHvacCoo'ActlCnfCtl1", 'Actual configuration of control funct.1', 'noUnits'),
+    ('ACTUAL_CONFIGURATION_OF_CONTROL_FUNCT_2', 2, 2114, "R(1)'HVAC'ActlCnfCtl2", 'Actual configuration of control funct.2', 'noUnits'),
+    ('ACTUAL_CONFIGURATION_OF_CONTROL_FUNCT_3', 2, 2115, "R(1)'HVAC'ActlCnfCtl3", 'Actual configuration of control funct.3', 'noUnits'),
+    ('ACTUAL_HARDWARE_CONFIGURATION_1', 2, 2118, "R(1)'HdwCnf'ActlHdwCnf1", 'Actual hardware configuration 1', 'noUnits'),
+    ('ACTUAL_HARDWARE_CONFIGURATION_2', 2, 2119, "R(1)'HdwCnf'ActlHdwCnf2", 'Actual hardware configuration 2', 'noUnits'),
+    ('ACTUAL_HARDWARE_CONFIGURATION_3', 2, 2120, "R(1)'HdwCnf'ActlHdwCnf3", 'Actual hardware configuration 3', 'noUnits'),
+    ('ACTUAL_HARDWARE_CONFIGURATION_4', 2, 2121, "R(1)'HdwCnf'ActlHdwCnf4", 'Actual hardware configuration 4', 'noUnits'),
+    ('ACTUAL_HARDWARE_CONFIGURATION_5', 2, 2122, "R(1)'HdwCnf'ActlHdwCnf5", 'Actual hardware configuration 5', 'noUnits'),
+    ('OPERATING_MODE_INPUT_FROM_RF_SYSTEM', 2, 2125, "R(1)'FanNodeDev'OpModInRfqs", 'Operating mode input from RF system', 'noUnits'),
+    ('ALARM_CODE_2197', 2, 2197, "R(1)'AlmHdl'Alm1001'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2198', 2, 2198, "R(1)'AlmHdl'Alm1002'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2199', 2, 2199, "R(1)'AlmHdl'Alm1003'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2200', 2, 2200, "R(1)'AlmHdl'Alm1004'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2201', 2, 2201, "R(1)'AlmHdl'Alm1005'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2202', 2, 2202, "R(1)'AlmHdl'Alm1006'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2203', 2, 2203, "R(1)'AlmHdl'Alm1007'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2204', 2, 2204, "R(1)'AlmHdl'Alm1008'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2205', 2, 2205, "R(1)'AlmHdl'Alm1009'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2206', 2, 2206, "R(1)'AlmHdl'Alm1010'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2207', 2, 2207, "R(1)'AlmHdl'Alm1011'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2208', 2, 2208, "R(1)'AlmHdl'Alm1020'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2209', 2, 2209, "R(1)'AlmHdl'Alm1032'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2210', 2, 2210, "R(1)'AlmHdl'Alm1033'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2211', 2, 2211, "R(1)'AlmHdl'Alm1034'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2212', 2, 2212, "R(1)'AlmHdl'Alm1035'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2213', 2, 2213, "R(1)'AlmHdl'Alm1040'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2214', 2, 2214, "R(1)'AlmHdl'Alm2001'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2215', 2, 2215, "R(1)'AlmHdl'Alm2002'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2216', 2, 2216, "R(1)'AlmHdl'Alm2003'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2217', 2, 2217, "R(1)'AlmHdl'Alm2004'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2218', 2, 2218, "R(1)'AlmHdl'Alm2005'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2219', 2, 2219, "R(1)'AlmHdl'Alm2007'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2220', 2, 2220, "R(1)'AlmHdl'Alm2010'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2221', 2, 2221, "R(1)'AlmHdl'Alm3001'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2222', 2, 2222, "R(1)'AlmHdl'Alm3002'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2223', 2, 2223, "R(1)'AlmHdl'Alm3003'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2224', 2, 2224, "R(1)'AlmHdl'Alm3004'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2225', 2, 2225, "R(1)'AlmHdl'Alm3006'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2226', 2, 2226, "R(1)'AlmHdl'Alm3007'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2227', 2, 2227, "R(1)'AlmHdl'Alm2008'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2228', 2, 2228, "R(1)'AlmHdl'Alm2009'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2229', 2, 2229, "R(1)'AlmHdl'Alm2011'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2230', 2, 2230, "R(1)'AlmHdl'Alm2014'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2232', 2, 2232, "R(1)'AlmHdl'Alm2016'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2233', 2, 2233, "R(1)'AlmHdl'Alm9001'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2234', 2, 2234, "R(1)'AlmHdl'Alm9002'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2235', 2, 2235, "R(1)'AlmHdl'Alm9003'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2236', 2, 2236, "R(1)'AlmHdl'Alm9004'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2237', 2, 2237, "R(1)'AlmHdl'Alm9005'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2238', 2, 2238, "R(1)'AlmHdl'Alm9006'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2239', 2, 2239, "R(1)'AlmHdl'Alm9007'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2240', 2, 2240, "R(1)'AlmHdl'Alm9008'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2241', 2, 2241, "R(1)'AlmHdl'Alm9009'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2242', 2, 2242, "R(1)'AlmHdl'Alm9010'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2243', 2, 2243, "R(1)'AlmHdl'Alm9011'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2244', 2, 2244, "R(1)'AlmHdl'Alm9012'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2245', 2, 2245, "R(1)'AlmHdl'Alm9013'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2246', 2, 2246, "R(1)'AlmHdl'Alm9014'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2247', 2, 2247, "R(1)'AlmHdl'Alm9015'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2248', 2, 2248, "R(1)'AlmHdl'Alm9016'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2249', 2, 2249, "R(1)'AlmHdl'Alm9017'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2250', 2, 2250, "R(1)'AlmHdl'Alm9018'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2251', 2, 2251, "R(1)'AlmHdl'Alm9019'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2252', 2, 2252, "R(1)'AlmHdl'Alm9020'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2253', 2, 2253, "R(1)'AlmHdl'Alm9021'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2254', 2, 2254, "R(1)'AlmHdl'Alm9022'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2255', 2, 2255, "R(1)'AlmHdl'Alm9023'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2256', 2, 2256, "R(1)'AlmHdl'Alm9024'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2257', 2, 2257, "R(1)'AlmHdl'Alm9025'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2258', 2, 2258, "R(1)'AlmHdl'Alm9026'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2259', 2, 2259, "R(1)'AlmHdl'Alm9027'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2260', 2, 2260, "R(1)'AlmHdl'Alm9028'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2261', 2, 2261, "R(1)'AlmHdl'Alm1022'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2262', 2, 2262, "R(1)'AlmHdl'Alm1023'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2263', 2, 2263, "R(1)'AlmHdl'Alm1024'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2264', 2, 2264, "R(1)'AlmHdl'Alm1025'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2265', 2, 2265, "R(1)'AlmHdl'Alm1026'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2266', 2, 2266, "R(1)'AlmHdl'Alm1027'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2267', 2, 2267, "R(1)'AlmHdl'Alm1028'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2268', 2, 2268, "R(1)'AlmHdl'Alm1029'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2269', 2, 2269, "R(1)'AlmHdl'Alm1030'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2270', 2, 2270, "R(1)'AlmHdl'Alm1036'AlmCode", 'Alarm code', 'noUnits'),
+    ('STATE_1', 2, 2275, "R(1)'HdwCnf'Sta1", 'State 1', 'noUnits'),
+    ('STATE_2', 2, 2276, "R(1)'HdwCnf'Sta2", 'State 2', 'noUnits'),
+    ('STATE_3', 2, 2277, "R(1)'HdwCnf'Sta3", 'State 3', 'noUnits'),
+    ('STATE_4', 2, 2278, "R(1)'HdwCnf'Sta4", 'State 4', 'noUnits'),
+    ('STATE_5', 2, 2279, "R(1)'HdwCnf'Sta5", 'State 5', 'noUnits'),
+    ('STATE_6', 2, 2280, "R(1)'HdwCnf'Sta6", 'State 6', 'noUnits'),
+    ('STATE_7', 2, 2281, "R(1)'HdwCnf'Sta7", 'State 7', 'noUnits'),
+    ('STATE_8', 2, 2282, "R(1)'HdwCnf'Sta8", 'State 8', 'noUnits'),
+    ('STATE_9', 2, 2283, "R(1)'HdwCnf'Sta9", 'State 9', 'noUnits'),
+    ('STATE_10', 2, 2284, "R(1)'HdwCnf'Sta10", 'State 10', 'noUnits'),
+    ('ALARM_CODE_2285', 2, 2285, "R(1)'AlmHdl'Alm2013'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2289', 2, 2289, "R(1)'AlmHdl'Alm2018'AlmCode", 'Alarm code', 'noUnits'),
+    ('ALARM_CODE_2290', 2, 2290, "R(1)'AlmHdl'Alm2019'AlmCode", 'Alarm code', 'noUnits'),
+    ('ROTATING_HEAT_EXCHANGER_SPEED_FEEDBACK', 2, 2293, "R(1)'HVAC'Erc'RotHExgSpdFb", 'Rotating heat exchanger speed feedback', 'noUnits'),
+    ('MOTOR_FAILURE_COUNT', 2, 2294, "R(1)'HVAC'Erc'RotHExgFailCnt", 'Motor failure count', 'noUnits'),
+    ('ALARM_CODE_2297', 2, 2297, "R(1)'AlmHdl'Alm1039'AlmCode", 'Alarm code', 'noUnits'),
+    ('MONITOR_BA_TO_DAQ_VALUE', 2, 2299, 'RotHExgSpdcmdRPM', 'Monitor BA to DAQ value', 'noUnits'),
+    ('MONITOR_HOST_MCU_HAL_SPEED_VALUE', 2, 2300, 'RotHExgSpdABIRPM', 'Monitor host MCU HAL speed value', 'noUnits'),
+    ('MONITOR_HOST_MCU_AND_MOTOR_MCU_COMMUNICATION_COUNT', 2, 2301, 'RotHExgSpdCOMUpCnt', 'Monitor host MCU and motor MCU communication count', 'noUnits'),
+    ('MONITOR_MOTOR_SHORT_LOOP_STATE', 2, 2302, 'RotHExgShortLoopState', 'Monitor motor short loop state', 'noUnits'),
+    ('MONITOR_DRV8305_REGISTER_1', 2, 2303, 'RotHExg8305R1', 'Monitor DRV8305 register 1', 'noUnits'),
+    ('MONITOR_DRV8305_REGISTER_2', 2, 2304, 'RotHExg8305R2', 'Monitor DRV8305 register 2', 'noUnits'),
+    ('MONITOR_DRV8305_REGISTER_3', 2, 2305, 'RotHExg8305R3', 'Monitor DRV8305 register 3', 'noUnits'),
+    ('MONITOR_DRV8305_REGISTER_4', 2, 2306, 'RotHExg8305R4', 'Monitor DRV8305 register 4', 'noUnits'),
+    ('MONITOR_MOTOR_MCU_RUNNING_TIME', 2, 2307, 'RotHExgFWRnTm', 'Monitor Motor MCU running time', 'noUnits'),
+    ('FUME_HOOD_VENTILATION_INPUT', 3, 23, "R(1)'FhVntIn", 'Fume hood ventilation input', None),
+    ('SPEED_AWAY_ACTIVATE_DI', 3, 31, "R(1)'Away", 'Speed AWAY activate DI', None),
+    ('FIRE_THERMOSTAT_STATE', 3, 33, "R(1)'HclOvrTDet", 'Fire thermostat, state', None),
+    ('SPEED_HIGH_ACTIVATE_DI', 3, 82, "R(1)'High", 'Speed HIGH activate DI', None),
+    ('DAMPER_OUTSIDE_AIR', 4, 18, "R(1)'DmpOaCmd", 'Damper, outside air', None),
+    ('ALARM_COMMON_OUTPUT', 4, 20, "R(1)'CmnAlmIndOut", 'Alarm, common output', None),
+    ('COOLING_PUMP_STATE', 4, 71, "R(1)'IOExtnDevEcul'CclPuCmd(1)", 'Cooling, pump state', None),
+    ('FIRE_ALARM', 5, 11, "R(1)'RHvacCoo'SftyCtl'FireAlm", 'Fire alarm', None),
+    ('FORCED_VENTILATION', 5, 15, "R(1)'RHvacCoo'RpdVntOp'RpdVntOp", 'Forced ventilation', None),
+    ('ENABLE_LINEAR_OUTSIDE_TEMP_COMPENSATION', 5, 16, "R(1)'RHvacCoo'TCtlH'EnLinTOaCmp", 'Enable linear outside temp.compensation', None),
+    ('COOL_DOWN_REQUEST', 5, 17, "R(1)'RHvacCoo'PltModDtr'CoolDwnReq", 'Cool down request', None),
+    ('WARM_UP_REQUEST', 5, 18, "R(1)'RHvacCoo'PltModDtr'WarmUpReq", 'Warm-up request', None),
+    ('ROTATING_HEAT_EXCHANGER_DEMAND_MODE', 5, 22, "R(1)'HVAC'Erc'HExgEcmSta", 'Rotating heat exchanger , demand mode', None),
+    ('ROTARY_HEAT_EXCHANGER_AVAILABLE_F_HEAT', 5, 25, "R(1)'HVAC'Erc'RotHExgAvlH", 'Rotary heat exchanger available f.heat.', None),
+    ('ROTARY_HEAT_EXCHANGER_AVAILABLE_F_COOL', 5, 26, "R(1)'HVAC'Erc'RotHExgAvlC", 'Rotary heat exchanger available f.cool.', None),
+    ('HEATING_COIL_AVAILABLE_FOR_HEATING', 5, 38, "R(1)'HVAC'Hcl'HclAvlH", 'Heating coil available for heating', None),
+    ('HOME_AWAY_BUTTON_STATUS', 5, 50, "R(1)'ROpModDtr'CmfBtn", 'HOME/AWAY button status', None),
+    ('DEVICE_MODE', 5, 62, "R(1)'IOExtnDevEcul'DevMod", 'Device mode', None),
+    ('MAINTENANCE_ACTIVATE', 5, 395, "R(1)'HVAC'MntnCmd", 'Maintenance, activate', None),
+    ('FIREPLACE_STATE_DI', 5, 400, "R(1)'RHvacCoo'FplcVntOp'FplcVnt", 'Fireplace, state DI', None),
+    ('COOKER_HOOD_ACTIVATE', 5, 402, "R(1)'RHvacCoo'FhVntOp'FhVnt", 'Cooker hood, activate', None),
+    ('CACADE_CONTROL_SENSOR_SELECTION', 5, 403, "R(1)'RHvacCoo'EnTExCtl", 'Cacade control, sensor selection', None),
+    ('DE_ICING_ROTOR_ACTIVE', 5, 404, "R(1)'HVAC'Erc'DeicReqHExg", 'De-icing, rotor active', None),
+    ('DE_ICING_FAN_ACTIVE', 5, 405, "R(1)'HVAC'Erc'DeicReqFan", 'De-icing, fan active', None),
+    ('DE_ICING_ENABLE', 5, 406, "R(1)'HVAC'Erc'EnDeic", 'De-icing, enable', None),
+    ('FAN_AVAILABLE_FOR_VENTILATION', 5, 409, "R(1)'HVAC'FanSu'FanAvlVnt", 'Fan available for ventilation', None),
+    ('FAN_AVAILABLE_FOR_DEHUMIDIFICATION', 5, 410, "R(1)'HVAC'FanSu'FanAvlDhu", 'Fan available for dehumidification', None),
+    ('TACHO_ENABLE', 5, 428, "R(1)'HVAC'FanSu'EnFanSpdFbIn", 'Tacho, enable', None),
+    ('ZERO_PRESSURE_CALIBRATION_TRIGGER_ECU', 5, 429, "R(1)'IOExtnDevEcul'ZePClbTrgEcu", 'Zero pressure calibration trigger ECU', None),
+    ('FIRE_DAMPER_ALARM', 5, 430, "R(1)'RHvacCoo'SftyCtl'FdpAlm", 'Fire damper, alarm', None),
+    ('DUCT_AIR_TEMPERATURE_FIRE_ALARM', 5, 431, "R(1)'RHvacCoo'SftyCtl'TDuctFireAlm", 'Duct air temperature fire alarm', None),
+    ('EXHAUST_AIR_FAN_FAULT', 5, 434, "R(1)'HVAC'FanEhFlt", 'Exhaust air fan fault', None),
+    ('SUPPLY_AIR_FAN_FAULT', 5, 435, "R(1)'HVAC'FanSuFlt", 'Supply air fan fault', None),
+    ('ENERGY_RECOVERY_BELT_BROKEN', 5, 436, "R(1)'HVAC'ErcBltBrk", 'Energy recovery belt broken', None),
+    ('MAX_ROTARY_HEAT_EXCHANGER_SPEED_STATE', 5, 438, "R(1)'HVAC'Erc'RotHExgSpmaSta", 'Max.rotary heat exchanger speed state', None),
+    ('HEATING_COIL_STATE', 5, 440, "R(1)'HVAC'HclSta", 'Heating coil state', None),
+    ('ELECTRICAL_HEATER_OFF_ON', 5, 445, "R(1)'HVAC'Hcl'EnHclEl", 'Electrical heater, OFF/ON', None),
+    ('RESET_TEMPORARY_VENTILATION_OPERATION', 5, 452, "R(1)'ROpUnDev'RstTmpVntOp", 'Reset temporary ventilation operation', None),
+    ('TEMPORARY_FIREPLACE_VENTILATION', 5, 453, "R(1)'ROpUnDev'TmpFplcVnt", 'Temporary fireplace ventilation', None),
+    ('TEMPORARY_RAPID_VENTILATION', 5, 454, "R(1)'ROpUnDev'TmpRpdVnt", 'Temporary rapid ventilation', None),
+    ('PRESENCE_BUTTON_FOR_ROOM_OPERATOR_UNIT', 5, 455, "R(1)'ROpUnDev'PscBtnRu", 'Presence button for room operator unit', None),
+    ('PRESENCE_BUTTON_INPUT_VALUE', 5, 456, "R(1)'ROpUnDev'PscBtnIn", 'Presence button input value', None),
+    ('ALARM_ACKNOWLEDGEMENT_TYPE_B', 5, 466, "R(1)'RHvacCoo'MntnFnct'BalmAckd", 'Alarm, acknowledgement type B', None),
+    ('FAULT_LIST_RESET', 5, 467, "R(1)'RHvacCoo'AlmBdl'FltListRst", 'Fault list reset', None),
+    ('A_ALARM_ACKNOWLEDGED', 5, 468, "R(1)'RHvacCoo'AlmFnct'AalmAckd", 'A-Alarm acknowledged', None),
+    ('A_ALARM_RESET', 5, 469, "R(1)'RHvacCoo'AlmFnct'AalmRst", 'A-Alarm reset', None),
+    ('ZERO_PRESSURE_CALIBRATION_TRIGGER_QBM', 5, 473, "R(1)'PDuctDevQbm'ZePClbTrgQbm", 'Zero pressure calibration trigger QBM', None),
+    ('SCHEDULER_OVERRIDE', 5, 474, "R(1)'ROpModDtr'SchedRstManCnf", 'Scheduler, override', None),
+    ('FIREPLACE_OR_FUME_HOOD_VENTILATION_INPUT', 5, 475, "R(1)'ROpModDtr'FplcOrFhVntIn", 'Fireplace or fume hood ventilation input', None),
+    ('BACKUP_OF_COMFORT_BUTTON', 5, 476, "R(1)'ROpModDtr'BckpCmfBtn", 'Backup of comfort button', None),
+    ('ENABLE_FREE_COOLING', 5, 478, "R(1)'RHvacCoo'FreeCDtr'EnFreeC", 'Enable free cooling', None),
+    ('CONFIGURATION_FOR_IO_EXTENSION_ECUL', 5, 489, "R(1)'Modbus'IOExtnEcul'IOExtnEculCnf", 'Configuration for IO extension ECUL', None),
+    ('ROT_EXCH_MOTOR_STUCK_STOP_BEFORE_RETRY', 5, 491, "R(1)'PrpyExtdCnf'RoxStopBfRetry", 'Rot.exch.motor stuck, stop before retry', None),
+    ('EMERGENCY_OFF_ACTIVATED', 5, 495, "R(1)'RHvacCoo'AlmBdl'Alm2001", 'Emergency off activated', None),
+    ('SMOKE_DETECTOR_TRIPPED', 5, 496, "R(1)'RHvacCoo'AlmBdl'Alm2002", 'Smoke detector tripped', None),
+    ('CO_DETECTOR_TRIPPED', 5, 497, "R(1)'RHvacCoo'AlmBdl'Alm2003", 'CO detector tripped', None),
+    ('FIRE_ALARM_ACTIVATED', 5, 498, "R(1)'RHvacCoo'AlmBdl'Alm2004", 'Fire alarm activated', None),
+    ('FIRE_DAMPER_POSITION_FEEDBACK_FAULT', 5, 499, "R(1)'RHvacCoo'AlmBdl'Alm1009", 'Fire damper, position feedback fault', None),
+    ('SUPPLY_AIR_TEMP_OPERAT_LIMITS_EXCEEDED', 5, 500, "R(1)'RHvacCoo'AlmBdl'Alm2005", 'Supply air temp., operat.limits exceeded', None),
+    ('SUPPLY_AIR_TEMPERATURE_SENSOR_FAULT', 5, 501, "R(1)'HVAC'AlmBdl'Alm1001", 'Supply air temperature, sensor fault', None),
+    ('FROST_PROT_TEMP_HEAT_COIL_SENSOR_FAULT', 5, 502, "R(1)'HVAC'AlmBdl'Alm1005", 'Frost prot.temp.heat.coil, sensor fault', None),
+    ('SUPPLY_AIR_FAN_SPEED_FEEDBACK_FAULT', 5, 503, "R(1)'HVAC'AlmBdl'Alm1010", 'Supply air fan, speed feedback fault', None),
+    ('EXHAUST_AIR_FAN_SPEED_FEEDBACK_FAULT', 5, 504, "R(1)'HVAC'AlmBdl'Alm1011", 'Exhaust air fan, speed feedback fault', None),
+    ('HEATING_COIL_FROST_WARNING', 5, 505, "R(1)'HVAC'AlmBdl'Alm2007", 'Heating coil, frost warning', None),
+    ('REHEATING_COIL_ZONE_OVERTEMPERATURE', 5, 506, "R(1)'HVAC'AlmBdl'Alm2009", 'Reheating coil zone, overtemperature', None),
+    ('HEATING_COIL_OVERTEMPERATURE', 5, 507, "R(1)'HVAC'AlmBdl'Alm2010", 'Heating coil, overtemperature', None),
+    ('REHEATING_COIL_ZONE_FROST_WARNING', 5, 508, "R(1)'HVAC'AlmBdl'Alm2011", 'Reheating coil zone, frost warning', None),
+    ('HEAT_PUMP_AIR_DAMPER_STOPS_AIR_FLOW', 5, 509, "R(1)'HVAC'AlmBdl'Alm2014", 'Heat pump air damper stops air flow', None),
+    ('FROST_PROT_TEMP_REHEAT_ZONE_SENSOR_FAULT', 5, 510, "R(1)'HVAC'AlmBdl'Alm1029", 'Frost prot.temp.reheat.zone,sensor fault', None),
+    ('OUTSIDE_AIR_TEMPERATURE_SENSOR_FAULT', 5, 511, "R(1)'HVAC'AlmBdl'Alm1004", 'Outside air temperature, sensor fault', None),
+    ('ROTARY_HEAT_EXCHANGER_MOTOR_STUCK', 5, 512, "R(1)'HVAC'AlmBdl'Alm1007", 'Rotary heat exchanger, motor stuck', None),
+    ('ROTARY_HEAT_EXCHANGER_BELT_BROKEN', 5, 513, "R(1)'HVAC'AlmBdl'Alm1008", 'Rotary heat exchanger, belt broken', None),
+    ('HEAT_PUMP_COMMON_ALARM', 5, 514, "R(1)'HVAC'AlmBdl'Alm2015", 'Heat pump, common alarm', None),
+    ('HEAT_PUMP_CONTROLLER_MODBUS_COMM_ERROR', 5, 515, "R(1)'HVAC'AlmBdl'Alm3001", 'Heat pump controller, Modbus comm.error', None),
+    ('I_O_EXTEN_MODULE_1_MODBUS_COMM_ERROR', 5, 516, "R(1)'HVAC'AlmBdl'Alm3002", 'I/O exten.module 1, Modbus comm.error', None),
+    ('I_O_EXTEN_MODULE_2_MODBUS_COMM_ERROR', 5, 517, "R(1)'HVAC'AlmBdl'Alm3003", 'I/O exten.module 2, Modbus comm.error', None),
+    ('DIFF_PRESSURE_SENSOR_MODBUS_COMM_ERROR', 5, 518, "R(1)'HVAC'AlmBdl'Alm3004", 'Diff.pressure sensor, Modbus comm.error', None),
+    ('EXHAUST_AIR_TEMPERATURE_SENSOR_FAULT', 5, 519, "R(1)'HVAC'AlmBdl'Alm1002", 'Exhaust air temperature, sensor fault', None),
+    ('EXTRACT_AIR_TEMPERATURE_SENSOR_FAULT', 5, 520, "R(1)'HVAC'AlmBdl'Alm1003", 'Extract air temperature, sensor fault', None),
+    ('REL_HUMIDITY_EXTRACT_AIR_SENSOR_FAULT', 5, 521, "R(1)'HVAC'AlmBdl'Alm1006", 'Rel.humidity extract air, sensor fault', None),
+    ('AIR_FILTER_POLLUTED', 5, 522, "R(1)'HVAC'AlmBdl'Alm1020", 'Air filter polluted', None),
+    ('ZONE_SUPPLY_AIR_TEMP_SENSOR_FAULT', 5, 523, "R(1)'HVAC'AlmBdl'Alm1030", 'Zone supply air temp., sensor fault', None),
+    ('SUPPLY_AIR_PRESSURE_SENSOR_FAULT', 5, 524, "R(1)'HVAC'AlmBdl'Alm1032", 'Supply air pressure, sensor fault', None),
+    ('EXTRACT_AIR_PRESSURE_SENSOR_FAULT', 5, 525, "R(1)'HVAC'AlmBdl'Alm1033", 'Extract air pressure, sensor fault', None),
+    ('DIFF_PRESS_SUPPLY_AIR_FAN_SENSOR_FAULT', 5, 526, "R(1)'HVAC'AlmBdl'Alm1034", 'Diff.press.supply air fan, sensor fault', None),
+    ('DIFF_PRESS_EXHAUST_AIR_FAN_SENSOR_FAULT', 5, 527, "R(1)'HVAC'AlmBdl'Alm1035", 'Diff.press.exhaust air fan, sensor fault', None),
+    ('RF_INTERFACE_DEVICE_MODBUS_COMM_ERROR', 5, 528, "R(1)'HVAC'AlmBdl'Alm3006", 'RF interface device, Modbus comm.error', None),
+    ('RF_COMMUNICATION_ERROR', 5, 529, "R(1)'HVAC'AlmBdl'Alm3007", 'RF communication error', None),
+    ('RF_DEVICE_BATTERY_LOW', 5, 530, "R(1)'HVAC'AlmBdl'Alm1040", 'RF device, battery low', None),
+    ('DELAY_FOR_AWAY_ACTIVE', 5, 574, "R(1)'ROpModDtr'DlyAwayAct", 'Delay for away active', None),
+    ('NEXT_OPERATING_MODE', 5, 575, "R(1)'ROpUnDev'NxOpMod", 'Next operating mode', None),
+    ('BINARY_CALCULATED_VALUE', 5, 576, "R(1)'ROpModDtr'SchedRstManTrg", 'Binary calculated value', None),
+    ('OUTSIDE_AIR_DAMPER_STOPS_AIR_FLOW', 5, 580, "R(1)'HVAC'AlmBdl'Alm2013", 'Outside air damper stops air flow', None),
+    ('PLANT_SHUTDOWN', 5, 581, "R(1)'HVAC'PltShdn", 'Plant shutdown', None),
+    ('ROTARY_HEAT_EXCH_MOTOR_SHORT_CIRCUIT', 5, 587, "R(1)'HVAC'AlmBdl'Alm1039", 'Rotary heat exch. motor short circuit', None),
+    ('ROTATING_HEAT_EXCHANGER_MOTOR_RESET', 5, 589, "R(1)'HVAC'Erc'RotHExgSpdRst", 'Rotating heat exchanger motor reset', None),
+    ('STOP_RMC_IF_BELTBROKEN', 5, 590, "R(1)'HVAC'Erc'BltBrkStopRMC", 'Stop RMC if Beltbroken', None),
+    ('I_O_BUS_MANAGEMENT', 19, 2, "IOBus'IOBusMgmt", 'I/O bus management', None),
+    ('KNX_PL_LINK_BUS_MANAGEMENT', 19, 4, "PlnkBus'PlnkBusMgmt", 'KNX PL-Link bus management', None),
+    ('ALARM_STATE_TYPE_A', 19, 7, "R(1)'RHvacCoo'AlmFnct'AalmSta", 'Alarm, state type A', None),
+    ('SUPPLY_AIR_TEMPERATURE_STATE', 19, 12, "R(1)'RHvacCoo'SftyCtl'TSuSta", 'Supply air temperature state', None),
+    ('HEATING_COOLING_STATE', 19, 13, "R(1)'RHvacCoo'HCStaDtr'HCSta", 'Heating/cooling state', None),
+    ('PLANT_OPERATING_MODE', 19, 14, "R(1)'RHvacCoo'PltModDtr'PltOpMod", 'Plant operating mode', None),
+    ('AIR_QUALITY_INDICATION', 19, 16, "R(1)'RHvacCoo'AQualRInd", 'Air quality, indication', None),
+    ('HEATING_COOLING_DEMAND', 19, 17, "R(1)'RHvacCoo'HCDmd", 'Heating/cooling demand', None),
+    ('ALARM_STATE_TYPE_B', 19, 18, "R(1)'RHvacCoo'MntnFnct'BalmSta", 'Alarm, state type B', None),
+    ('ACTUAL_VENTILATION_MODE', 19, 19, "R(1)'HVAC'PrPltOpMod", 'Actual ventilation mode', None),
+    ('OUTSIDE_AIR_DAMPER_DEVICE_MODE', 19, 20, "R(1)'HVAC'DmpOa'DmpOaDevMod", 'Outside air damper device mode', None),
+    ('ROTATING_HEAT_EXCHANGER_OPERATING_MODE', 19, 21, "R(1)'HVAC'Erc'RotHExgDevMod", 'Rotating heat exchanger , operating mode', None),
+    ('ELECTRICAL_HEATER_MODE', 19, 26, "R(1)'HVAC'Hcl'HclDevMod", 'Electrical heater mode', None),
+    ('PRESENT_OPERATING_MODE', 19, 41, "R(1)'ROpModDtr'PrOpMod", 'Present operating mode', None),
+    ('PRESENT_VENTILATION_MODE', 19, 42, "R(1)'ROpModDtr'ROpMod", 'Present ventilation mode', None),
+    ('MANUAL_OPERATION_CONDITION', 19, 43, "R(1)'ROpModDtr'ManOpCnd", 'Manual operation condition', None),
+    ('CENTRAL_CONDITION_TRIGGER', 19, 44, "R(1)'ROpModDtr'CenCndTrg", 'Central condition trigger', None),
+    ('COMFORT_CONDITION_TRIGGER', 19, 45, "R(1)'ROpModDtr'CmfCndTrg", 'Comfort condition trigger', None),
+    ('ENERGY_EFFICIENCY_CONDITION_TRIGGER', 19, 46, "R(1)'ROpModDtr'EefCndTrg", 'Energy efficiency condition trigger', None),
+    ('MODBUS_MANAGEMENT', 19, 60, "ModBus'ModBusMgmt", 'Modbus management', None),
+    ('ON_BOARD_MODULE_61', 19, 61, "OnbMdl4UI'OnbMdl", 'On-board module', None),
+    ('ON_BOARD_MODULE_62', 19, 62, "OnbMdl3AO'OnbMdl", 'On-board module', None),
+    ('ON_BOARD_MODULE_63', 19, 63, "OnbMdl4AI1UI'OnbMdl", 'On-board module', None),
+    ('ON_BOARD_MODULE_64', 19, 64, "OnbMdl4BI'OnbMdl", 'On-board module', None),
+    ('ON_BOARD_MODULE_65', 19, 65, "OnbMdl4BO'OnbMdl", 'On-board module', None),
+    ('ON_BOARD_MODULE_66', 19, 66, 'OnbMTR-V000514B0032', 'On-board module', None),
+    ('IO_EXTENSION_MODULE_ECUL', 19, 284, "R(1)'IOExtnDevEcul'IOExtnEcul", 'IO extension module ECUL', None),
+    ('SUPPLY_FAN_OPERATING_MODE', 19, 288, "R(1)'HVAC'FanSu'FanSuDevMod", 'Supply fan, operating mode', None),
+    ('SUPPLY_AIR_FAN_AIR_DEMAND_FOR_PLANT_MODE', 19, 289, "R(1)'HVAC'FanSu'FanSuAirDmd", 'Supply air fan air demand for plant mode', None),
+    ('EXHAUST_FAN_OPERATING_MODE', 19, 293, "R(1)'HVAC'FanEh'FanEhDevMod", 'Exhaust fan, operating mode', None),
+    ('MAINTENANCE_OPERATING_MODE', 19, 294, "R(1)'HVAC'PrMntnSta", 'Maintenance, operating mode', None),
+    ('RELIAB_OF_DIFF_PRESSURE_SUPPLY_AIR_FAN', 19, 295, "R(1)'IOExtnDevEcul'DiffPFanSuRlb", 'Reliab.of diff.pressure supply air fan', None),
+    ('RELIAB_OF_DIFF_PRESSURE_EXHAUST_AIR_FAN', 19, 296, "R(1)'IOExtnDevEcul'DiffPFanEhRlb", 'Reliab.of diff.pressure exhaust air fan', None),
+    ('RELIABILITY_OF_ROOM_AIR_QUALITY', 19, 307, "R(1)'IOExtnDevEcul'AQualRRlb", 'Reliability of room air quality', None),
+    ('TEMPORARY_VENTILATION_OPERATION', 19, 319, "R(1)'ROpUnDev'TmpVntOp", 'Temporary ventilation operation', None),
+    ('ROOM_CLIMATE_OP_MODE_FOR_ROOM_OP_UNIT', 19, 320, "R(1)'ROpUnDev'RClmOpModRu", 'Room climate op.mode for room op.unit', None),
+    ('MAINTENANCE_INDICATION_FOR_ROOM_OP_UNIT', 19, 323, "R(1)'ROpUnDev'MntnIndRu", 'Maintenance indication for room op.unit', None),
+    ('FAULT_INDICATION_FOR_ROOM_OPERATOR_UNIT', 19, 326, "R(1)'ROpUnDev'FltIndRu", 'Fault indication for room operator unit', None),
+    ('ROOM_OPERATOR_UNIT', 19, 327, "R(1)'ROpUnDev'ROpUn", 'Room operator unit', None),
+    ('ROOM_CLIMATE_OPERATING_MODE_INPUT_VALUE', 19, 328, "R(1)'ROpUnDev'RClmOpModIn", 'Room climate operating mode input value', None),
+    ('ALARM_XCU_MODBUS', 19, 333, "R(1)'HVAC'AlmBdl'AlmCnfXcu", 'Alarm, XCU modbus', None),
+    ('ALARM_ECU_MODBUS', 19, 334, "R(1)'HVAC'AlmBdl'AlmCnfEcu", 'Alarm, ECU modbus', None),
+    ('ALARM_ECUL_MODBUS', 19, 335, "R(1)'HVAC'AlmBdl'AlmCnfEcul", 'Alarm, ECUL modbus', None),
+    ('ALARM_QBM_MODBUS', 19, 336, "R(1)'HVAC'AlmBdl'AlmCnfQbm", 'Alarm, QBM modbus', None),
+    ('ALARM_B4_SELECTION', 19, 337, "R(1)'HVAC'AlmBdl'AlmCnfTOa", 'Alarm, B4 selection', None),
+    ('ALARM_HEAT_EXCHANGER_SELECTION', 19, 338, "R(1)'HVAC'AlmBdl'AlmCnfRotHExg", 'Alarm, heat exchanger selection', None),
+    ('ALARM_HP_SELECTION', 19, 339, "R(1)'HVAC'AlmBdl'AlmCnfHpu", 'Alarm, HP selection', None),
+    ('ALARM_INDICATION_TYPE_B', 19, 340, "R(1)'RHvacCoo'MntnFnct'BalmInd", 'Alarm, indication type B', None),
+    ('ALARM_ACKNOWLEDGEMENT_STATE_TYPE_B', 19, 341, "R(1)'RHvacCoo'MntnFnct'BalmAck", 'Alarm, acknowledgement state type B', None),
+    ('ALARM_OPERATION_OF_ALARMS_LIST', 19, 342, "R(1)'RHvacCoo'AlmBdl'FltListOp", 'Alarm, operation of alarms list', None),
+    ('ALARM_INDICATION_TYPE_A', 19, 343, "R(1)'RHvacCoo'AlmFnct'AalmInd", 'Alarm, indication type A', None),
+    ('ALARM_ACKNOWLEDGEMENT_STATE_TYPE_A', 19, 344, "R(1)'RHvacCoo'AlmFnct'AalmAck", 'Alarm, acknowledgement state type A', None),
+    ('CONTROL_PANEL_FAULT_STATE', 19, 345, "R(1)'ROpUnDev'FltStaRu", 'Control panel, fault state', None),
+    ('FAULT_ACKNOWLEDGEMENT_INPUT', 19, 346, "R(1)'ROpUnDev'FltAckIn", 'Fault acknowledgement input', None),
+    ('MAINTENANCE_STATE_FOR_ROOM_OPERATOR_UNIT', 19, 347, "R(1)'ROpUnDev'MntnStaRu", 'Maintenance state for room operator unit', None),
+    ('MAINTENANCE_ACKNOWLEDGEMENT_INPUT', 19, 348, "R(1)'ROpUnDev'MntnAckIn", 'Maintenance acknowledgement input', None),
+    ('RELIAB_OF_SUPPLY_AIR_TEMP_AF_HEAT_EXCH', 19, 349, "R(1)'IOExtnDevEcul'TSuAfHExgRlb", 'Reliab.of supply air temp.af.heat exch.', None),
+    ('DUCT_PRESSURE_SENSOR_QBM', 19, 352, "R(1)'PDuctDevQbm'PDuctQbm", 'Duct pressure sensor QBM', None),
+    ('RELIABILITY_OF_SUPPLY_AIR_PRESSURE', 19, 353, "R(1)'PDuctDevQbm'PSuRlb", 'Reliability of supply air pressure', None),
+    ('RELIABILITY_OF_EXTRACT_AIR_PRESSURE', 19, 354, "R(1)'PDuctDevQbm'PExRlb", 'Reliability of extract air pressure', None),
+    ('FORCED_VENTILATION_STATE', 19, 357, "R(1)'RHvacCoo'RpdVntOp'TmpRpdVntTrg", 'Forced ventilation, state', None),
+    ('SPEED_FIRE_TRIGGER_APP', 19, 360, "R(1)'RHvacCoo'FplcVntOp'TmpFplcVntTrg", 'Speed FIRE, trigger APP', None),
+    ('ROTATING_HEAT_EXCHANGER_STATE', 19, 361, "R(1)'ROpModDtr'HrvSta", 'Rotating heat exchanger, state', None),
+    ('COMMUNICATION_INTERFACE_BRDG', 19, 364, "R(1)'ComItfDevBrdg'ComItfBrdg", 'Communication interface BRDG', None),
+    ('COMMUNICATION_STATE_RF_SYSTEM', 19, 365, "R(1)'ComItfDevBrdg'ComStaRfqs", 'Communication state RF system', None),
+    ('BATTERY_STATE_RF_SYSTEM', 19, 366, "R(1)'ComItfDevBrdg'BattStaRfqs", 'Battery state RF system', None),
+    ('FAULT_STATE_RF_SYSTEM', 19, 367, "R(1)'ComItfDevBrdg'FltStaRfqs", 'Fault state RF system', None),
+    ('REMOVE_RF_DEVICE', 19, 368, "R(1)'ComItfDevBrdg'RmvRfqDev", 'Remove RF device', None),
+    ('CONNECTED_RF_DEVICE_1', 19, 369, "R(1)'ComItfDevBrdg'CnctdRfqDev1", 'Connected RF device 1', None),
+    ('CONNECTED_RF_DEVICE_2', 19, 370, "R(1)'ComItfDevBrdg'CnctdRfqDev2", 'Connected RF device 2', None),
+    ('CONNECTED_RF_DEVICE_3', 19, 371, "R(1)'ComItfDevBrdg'CnctdRfqDev3", 'Connected RF device 3', None),
+    ('CONNECTED_RF_DEVICE_4', 19, 372, "R(1)'ComItfDevBrdg'CnctdRfqDev4", 'Connected RF device 4', None),
+    ('CONNECTED_RF_DEVICE_5', 19, 373, "R(1)'ComItfDevBrdg'CnctdRfqDev5", 'Connected RF device 5', None),
+    ('CONNECTED_RF_DEVICE_6', 19, 374, "R(1)'ComItfDevBrdg'CnctdRfqDev6", 'Connected RF device 6', None),
+    ('CONNECTED_RF_DEVICE_7', 19, 375, "R(1)'ComItfDevBrdg'CnctdRfqDev7", 'Connected RF device 7', None),
+    ('CONNECTED_RF_DEVICE_8', 19, 376, "R(1)'ComItfDevBrdg'CnctdRfqDev8", 'Connected RF device 8', None),
+    ('CONNECTED_RF_DEVICE_9', 19, 377, "R(1)'ComItfDevBrdg'CnctdRfqDev9", 'Connected RF device 9', None),
+    ('CONNECTED_RF_DEVICE_10', 19, 378, "R(1)'ComItfDevBrdg'CnctdRfqDev10", 'Connected RF device 10', None),
+    ('RF_DEVICE_ADDRESS_OUTPUT', 19, 379, "R(1)'ComItfDevBrdg'RfqDevAddrOut", 'RF device address output', None),
+    ('RF_DEVICE_ADDRESS_INPUT', 19, 381, "R(1)'ComItfDevBrdg'RfqDevAddrIn", 'RF device address input', None),
+    ('BINDING_STATE_INPUT', 19, 382, "R(1)'ComItfDevBrdg'BdgStaIn", 'Binding state input', None),
+    ('FAN_NODE', 19, 384, "R(1)'FanNodeDev'FanNode", 'FAN node', None),
+    ('OPERATING_MODE_OUTPUT_FOR_RF_SYSTEM', 19, 386, "R(1)'FanNodeDev'OpModOutRfqs", 'Operating mode output for RF system', None),
+    ('BINDING_COMMAND', 19, 387, "R(1)'FanNodeDev'BdgCmd", 'Binding command', None),
+    ('PUSHBUTTON_VMN_1', 19, 388, "R(1)'PshBtnDevVmn1'PshBtnVmn1", 'Pushbutton VMN 1', None),
+    ('BATTERY_STATE_VMN_1', 19, 389, "R(1)'PshBtnDevVmn1'BattStaVmn1", 'Battery state VMN 1', None),
+    ('PUSHBUTTON_VMN_2', 19, 390, "R(1)'PshBtnDevVmn2'PshBtnVmn2", 'Pushbutton VMN 2', None),
+    ('BATTERY_STATE_VMN_2', 19, 391, "R(1)'PshBtnDevVmn2'BattStaVmn2", 'Battery state VMN 2', None),
+    ('PUSHBUTTON_VMN_3', 19, 392, "R(1)'PshBtnDevVmn3'PshBtnVmn3", 'Pushbutton VMN 3', None),
+    ('BATTERY_STATE_VMN_3', 19, 393, "R(1)'PshBtnDevVmn3'BattStaVmn3", 'Battery state VMN 3', None),
+    ('ROOM_OPERATOR_UNIT_VMSH_1', 19, 394, "R(1)'ROpUnDevVmsh1'ROpUnVmsh1", 'Room operator unit VMSH 1', None),
+    ('BATTERY_STATE_VMSH_1', 19, 395, "R(1)'ROpUnDevVmsh1'BattStaVmsh1", 'Battery state VMSH 1', None),
+    ('ROOM_OPERATOR_UNIT_VMSH_2', 19, 396, "R(1)'ROpUnDevVmsh2'ROpUnVmsh2", 'Room operator unit VMSH 2', None),
+    ('BATTERY_STATE_VMSH_2', 19, 397, "R(1)'ROpUnDevVmsh2'BattStaVmsh2", 'Battery state VMSH 2', None),
+    ('ROOM_OPERATOR_UNIT_VMSH_3', 19, 398, "R(1)'ROpUnDevVmsh3'ROpUnVmsh3", 'Room operator unit VMSH 3', None),
+    ('BATTERY_STATE_VMSH_3', 19, 399, "R(1)'ROpUnDevVmsh3'BattStaVmsh3", 'Battery state VMSH 3', None),
+    ('ROOM_OPERATOR_UNIT_VMSC', 19, 400, "R(1)'ROpUnDevVmsc'ROpUnVmsc", 'Room operator unit VMSC', None),
+    ('I_O_EXTENSION_MODULE_VMC', 19, 401, "R(1)'IOExtnDevVmc'IOExtnVmc", 'I/O extension module VMC', None),
+    ('ALARM_ACKNOWLEDGEMENT', 19, 434, "R(1)'AlmHdl'AlmAck", 'Alarm acknowledgement', None),
+    ('ALARM_STATE_435', 19, 435, "R(1)'AlmHdl'Alm1001'AlmSta", 'Alarm state', None),
+    ('ALARM_TYPE_436', 19, 436, "R(1)'AlmHdl'Alm1001'AlmType", 'Alarm type', None),
+    ('ALARM_STATE_437', 19, 437, "R(1)'AlmHdl'Alm1002'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_438', 19, 438, "R(1)'AlmHdl'Alm1002'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_439', 19, 439, "R(1)'AlmHdl'Alm1003'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_440', 19, 440, "R(1)'AlmHdl'Alm1003'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_441', 19, 441, "R(1)'AlmHdl'Alm1004'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_442', 19, 442, "R(1)'AlmHdl'Alm1004'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_443', 19, 443, "R(1)'AlmHdl'Alm1005'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_444', 19, 444, "R(1)'AlmHdl'Alm1005'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_445', 19, 445, "R(1)'AlmHdl'Alm1006'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_446', 19, 446, "R(1)'AlmHdl'Alm1006'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_447', 19, 447, "R(1)'AlmHdl'Alm1007'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_448', 19, 448, "R(1)'AlmHdl'Alm1007'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_449', 19, 449, "R(1)'AlmHdl'Alm1008'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_450', 19, 450, "R(1)'AlmHdl'Alm1008'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_451', 19, 451, "R(1)'AlmHdl'Alm1009'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_452', 19, 452, "R(1)'AlmHdl'Alm1009'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_453', 19, 453, "R(1)'AlmHdl'Alm1010'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_454', 19, 454, "R(1)'AlmHdl'Alm1010'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_455', 19, 455, "R(1)'AlmHdl'Alm1011'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_456', 19, 456, "R(1)'AlmHdl'Alm1011'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_457', 19, 457, "R(1)'AlmHdl'Alm1020'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_458', 19, 458, "R(1)'AlmHdl'Alm1020'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_459', 19, 459, "R(1)'AlmHdl'Alm1032'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_460', 19, 460, "R(1)'AlmHdl'Alm1032'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_461', 19, 461, "R(1)'AlmHdl'Alm1033'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_462', 19, 462, "R(1)'AlmHdl'Alm1033'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_463', 19, 463, "R(1)'AlmHdl'Alm1034'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_464', 19, 464, "R(1)'AlmHdl'Alm1034'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_465', 19, 465, "R(1)'AlmHdl'Alm1035'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_466', 19, 466, "R(1)'AlmHdl'Alm1035'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_467', 19, 467, "R(1)'AlmHdl'Alm1040'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_468', 19, 468, "R(1)'AlmHdl'Alm1040'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_469', 19, 469, "R(1)'AlmHdl'Alm2001'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_470', 19, 470, "R(1)'AlmHdl'Alm2001'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_471', 19, 471, "R(1)'AlmHdl'Alm2002'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_472', 19, 472, "R(1)'AlmHdl'Alm2002'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_473', 19, 473, "R(1)'AlmHdl'Alm2003'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_474', 19, 474, "R(1)'AlmHdl'Alm2003'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_475', 19, 475, "R(1)'AlmHdl'Alm2004'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_476', 19, 476, "R(1)'AlmHdl'Alm2004'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_477', 19, 477, "R(1)'AlmHdl'Alm2005'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_478', 19, 478, "R(1)'AlmHdl'Alm2005'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_479', 19, 479, "R(1)'AlmHdl'Alm2007'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_480', 19, 480, "R(1)'AlmHdl'Alm2007'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_481', 19, 481, "R(1)'AlmHdl'Alm2010'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_482', 19, 482, "R(1)'AlmHdl'Alm2010'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_483', 19, 483, "R(1)'AlmHdl'Alm3001'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_484', 19, 484, "R(1)'AlmHdl'Alm3001'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_485', 19, 485, "R(1)'AlmHdl'Alm3002'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_486', 19, 486, "R(1)'AlmHdl'Alm3002'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_487', 19, 487, "R(1)'AlmHdl'Alm3003'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_488', 19, 488, "R(1)'AlmHdl'Alm3003'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_489', 19, 489, "R(1)'AlmHdl'Alm3004'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_490', 19, 490, "R(1)'AlmHdl'Alm3004'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_491', 19, 491, "R(1)'AlmHdl'Alm3006'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_492', 19, 492, "R(1)'AlmHdl'Alm3006'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_493', 19, 493, "R(1)'AlmHdl'Alm3007'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_494', 19, 494, "R(1)'AlmHdl'Alm3007'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_495', 19, 495, "R(1)'AlmHdl'Alm2008'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_496', 19, 496, "R(1)'AlmHdl'Alm2008'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_497', 19, 497, "R(1)'AlmHdl'Alm2009'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_498', 19, 498, "R(1)'AlmHdl'Alm2009'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_499', 19, 499, "R(1)'AlmHdl'Alm2011'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_500', 19, 500, "R(1)'AlmHdl'Alm2011'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_501', 19, 501, "R(1)'AlmHdl'Alm2014'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_502', 19, 502, "R(1)'AlmHdl'Alm2014'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_505', 19, 505, "R(1)'AlmHdl'Alm2016'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_506', 19, 506, "R(1)'AlmHdl'Alm2016'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_507', 19, 507, "R(1)'AlmHdl'Alm9001'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_508', 19, 508, "R(1)'AlmHdl'Alm9001'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_509', 19, 509, "R(1)'AlmHdl'Alm9002'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_510', 19, 510, "R(1)'AlmHdl'Alm9002'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_511', 19, 511, "R(1)'AlmHdl'Alm9003'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_512', 19, 512, "R(1)'AlmHdl'Alm9003'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_513', 19, 513, "R(1)'AlmHdl'Alm9004'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_514', 19, 514, "R(1)'AlmHdl'Alm9004'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_515', 19, 515, "R(1)'AlmHdl'Alm9005'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_516', 19, 516, "R(1)'AlmHdl'Alm9005'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_517', 19, 517, "R(1)'AlmHdl'Alm9006'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_518', 19, 518, "R(1)'AlmHdl'Alm9006'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_519', 19, 519, "R(1)'AlmHdl'Alm9007'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_520', 19, 520, "R(1)'AlmHdl'Alm9007'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_521', 19, 521, "R(1)'AlmHdl'Alm9008'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_522', 19, 522, "R(1)'AlmHdl'Alm9008'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_523', 19, 523, "R(1)'AlmHdl'Alm9009'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_524', 19, 524, "R(1)'AlmHdl'Alm9009'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_525', 19, 525, "R(1)'AlmHdl'Alm9010'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_526', 19, 526, "R(1)'AlmHdl'Alm9010'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_527', 19, 527, "R(1)'AlmHdl'Alm9011'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_528', 19, 528, "R(1)'AlmHdl'Alm9011'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_529', 19, 529, "R(1)'AlmHdl'Alm9012'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_530', 19, 530, "R(1)'AlmHdl'Alm9012'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_531', 19, 531, "R(1)'AlmHdl'Alm9013'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_532', 19, 532, "R(1)'AlmHdl'Alm9013'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_533', 19, 533, "R(1)'AlmHdl'Alm9014'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_534', 19, 534, "R(1)'AlmHdl'Alm9014'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_535', 19, 535, "R(1)'AlmHdl'Alm9015'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_536', 19, 536, "R(1)'AlmHdl'Alm9015'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_537', 19, 537, "R(1)'AlmHdl'Alm9016'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_538', 19, 538, "R(1)'AlmHdl'Alm9016'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_539', 19, 539, "R(1)'AlmHdl'Alm9017'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_540', 19, 540, "R(1)'AlmHdl'Alm9017'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_541', 19, 541, "R(1)'AlmHdl'Alm9018'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_542', 19, 542, "R(1)'AlmHdl'Alm9018'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_543', 19, 543, "R(1)'AlmHdl'Alm9019'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_544', 19, 544, "R(1)'AlmHdl'Alm9019'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_545', 19, 545, "R(1)'AlmHdl'Alm9020'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_546', 19, 546, "R(1)'AlmHdl'Alm9020'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_547', 19, 547, "R(1)'AlmHdl'Alm9021'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_548', 19, 548, "R(1)'AlmHdl'Alm9021'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_549', 19, 549, "R(1)'AlmHdl'Alm9022'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_550', 19, 550, "R(1)'AlmHdl'Alm9022'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_551', 19, 551, "R(1)'AlmHdl'Alm9023'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_552', 19, 552, "R(1)'AlmHdl'Alm9023'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_553', 19, 553, "R(1)'AlmHdl'Alm9024'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_554', 19, 554, "R(1)'AlmHdl'Alm9024'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_555', 19, 555, "R(1)'AlmHdl'Alm9025'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_556', 19, 556, "R(1)'AlmHdl'Alm9025'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_557', 19, 557, "R(1)'AlmHdl'Alm9026'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_558', 19, 558, "R(1)'AlmHdl'Alm9026'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_559', 19, 559, "R(1)'AlmHdl'Alm9027'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_560', 19, 560, "R(1)'AlmHdl'Alm9027'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_561', 19, 561, "R(1)'AlmHdl'Alm9028'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_562', 19, 562, "R(1)'AlmHdl'Alm9028'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_563', 19, 563, "R(1)'AlmHdl'Alm1022'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_564', 19, 564, "R(1)'AlmHdl'Alm1022'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_565', 19, 565, "R(1)'AlmHdl'Alm1023'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_566', 19, 566, "R(1)'AlmHdl'Alm1023'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_567', 19, 567, "R(1)'AlmHdl'Alm1024'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_568', 19, 568, "R(1)'AlmHdl'Alm1024'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_569', 19, 569, "R(1)'AlmHdl'Alm1025'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_570', 19, 570, "R(1)'AlmHdl'Alm1025'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_571', 19, 571, "R(1)'AlmHdl'Alm1026'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_572', 19, 572, "R(1)'AlmHdl'Alm1026'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_573', 19, 573, "R(1)'AlmHdl'Alm1027'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_574', 19, 574, "R(1)'AlmHdl'Alm1027'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_575', 19, 575, "R(1)'AlmHdl'Alm1028'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_576', 19, 576, "R(1)'AlmHdl'Alm1028'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_577', 19, 577, "R(1)'AlmHdl'Alm1029'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_578', 19, 578, "R(1)'AlmHdl'Alm1029'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_579', 19, 579, "R(1)'AlmHdl'Alm1030'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_580', 19, 580, "R(1)'AlmHdl'Alm1030'AlmType", 'Multistate calculated value', None),
+    ('ALARM_STATE_581', 19, 581, "R(1)'AlmHdl'Alm1036'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_582', 19, 582, "R(1)'AlmHdl'Alm1036'AlmType", 'Multistate calculated value', None),
+    ('NEXT_ROOM_OPERATING_MODE', 19, 583, "R(1)'ROpUnDev'NxROpMod", 'Next room operating mode', None),
+    ('ROOM_OP_MODE_DETERM_FOR_ROOM_OP_UNIT', 19, 584, "R(1)'ROpUnDev'ROpModDtrRu", 'Room op.mode determ.for room op.unit', None),
+    ('TEMPORARY_ROOM_OPERATING_MODE_INPUT', 19, 585, "R(1)'ROpUnDev'TmpROpModIn", 'Temporary room operating mode input', None),
+    ('ALARM_STATE_605', 19, 605, "R(1)'AlmHdl'Alm2013'AlmSta", 'Alarm state', None),
+    ('ALARM_TYPE_606', 19, 606, "R(1)'AlmHdl'Alm2013'AlmType", 'Alarm type', None),
+    ('ALARM_STATE_607', 19, 607, "R(1)'AlmHdl'Alm2018'AlmSta", 'Alarm state', None),
+    ('ALARM_TYPE_608', 19, 608, "R(1)'AlmHdl'Alm2018'AlmType", 'Alarm type', None),
+    ('ALARM_STATE_609', 19, 609, "R(1)'AlmHdl'Alm2019'AlmSta", 'Alarm state', None),
+    ('ALARM_TYPE_610', 19, 610, "R(1)'AlmHdl'Alm2019'AlmType", 'Alarm type', None),
+    ('ALARM_STATE_611', 19, 611, "R(1)'AlmHdl'Alm1039'AlmSta", 'Alarm state', None),
+    ('MULTISTATE_CALCULATED_VALUE_612', 19, 612, "R(1)'AlmHdl'Alm1039'AlmType", 'Multistate calculated value', None),
+    ('AIR_FILTER_REPLACE_TIMER_RESET', 19, 613, "R(1)'HVAC'AlmBdl'FilRpcRst", 'Air filter replace timer reset', None),
+    ('ALARM_CONFIG_FOR_FAN_SPEED_FEEDBACK', 19, 614, "R(1)'HVAC'AlmBdl'AlmCnfFanFb", 'Alarm config.for fan speed feedback', None),
+    ('DEVICE_LOW_POWER', 19, 617, "R(1)'HdwCnf'DevLwPwr", 'Device low power', None),
+    ('MOTOR_MANUAL_RESET', 19, 618, "R(1)'HVAC'Erc'MotorManRst", 'Motor manual reset', None),
+    ('MONITOR_MOTOR_MCU_STATE', 19, 619, 'RotHExgSpdState', 'Monitor motor MCU state', None),
+)
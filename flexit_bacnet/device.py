@@ -1,7 +1,107 @@
-from typing import Any, Optional
+import asyncio
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from flexit_bacnet import bacnet
 from flexit_bacnet.nordic import *
+from flexit_bacnet.cache import CachedDevice, DeviceCache
+from flexit_bacnet.profile import (
+    DEFAULT_PROBE_INTERVAL,
+    DEFAULT_PROBE_SAMPLES,
+    PointProfile,
+    ProfileCache,
+    probe,
+    unsupported_points,
+)
+from flexit_bacnet.retry import DEFAULT_RETRY_POLICY, RetryPolicy
+from flexit_bacnet.scheduler import PollScheduler
+from flexit_bacnet.state import DeviceStateStore, StateLayout
+
+
+class WriteRefresh(IntEnum):
+    """How the local state is refreshed after writing a value to the device."""
+
+    # re-read all device properties
+    FULL = 0
+
+    # re-read only the written property
+    POINT = 1
+
+    # assume the written value was accepted, without reading it back
+    OPTIMISTIC = 2
+
+
+# part of the COV subscription lifetime after which the subscription is renewed
+COV_RENEWAL_RATIO = 0.8
+
+# part of the COV subscription lifetime after which a failed renewal is retried
+COV_RETRY_RATIO = 0.05
+
+# slots of all known properties, shared by the state of every device
+STATE_LAYOUT = StateLayout(DEVICE_PROPERTIES)
+
+# values collected by the open batch_write() of each device, in the current task only,
+# so values set concurrently from other tasks are not absorbed into the batch
+_WRITE_BATCHES: ContextVar[Dict["FlexitBACnet", List[Tuple[DeviceProperty, Any]]]] = ContextVar(
+    "write_batches", default={}
+)
+
+
+class PropertyChange(NamedTuple):
+    """Change of a single value in the local device state."""
+
+    object_identifier: bacnet.ObjectIdentifier
+    read_value: bacnet.ReadValue
+
+    # the value published with the previous change (or first read)
+    old_value: Any
+    new_value: Any
+
+
+class Deadband(NamedTuple):
+    """Minimal change of an analog value, which is published as a PropertyChange.
+
+    A change is published only if it exceeds both the absolute deadband
+    and the relative one (a fraction of the previously published value).
+    """
+
+    absolute: float = 0.0
+    relative: float = 0.0
+
+    def exceeded(self, old_value: float, new_value: float) -> bool:
+        return abs(new_value - old_value) > max(self.absolute, self.relative * abs(old_value))
+
+
+def _model(serial_number: str) -> str:
+    """Return Nordic model of the serial number, e.g.: S2 REL."""
+    try:
+        model_id = int(serial_number[0:6])
+    except ValueError:
+        return ''
+
+    return NORDIC_MODELS.get(model_id, '')
+
+
+def _check_shared_options(options: Dict[str, Any]) -> None:
+    """Raise ValueError for the arguments, which cannot be shared by several devices."""
+    if options.get("scheduler") is not None:
+        raise ValueError(
+            "a scheduler keeps the poll schedule of a single device, pass scheduler_factory"
+        )
 
 
 class FlexitBACnet:
@@ -10,24 +110,395 @@ class FlexitBACnet:
         device_address: str,
         device_id: int,
         port: int = bacnet.DEFAULT_BACNET_PORT,
+        max_in_flight: int = bacnet.DEFAULT_MAX_IN_FLIGHT,
+        transport: Optional[bacnet.BACnetTransport] = None,
+        write_refresh: WriteRefresh = WriteRefresh.FULL,
+        deferred_refresh_delay: Optional[float] = None,
+        scheduler: Optional[PollScheduler] = None,
+        deadbands: Optional[Dict[DeviceProperty, Deadband]] = None,
+        points: Optional[Sequence[DeviceProperty]] = None,
+        probe_points: bool = False,
+        probe_samples: int = DEFAULT_PROBE_SAMPLES,
+        probe_interval: float = DEFAULT_PROBE_INTERVAL,
+        profile_cache: Optional[ProfileCache] = None,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        max_apdu_length: int = bacnet.MAX_APDU_LENGTH,
+        device_cache: Optional[DeviceCache] = None,
     ) -> None:
-        self.bacnet = bacnet.BACnetClient(device_address, port)
+        """Create a Flexit Nordic device.
+
+        write_refresh -- how the local state is refreshed after each write.
+        deferred_refresh_delay -- with POINT or OPTIMISTIC write refresh, run a single
+                                  full refresh this many seconds after the last write.
+        scheduler -- read only the properties due in each update() cycle,
+                     instead of all of them.
+        deadbands -- deadbands of analog values, smaller changes are not published.
+        points -- additional properties read in each update(), e.g. from the point catalog.
+        probe_points -- find the points not supported by the device in the first update(),
+                        and stop reading them (their value is 0).
+        probe_samples, probe_interval -- number of reads of the sensors read as zeros, and
+                                         seconds between them; the reads following the
+                                         first one run in the background.
+        profile_cache -- store the probed points, to skip probing on the next start.
+        retry_policy -- timeouts and retries of the requests not answered in time.
+        max_apdu_length -- largest APDU accepted by the device.
+        device_cache -- use what is known about the device until the first update(),
+                        and store what is learned about it.
+        """
+        self.bacnet = bacnet.BACnetClient(
+            device_address,
+            port,
+            max_in_flight,
+            transport,
+            max_apdu_length=max_apdu_length,
+            retry_policy=retry_policy,
+        )
         self.device_id = device_id
-        self._state: Optional[bacnet.DeviceState] = None
-
-    @property
-    def _device_property(self) -> DeviceProperty:
-        return DeviceProperty(
+        self.write_refresh = write_refresh
+        self.deferred_refresh_delay = deferred_refresh_delay
+        self.scheduler = scheduler
+        self.probe_points = probe_points
+        self.probe_samples = probe_samples
+        self.probe_interval = probe_interval
+        self.profile_cache = profile_cache
+        self.profile: Optional[PointProfile] = None
+        self.device_cache = device_cache
+        self._cached: Optional[CachedDevice] = None
+        self._state: Optional[DeviceStateStore] = None
+        self._deferred_refresh: Optional[asyncio.TimerHandle] = None
+        self._deferred_refresh_task: Optional[asyncio.Task] = None
+        self._listeners: List[Callable[[PropertyChange], None]] = []
+
+        # last published values, changes are detected against them
+        self._published: Dict[Tuple[bacnet.ObjectIdentifier, bacnet.ReadValue], Any] = {}
+
+        # called with every value recorded as published, including first reads (see ShardedFleet)
+        self._recorded: Optional[
+            Callable[[bacnet.ObjectIdentifier, bacnet.ReadValue, Any], None]
+        ] = None
+        self._deadbands: Dict[bacnet.ObjectIdentifier, Deadband] = {}
+
+        for device_property, deadband in (deadbands or {}).items():
+            self.set_deadband(device_property, deadband)
+        self._subscriptions: List[DeviceProperty] = []
+        self._subscription_task: Optional[asyncio.Task] = None
+
+        # properties the device refused to subscribe to, they are only kept current by update()
+        self.rejected_subscriptions: List[DeviceProperty] = []
+
+        # loop time at which the current state was requested, and at which the last write finished
+        self._updated_at = float("-inf")
+        self._written_at = float("-inf")
+
+        # refresh shared by all concurrent update() calls, and the loop time it was started at
+        self._update_task: Optional[asyncio.Future] = None
+        self._update_started_at = float("-inf")
+
+        # probe of the sensors read as zeros, sampled in the background
+        self._probe_task: Optional[asyncio.Future] = None
+
+        # the same property instances are used for every poll, so the encoded request can be reused
+        self._device_property = DeviceProperty(
             ObjectType.DEVICE,
-            self.device_id,
+            device_id,
             read_values=[bacnet.ReadValue.OBJECT_NAME, bacnet.ReadValue.DESCRIPTION],
         )
+        self._device_properties: List[DeviceProperty] = []
+
+        # properties read in each update(), without the ones not supported by the device
+        self._polled_properties: List[DeviceProperty] = []
+        self.add_points(points or [])
+
+        if device_cache is not None:
+            cached = device_cache.get(device_address, port)
+
+            # the profile is validated against the serial number with the first update()
+            if cached is not None and cached.device_id == device_id:
+                self._cached = cached
+                self._set_profile(cached.profile)
+
+    @classmethod
+    def from_discovered(cls, device: bacnet.DiscoveredDevice, **kwargs: Any) -> "FlexitBACnet":
+        """Create the device found by discover_devices(), sized to its max APDU length."""
+        return cls(
+            device.address,
+            device.device_id,
+            port=device.port,
+            max_apdu_length=min(device.max_apdu_length, bacnet.MAX_APDU_LENGTH),
+            **kwargs,
+        )
+
+    @classmethod
+    def from_cache(
+        cls,
+        device_cache: DeviceCache,
+        scheduler_factory: Optional[Callable[[], PollScheduler]] = None,
+        **kwargs: Any,
+    ) -> List["FlexitBACnet"]:
+        """Create all devices stored in the cache, without any request to them.
+
+        scheduler_factory -- creates the scheduler of each device, e.g. PollScheduler.
+        kwargs -- arguments of every device, see FlexitBACnet.
+        """
+        _check_shared_options(kwargs)
+
+        return [
+            cls(
+                cached.address,
+                cached.device_id,
+                port=cached.port,
+                max_apdu_length=cached.max_apdu_length,
+                device_cache=device_cache,
+                scheduler=scheduler_factory() if scheduler_factory is not None else None,
+                **kwargs,
+            )
+            for cached in device_cache
+        ]
+
+    def add_points(self, device_properties: Sequence[DeviceProperty]) -> None:
+        """Read the additional properties in each update(), see get_value()."""
+        points = [dp for dp in self._device_properties if dp is not self._device_property]
+        points += device_properties
+
+        # a point of the catalog and the same point defined here may differ in the priority
+        # of their writes, which does not matter for reading them: each value is read once,
+        # by the first property reading it, so the points defined here (and used by the
+        # setters) win over the added ones
+        read_values: Set[Tuple[bacnet.ObjectIdentifier, bacnet.ReadValue]] = set()
+        self._device_properties = []
+
+        for dp in DEVICE_PROPERTIES + points + [self._device_property]:
+            values = {(dp.object_identifier, read_value) for read_value in dp.read_values}
+
+            if not values <= read_values:
+                read_values |= values
+                self._device_properties.append(dp)
+
+        self._set_profile(self.profile)
+
+    def _set_profile(self, profile: Optional[PointProfile]) -> None:
+        self.profile = profile
+
+        if profile is None:
+            self._polled_properties = self._device_properties
+        else:
+            self._polled_properties = [dp for dp in self._device_properties if profile.supports(dp)]
+
+    def get_value(
+        self,
+        device_property: DeviceProperty,
+        read_value: Optional[bacnet.ReadValue] = None,
+    ) -> Any:
+        """Return the value of any property read with update(), e.g. added with add_points()."""
+        return self._get_value(device_property, read_value)
+
+    async def open(self) -> None:
+        """Keep a single connection to the device open until close() is called."""
+        await self.bacnet.open()
+
+    async def close(self) -> None:
+        """Close the connection opened with open()."""
+        if self._deferred_refresh is not None:
+            self._deferred_refresh.cancel()
+            self._deferred_refresh = None
+
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+
+        # subscriptions are left to expire on the device
+        self._stop_subscriptions()
+
+        await self.bacnet.close()
+
+    async def __aenter__(self) -> "FlexitBACnet":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def update(self, max_age: Optional[float] = None) -> None:
+        """Refresh local device state.
+
+        Concurrent calls share a single request to the device.
+
+        max_age -- return without a refresh, if the state is not older than this many seconds.
+        """
+        if max_age is not None and self._state is not None:
+            if asyncio.get_running_loop().time() - self._updated_at <= max_age:
+                return
+
+        await self._coalesced_update()
+
+    async def _coalesced_update(self, not_before: Optional[float] = None) -> None:
+        """Join the refresh in flight, unless it was started before not_before (loop time)."""
+        task = self._update_task
+
+        if task is None or (not_before is not None and self._update_started_at < not_before):
+            self._update_started_at = asyncio.get_running_loop().time()
+            task = self._update_task = asyncio.ensure_future(self._update(self._update_started_at))
+            task.add_done_callback(self._update_done)
+
+        # a cancelled caller must not cancel the refresh shared with the others
+        await asyncio.shield(task)
+
+    def _update_done(self, task: asyncio.Future) -> None:
+        if self._update_task is task:
+            self._update_task = None
+
+        # the error is raised to the callers, retrieve it in case all of them were cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _update(self, started_at: float) -> None:
+        # sensors read as zeros are probed again after a while, they may have been fitted since
+        probing = (
+            self.probe_points
+            and self._probe_task is None
+            and (self.profile is None or self.profile.needs_probe(started_at))
+        )
+
+        if probing and self.profile is not None and self.profile.absent:
+            self._set_profile(self.profile.without_absent())
+
+        if self.scheduler is None or self._state is None or probing:
+            device_properties = self._polled_properties
+        else:
+            device_properties = self.scheduler.due(self._polled_properties)
+
+        # property access errors are only needed to probe the points
+        errors: Optional[bacnet.PropertyErrors] = {} if probing else None
+
+        state = (
+            await self.bacnet.read_multiple(device_properties, errors) if device_properties else {}
+        )
+
+        if self.scheduler is not None:
+            self.scheduler.record(state)
+
+        # a refresh started before the last write (or a newer refresh) would revert newer values
+        if started_at >= self._updated_at and started_at >= self._written_at:
+            if self._state is None:
+                self._state = DeviceStateStore(STATE_LAYOUT)
+            elif device_properties is self._polled_properties:
+                self._state.clear()
+
+            self._state.update(state)
+
+            self._updated_at = started_at
+            self._publish_changes(state)
+
+        if self._device_property.object_identifier in state:
+            self._device_info_received(state)
+
+        if errors is not None:
+            await self._load_profile(state, errors)
+
+        if self.device_cache is not None and self._device_property.object_identifier in state:
+            self._update_cache(state)
+
+    def _merge_state(self, state: bacnet.DeviceState) -> None:
+        """Merge values read by another process (see ShardedFleet) into the local state."""
+        if self._state is None:
+            self._state = DeviceStateStore(STATE_LAYOUT)
+
+        self._state.update(state)
+
+        self._updated_at = asyncio.get_running_loop().time()
+        self._publish_changes(state)
+
+    def _device_info_received(self, state: bacnet.DeviceState) -> None:
+        serial_number = self._device_info(state, bacnet.ReadValue.DESCRIPTION)
+
+        # a different unit responds at the address, e.g. after replacement
+        if self.profile is not None and self.profile.serial_number != serial_number:
+            self._set_profile(None)
+
+    def _device_info(self, state: bacnet.DeviceState, read_value: bacnet.ReadValue) -> str:
+        value = dict(state[self._device_property.object_identifier]).get(read_value)
+
+        return value if isinstance(value, str) else ""
+
+    def _update_cache(self, state: bacnet.DeviceState) -> None:
+        serial_number = self._device_info(state, bacnet.ReadValue.DESCRIPTION)
+
+        cached = CachedDevice(
+            address=self.bacnet.address,
+            device_id=self.device_id,
+            port=self.bacnet.port,
+            max_apdu_length=self.bacnet.max_apdu_length,
+            device_name=self._device_info(state, bacnet.ReadValue.OBJECT_NAME),
+            serial_number=serial_number,
+            model=_model(serial_number),
+            unsupported=tuple(sorted(self.profile.unsupported)) if self.profile else None,
+        )
+
+        if cached != self._cached:
+            self._cached = cached
+            self.device_cache.add(cached)
+            self.device_cache.save_soon()
+
+    async def _load_profile(self, state: bacnet.DeviceState, errors: bacnet.PropertyErrors) -> None:
+        """Probe the points, the unknown ones may be known from the stored profile already.
+
+        The unknown points are not read from now on, the sensors read as zeros are sampled
+        in the background, so the update() is not delayed by the probe interval.
+        """
+        loop = asyncio.get_running_loop()
+
+        serial_number = self._device_info(state, bacnet.ReadValue.DESCRIPTION)
+
+        profile = self.profile
+        if profile is None and self.profile_cache is not None and serial_number:
+            profile = await loop.run_in_executor(None, self.profile_cache.load, serial_number)
+
+        stored = profile.unsupported if profile is not None else None
+
+        # not probed yet, so the sensors read as zeros are polled until the probe finishes
+        self._set_profile(PointProfile(serial_number, unsupported_points(errors, stored or ())))
+
+        self._probe_task = asyncio.ensure_future(self._probe(state, errors, stored))
+        self._probe_task.add_done_callback(self._probe_done)
+
+    async def _probe(
+        self,
+        state: bacnet.DeviceState,
+        errors: bacnet.PropertyErrors,
+        stored: Optional[Set[bacnet.ObjectIdentifier]],
+    ) -> None:
+        serial_number = self._device_info(state, bacnet.ReadValue.DESCRIPTION)
+
+        profile = await probe(
+            self.bacnet,
+            serial_number,
+            self._device_properties,
+            state,
+            errors,
+            self.probe_samples,
+            self.probe_interval,
+            unsupported=stored or (),
+        )
+
+        # a different unit responds at the address now, it is probed with the next update()
+        if self.profile is None or self.profile.serial_number != serial_number:
+            return
+
+        if self.profile_cache is not None and serial_number and profile.unsupported != stored:
+            await asyncio.get_running_loop().run_in_executor(None, self.profile_cache.save, profile)
 
-    async def update(self) -> None:
-        """Refresh local device state."""
-        device_properties = DEVICE_PROPERTIES + [self._device_property]
+        self._set_profile(profile)
 
-        self._state = await self.bacnet.read_multiple(device_properties)
+        if self.device_cache is not None:
+            self._update_cache(state)
+
+    def _probe_done(self, task: asyncio.Future) -> None:
+        if self._probe_task is task:
+            self._probe_task = None
+
+        # the profile is left unprobed, so the probe is repeated with the next update()
+        if not task.cancelled() and task.exception() is not None and bacnet.DEBUG:
+            print(f"probing the points failed: {task.exception()!r}")
 
     def _get_value(
         self,
@@ -41,16 +512,321 @@ class FlexitBACnet:
         if value_name is None:
             value_name = bacnet.ReadValue.PRESENT_VALUE
 
-        return dict(self._state[device_property.object_identifier])[value_name]
+        try:
+            return self._state.get(device_property.object_identifier, value_name)
+        except KeyError:
+            # points not supported by the device are not read
+            if self.profile is not None and not self.profile.supports(device_property):
+                return 0
+
+            raise
 
     async def _set_value(self, device_property: DeviceProperty, value: Any) -> None:
+        batch = _WRITE_BATCHES.get().get(self)
+        if batch is not None:
+            batch.append((device_property, value))
+            return
+
         await self.bacnet.write(device_property, value)
-        await self.update()
+        await self._refresh_after_write([(device_property, value)])
+
+    @asynccontextmanager
+    async def batch_write(self) -> AsyncIterator[None]:
+        """Collect all values set within the context and write them in a single request.
+
+        Values are written in the order they were set, when the context exits without an error.
+        Only values set by the current task are collected.
+        """
+        batches = _WRITE_BATCHES.get()
+        if self in batches:
+            # nested batch, values are written by the outermost one
+            yield
+            return
+
+        values: List[Tuple[DeviceProperty, Any]] = []
+        token = _WRITE_BATCHES.set({**batches, self: values})
+
+        try:
+            yield
+        finally:
+            _WRITE_BATCHES.reset(token)
+
+        if len(values) == 1:
+            await self.bacnet.write(*values[0])
+        elif values:
+            await self.bacnet.write_multiple(values)
+
+        if values:
+            await self._refresh_after_write(values)
+
+    async def _refresh_after_write(self, values: List[Tuple[DeviceProperty, Any]]) -> None:
+        self._written_at = asyncio.get_running_loop().time()
+
+        # the written values are read back, even if they were not due yet
+        if self.scheduler is not None:
+            self.scheduler.touch([dp for dp, _ in values])
+
+        if self.write_refresh == WriteRefresh.FULL or self._state is None:
+            await self._coalesced_update(not_before=self._written_at)
+            return
+
+        if self.write_refresh == WriteRefresh.POINT:
+            device_properties = list({id(dp): dp for dp, _ in values}.values())
+            state = await self.bacnet.read_multiple(device_properties)
+            self._state.update(state)
+            self._publish_changes(state)
+        else:
+            for device_property, value in values:
+                self._patch_value(device_property, value)
+
+        self._schedule_deferred_refresh()
+
+    def _patch_value(self, device_property: DeviceProperty, value: Any) -> None:
+        """Update present value in the local state, as if it was read from the device."""
+        if device_property.object_type in (
+            ObjectType.ANALOG_INPUT,
+            ObjectType.ANALOG_OUTPUT,
+            ObjectType.ANALOG_VALUE,
+        ):
+            value = float(value)
+        else:
+            value = int(value)
+
+        self._set_state_values(
+            device_property.object_identifier, [(bacnet.ReadValue.PRESENT_VALUE, value)]
+        )
+
+    def _set_state_values(
+        self,
+        object_identifier: bacnet.ObjectIdentifier,
+        values: bacnet.ObjectProperties,
+    ) -> None:
+        """Set values of a single object in the local state and publish the changes."""
+        self._state.set_values(object_identifier, values)
+        self._publish_changes({object_identifier: values})
+
+    def set_deadband(self, device_property: DeviceProperty, deadband: Optional[Deadband]) -> None:
+        """Set (or remove, if None) deadband of the property's analog values."""
+        if deadband is None:
+            self._deadbands.pop(device_property.object_identifier, None)
+        else:
+            self._deadbands[device_property.object_identifier] = deadband
+
+    def add_listener(self, listener: Callable[[PropertyChange], None]) -> None:
+        """Call the listener with every change of the local state, read or pushed by the device."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[PropertyChange], None]) -> None:
+        self._listeners.remove(listener)
+
+    async def changes(self) -> AsyncIterator[PropertyChange]:
+        """Iterate over changes of the local state, read or pushed by the device."""
+        queue: asyncio.Queue = asyncio.Queue()
+
+        self.add_listener(queue.put_nowait)
+
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.remove_listener(queue.put_nowait)
+
+    def _publish_changes(self, state: bacnet.DeviceState) -> None:
+        """Publish values which changed (beyond their deadband) since they were last published.
+
+        Values seen for the first time are recorded, but not published.
+        """
+        changes = []
+        recorded = self._recorded
+
+        for object_identifier, properties in state.items():
+            deadband = self._deadbands.get(object_identifier)
+
+            for read_value, value in properties:
+                key = (object_identifier, read_value)
+
+                if key not in self._published:
+                    self._published[key] = value
+
+                    if recorded is not None:
+                        recorded(object_identifier, read_value, value)
+                    continue
+
+                old_value = self._published[key]
+
+                if old_value == value:
+                    continue
+
+                if (
+                    deadband is not None
+                    and isinstance(value, float)
+                    and isinstance(old_value, float)
+                    and not deadband.exceeded(old_value, value)
+                ):
+                    continue
+
+                self._published[key] = value
+                changes.append(PropertyChange(object_identifier, read_value, old_value, value))
+
+                if recorded is not None:
+                    recorded(object_identifier, read_value, value)
+
+        for change in changes:
+            for listener in list(self._listeners):
+                listener(change)
+
+    def _cov_notification_received(self, notification: bacnet.COVNotification) -> None:
+        if self._state is None:
+            return
+
+        self._set_state_values(notification.object_identifier, notification.values)
+
+    async def subscribe(
+        self,
+        device_properties: Optional[List[DeviceProperty]] = None,
+        lifetime: int = bacnet.DEFAULT_COV_LIFETIME,
+        confirmed: bool = False,
+    ) -> None:
+        """Keep the local state current from COV notifications pushed by the device.
+
+        Subscriptions are renewed in the background until unsubscribe() or close() is called.
+
+        Properties the device refuses to subscribe to are listed in rejected_subscriptions,
+        they are still read by update().
+
+        device_properties -- properties to subscribe to, all polled properties by default.
+        lifetime -- subscription lifetime in seconds.
+        confirmed -- request confirmed notifications instead of unconfirmed ones.
+        """
+        await self.unsubscribe()
+
+        if self._state is None:
+            await self.update()
+
+        if device_properties is None:
+            # the device object and the points not supported by the device have no COV
+            device_properties = [
+                dp for dp in self._polled_properties if dp is not self._device_property
+            ]
+
+        if not device_properties:
+            return
+
+        self._subscriptions = list(device_properties)
+        self.rejected_subscriptions = []
+        self.bacnet.add_cov_listener(self._cov_notification_received)
+
+        try:
+            errors = await self._subscribe_all(lifetime, confirmed)
+        except BaseException:
+            self._stop_subscriptions()
+            raise
+
+        # nothing was subscribed to, e.g. the device is not reachable
+        if errors and len(errors) == len(device_properties):
+            self._stop_subscriptions()
+            raise errors[0]
+
+        self._subscription_task = asyncio.ensure_future(
+            self._renew_subscriptions(lifetime, confirmed)
+        )
+
+    async def unsubscribe(self) -> None:
+        """Cancel COV subscriptions made with subscribe()."""
+        subscriptions = self._subscriptions
+
+        self._stop_subscriptions()
+
+        # best effort, the subscriptions expire anyway
+        await asyncio.gather(
+            *[self.bacnet.unsubscribe_cov(dp) for dp in subscriptions],
+            return_exceptions=True,
+        )
+
+    def _stop_subscriptions(self) -> None:
+        if self._subscription_task is not None:
+            self._subscription_task.cancel()
+            self._subscription_task = None
+
+        self.bacnet.remove_cov_listener(self._cov_notification_received)
+
+        self._subscriptions = []
+        self.rejected_subscriptions = []
+
+    async def _subscribe_all(self, lifetime: int, confirmed: bool) -> List[Exception]:
+        """(Re)subscribe to all properties, and return errors of the failed subscriptions.
+
+        Properties refused by the device are moved to rejected_subscriptions, the others
+        are retried with the next renewal.
+        """
+        subscriptions = self._subscriptions
+        results = await asyncio.gather(
+            *[self.bacnet.subscribe_cov(dp, confirmed, lifetime) for dp in subscriptions],
+            return_exceptions=True,
+        )
+
+        errors = []
+
+        for device_property, result in zip(subscriptions, results):
+            if not isinstance(result, Exception):
+                continue
+
+            errors.append(result)
+
+            if isinstance(result, bacnet.BACnetError):
+                self.rejected_subscriptions.append(device_property)
+
+        self._subscriptions = [
+            dp for dp in self._subscriptions if dp not in self.rejected_subscriptions
+        ]
+
+        return errors
+
+    async def _renew_subscriptions(self, lifetime: int, confirmed: bool) -> None:
+        delay = lifetime * COV_RENEWAL_RATIO
+
+        while True:
+            await asyncio.sleep(delay)
+
+            errors = await self._subscribe_all(lifetime, confirmed)
+
+            # the subscriptions which failed to renew are retried sooner, all of them again
+            if any(not isinstance(error, bacnet.BACnetError) for error in errors):
+                delay = lifetime * COV_RETRY_RATIO
+            else:
+                delay = lifetime * COV_RENEWAL_RATIO
+
+    def _schedule_deferred_refresh(self) -> None:
+        """(Re)schedule a full refresh, so a burst of writes results in a single update."""
+        if self.deferred_refresh_delay is None:
+            return
+
+        if self._deferred_refresh is not None:
+            self._deferred_refresh.cancel()
+
+        self._deferred_refresh = asyncio.get_running_loop().call_later(
+            self.deferred_refresh_delay, self._run_deferred_refresh
+        )
+
+    def _run_deferred_refresh(self) -> None:
+        self._deferred_refresh = None
+        self._deferred_refresh_task = asyncio.ensure_future(self.update())
+
+        # the refresh is best effort, failures are picked up by the next update()
+        self._deferred_refresh_task.add_done_callback(
+            lambda task: task.cancelled() or task.exception()
+        )
 
     @property
     def device_name(self) -> str:
         """Return device name, e.g.: Flexit Nordic"""
-        device_name_from_device = self._get_value(self._device_property, bacnet.ReadValue.OBJECT_NAME)
+        if self._state is None and self._cached is not None:
+            device_name_from_device = self._cached.device_name
+        else:
+            device_name_from_device = self._get_value(
+                self._device_property, bacnet.ReadValue.OBJECT_NAME
+            )
+
         device_name = DEVICE_NAMES.get(device_name_from_device)
 
         if not isinstance(device_name, str):
@@ -61,7 +837,10 @@ class FlexitBACnet:
     @property
     def serial_number(self) -> str:
         """Return device's serial number, e.g.: 800220-000000."""
-        serial_number = self._get_value(self._device_property, bacnet.ReadValue.DESCRIPTION)
+        if self._state is None and self._cached is not None:
+            serial_number = self._cached.serial_number
+        else:
+            serial_number = self._get_value(self._device_property, bacnet.ReadValue.DESCRIPTION)
 
         if not isinstance(serial_number, str):
             return ''
@@ -71,12 +850,7 @@ class FlexitBACnet:
     @property
     def model(self) -> str:
         """Return device's model, e.g.: S2 REL."""
-        try:
-            model_id = int(self.serial_number[0:6])
-        except ValueError:
-            return ''
-
-        return NORDIC_MODELS.get(model_id, '')
+        return _model(self.serial_number)
 
     @property
     def outside_air_temperature(self) -> float:
@@ -156,8 +930,9 @@ class FlexitBACnet:
         if delay < 0 or delay > 600:
             raise ValueError("delay must be between 0 and 600 minutes")
 
-        await self._set_value(COMFORT_BUTTON_DELAY, delay)
-        await self._set_value(COMFORT_BUTTON, COMFORT_BUTTON_INACTIVE)
+        async with self.batch_write():
+            await self._set_value(COMFORT_BUTTON_DELAY, delay)
+            await self._set_value(COMFORT_BUTTON, COMFORT_BUTTON_INACTIVE)
 
     @property
     def operation_mode(self) -> int:
@@ -211,8 +986,9 @@ class FlexitBACnet:
 
         minutes -- duration of fireplace ventilation in minutes (1 - 360)
         """
-        await self.set_fireplace_mode_runtime(minutes)
-        await self.trigger_fireplace_mode()
+        async with self.batch_write():
+            await self.set_fireplace_mode_runtime(minutes)
+            await self.trigger_fireplace_mode()
 
     async def set_fireplace_mode_runtime(self, minutes: int) -> None:
         """Set runtime duration for the fireplace ventilation mode.
@@ -245,8 +1021,9 @@ class FlexitBACnet:
 
         minutes -- duration of rapid ventilation in minutes (1 - 360)
         """
-        await self._set_value(RAPID_VENTILATION_RUNTIME, minutes)
-        await self._set_value(RAPID_VENTILATION, RAPID_VENTILATION_TRIGGER)
+        async with self.batch_write():
+            await self._set_value(RAPID_VENTILATION_RUNTIME, minutes)
+            await self._set_value(RAPID_VENTILATION, RAPID_VENTILATION_TRIGGER)
 
     @property
     def rapid_ventilation_remaining_duration(self) -> int:
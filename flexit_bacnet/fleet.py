@@ -0,0 +1,320 @@
+"""Polling of many devices on a fixed cadence.
+
+Each cycle updates all devices, with at most a given number of refreshes in flight.
+Start times of the devices are spread over a part of the interval, so the devices
+(and the network) are not hit all at once, and a cycle still running when the next
+one is due causes the next one to be skipped.
+"""
+import asyncio
+import random
+from enum import IntEnum
+from typing import AsyncIterator, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from .device import FlexitBACnet
+
+DEFAULT_INTERVAL = 60.0
+DEFAULT_CONCURRENCY = 64
+DEFAULT_DEADLINE = 10.0
+
+# part of the interval over which start times of the devices are spread
+DEFAULT_JITTER = 0.5
+
+
+class PollStatus(IntEnum):
+    OK = 0
+
+    # not refreshed before the deadline, or not answered after all retries
+    TIMEOUT = 1
+
+    # refresh failed, e.g. the device responded with an error
+    ERROR = 2
+
+    # refresh from an earlier cycle is still in flight
+    SKIPPED = 3
+
+
+class PollResult(NamedTuple):
+    device: FlexitBACnet
+    status: PollStatus
+
+    # seconds spent waiting for a free slot, and refreshing the device
+    wait: float = 0.0
+    latency: Optional[float] = None
+
+    error: Optional[BaseException] = None
+
+
+class CycleSummary(NamedTuple):
+    cycle: int
+
+    # loop time at which the cycle was due, and seconds until its last device was polled
+    started_at: float
+    duration: float
+
+    results: Tuple[PollResult, ...]
+
+    # cycles skipped before this one, because the previous cycle was still running
+    skipped_cycles: int = 0
+
+    # worker process of a ShardedFleet, which polled the devices
+    shard: int = 0
+
+    def count(self, status: PollStatus) -> int:
+        return sum(1 for result in self.results if result.status == status)
+
+    @property
+    def ok(self) -> int:
+        return self.count(PollStatus.OK)
+
+    @property
+    def timeouts(self) -> int:
+        return self.count(PollStatus.TIMEOUT)
+
+    @property
+    def errors(self) -> int:
+        return self.count(PollStatus.ERROR)
+
+    @property
+    def skipped(self) -> int:
+        return self.count(PollStatus.SKIPPED)
+
+    def latency(self, percentile: float = 50.0) -> Optional[float]:
+        """Return the latency percentile of the devices refreshed successfully."""
+        latencies = sorted(r.latency for r in self.results if r.status == PollStatus.OK)
+        if not latencies:
+            return None
+
+        index = round(percentile / 100 * (len(latencies) - 1))
+        return latencies[min(max(index, 0), len(latencies) - 1)]
+
+
+def _call_listeners(listeners: List[Callable[[CycleSummary], None]], summary: CycleSummary) -> None:
+    """Call each listener, a failing one is reported to the event loop and the rest are called."""
+    for listener in list(listeners):
+        try:
+            listener(summary)
+        except Exception as exc:
+            asyncio.get_running_loop().call_exception_handler(
+                {
+                    "message": f"fleet listener {listener!r} failed",
+                    "exception": exc,
+                }
+            )
+
+
+class FlexitFleet:
+    def __init__(
+        self,
+        devices: Sequence[FlexitBACnet] = (),
+        interval: float = DEFAULT_INTERVAL,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        deadline: float = DEFAULT_DEADLINE,
+        jitter: float = DEFAULT_JITTER,
+    ):
+        """Create a fleet of devices, polled every interval seconds once started.
+
+        concurrency -- largest number of devices refreshed at once.
+        deadline -- seconds a device has to be refreshed in, once its refresh started.
+        jitter -- part of the interval over which start times of the devices are spread.
+        """
+        if interval <= 0 or concurrency < 1 or deadline <= 0 or not 0 <= jitter <= 1:
+            raise ValueError("invalid fleet polling parameters")
+
+        self.interval = interval
+        self.concurrency = concurrency
+        self.deadline = deadline
+        self.jitter = jitter
+
+        # start offset of each device within the cycle, as a part of the spread
+        self._devices: Dict[FlexitBACnet, float] = {}
+
+        # refreshes still in flight after their deadline
+        self._in_flight: Dict[FlexitBACnet, asyncio.Future] = {}
+
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._listeners: List[Callable[[CycleSummary], None]] = []
+        self._task: Optional[asyncio.Task] = None
+        self._cycle = 0
+
+        for device in devices:
+            self.add(device)
+
+    @property
+    def devices(self) -> List[FlexitBACnet]:
+        return list(self._devices)
+
+    def add(self, device: FlexitBACnet) -> None:
+        """Poll the device from the next cycle on."""
+        if device not in self._devices:
+            self._devices[device] = random.random()
+
+    def remove(self, device: FlexitBACnet) -> None:
+        """Stop polling the device, a refresh in flight is finished."""
+        self._devices.pop(device, None)
+
+    def add_listener(self, listener: Callable[[CycleSummary], None]) -> None:
+        """Call the listener with the summary of every cycle."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[CycleSummary], None]) -> None:
+        self._listeners.remove(listener)
+
+    async def summaries(self) -> AsyncIterator[CycleSummary]:
+        """Iterate over summaries of the cycles."""
+        queue: asyncio.Queue = asyncio.Queue()
+
+        self.add_listener(queue.put_nowait)
+
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self.remove_listener(queue.put_nowait)
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start polling the devices every interval seconds, until stop() is called."""
+        if not self.is_running:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling, the cycle in progress is cancelled.
+
+        Refreshes in flight are shared with other callers of update(), so they are finished.
+        """
+        if self._task is None:
+            return
+
+        task, self._task = self._task, None
+        task.cancel()
+
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+        if self._in_flight:
+            await asyncio.wait(list(self._in_flight.values()))
+
+    async def __aenter__(self) -> "FlexitFleet":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    async def poll(self) -> CycleSummary:
+        """Poll all devices once, without spreading their start times."""
+        return await self._poll_cycle(asyncio.get_running_loop().time(), 0.0, 0)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        due_at = loop.time()
+        cycle: Optional[asyncio.Future] = None
+        skipped_cycles = 0
+
+        try:
+            while True:
+                if cycle is not None and not cycle.done():
+                    skipped_cycles += 1
+                else:
+                    cycle = asyncio.ensure_future(
+                        self._publish_cycle(due_at, self.jitter * self.interval, skipped_cycles)
+                    )
+                    skipped_cycles = 0
+
+                # the cadence is kept, even if the loop was late
+                due_at += self.interval
+                while due_at < loop.time():
+                    due_at += self.interval
+                    skipped_cycles += 1
+
+                await asyncio.sleep(due_at - loop.time())
+        finally:
+            if cycle is not None:
+                cycle.cancel()
+
+                # the cancelled polls record the refreshes they leave in flight
+                await asyncio.wait([cycle])
+
+    async def _publish_cycle(self, due_at: float, spread: float, skipped_cycles: int) -> None:
+        summary = await self._poll_cycle(due_at, spread, skipped_cycles)
+        _call_listeners(self._listeners, summary)
+
+    async def _poll_cycle(self, due_at: float, spread: float, skipped_cycles: int) -> CycleSummary:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        cycle = self._cycle
+        self._cycle += 1
+
+        results = await asyncio.gather(
+            *[
+                self._poll_device(device, due_at + offset * spread)
+                for device, offset in list(self._devices.items())
+            ]
+        )
+
+        duration = asyncio.get_running_loop().time() - due_at
+        return CycleSummary(cycle, due_at, duration, tuple(results), skipped_cycles)
+
+    async def _poll_device(self, device: FlexitBACnet, start_at: float) -> PollResult:
+        loop = asyncio.get_running_loop()
+
+        if start_at > loop.time():
+            await asyncio.sleep(start_at - loop.time())
+
+        if device in self._in_flight:
+            return PollResult(device, PollStatus.SKIPPED)
+
+        queued_at = loop.time()
+        await self._semaphore.acquire()
+        started_at = loop.time()
+
+        # the slot is held until the refresh is finished, even after the deadline
+        update = asyncio.ensure_future(device.update())
+        update.add_done_callback(lambda _: self._semaphore.release())
+
+        try:
+            done, _ = await asyncio.wait([update], timeout=self.deadline)
+        except asyncio.CancelledError:
+            # the refresh is shared with other callers of update(), so it is left to finish
+            self._refresh_in_flight(device, update)
+            raise
+
+        latency = loop.time() - started_at
+        wait = started_at - queued_at
+
+        if not done:
+            self._refresh_in_flight(device, update)
+            return PollResult(device, PollStatus.TIMEOUT, wait, latency)
+
+        # cancelled by another caller of update(), exception() would raise
+        if update.cancelled():
+            return PollResult(device, PollStatus.ERROR, wait, latency, asyncio.CancelledError())
+
+        error = update.exception()
+
+        if error is None:
+            return PollResult(device, PollStatus.OK, wait, latency)
+
+        if isinstance(error, asyncio.TimeoutError):
+            return PollResult(device, PollStatus.TIMEOUT, wait, latency, error)
+
+        # a single failing device must not stop the cycle
+        return PollResult(device, PollStatus.ERROR, wait, latency, error)
+
+    def _refresh_in_flight(self, device: FlexitBACnet, update: asyncio.Future) -> None:
+        self._in_flight[device] = update
+        update.add_done_callback(lambda _: self._update_finished(device, update))
+
+    def _update_finished(self, device: FlexitBACnet, update: asyncio.Future) -> None:
+        if self._in_flight.get(device) is update:
+            del self._in_flight[device]
+
+        # the result was already reported as a timeout
+        if not update.cancelled():
+            update.exception()
@@ -0,0 +1,208 @@
+"""Point profiles of the device models.
+
+Not every model supports every point: some are not implemented and are read as unknown
+object (or property) errors, and some sensors are fitted only to some models and are read
+as constant zeros. The profile of the device records such points, so they are not polled.
+
+Only the unknown points are stored: a sensor read as zeros may be fitted later, or may have
+been offline during the probe, so it is probed again after ABSENT_POINTS_TTL.
+"""
+import asyncio
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .bacnet import (
+    BACnetClient,
+    DeviceProperty,
+    DeviceState,
+    ErrorCode,
+    ObjectIdentifier,
+    ObjectType,
+    PropertyErrors,
+    ReadValue,
+)
+from .nordic import (
+    EXTRACT_AIR_HUMIDITY,
+    EXTRACT_AIR_TEMPERATURE,
+    EXTRACT_AIR_TEMPERATURE_ALT,
+    ROOM_1_HUMIDITY,
+    ROOM_2_HUMIDITY,
+    ROOM_3_HUMIDITY,
+)
+
+# sensors, which read as constant zeros on the models they are not fitted to
+PROBED_PROPERTIES = [
+    EXTRACT_AIR_HUMIDITY,
+    EXTRACT_AIR_TEMPERATURE,
+    EXTRACT_AIR_TEMPERATURE_ALT,
+    ROOM_1_HUMIDITY,
+    ROOM_2_HUMIDITY,
+    ROOM_3_HUMIDITY,
+]
+
+# number of reads of the probed properties, and the interval between them in seconds
+DEFAULT_PROBE_SAMPLES = 2
+DEFAULT_PROBE_INTERVAL = 1.0
+
+# seconds after which the sensors read as zeros are probed again
+ABSENT_POINTS_TTL = 6 * 3600
+
+# errors of the points, which the device does not implement
+UNKNOWN_POINT_ERRORS = (ErrorCode.UNKNOWN_OBJECT, ErrorCode.UNKNOWN_PROPERTY)
+
+PROFILE_VERSION = 2
+
+
+class PointProfile:
+    """Points, which are not supported by the device with the serial number.
+
+    unsupported -- points unknown to the device, they are stored.
+    absent -- sensors read as constant zeros, probed at the loop time probed_at,
+              or None if they were not probed yet.
+    """
+
+    def __init__(
+        self,
+        serial_number: str,
+        unsupported: Iterable[ObjectIdentifier] = (),
+        absent: Iterable[ObjectIdentifier] = (),
+        probed_at: Optional[float] = None,
+    ):
+        self.serial_number = serial_number
+        self.unsupported: Set[ObjectIdentifier] = set(unsupported)
+        self.absent: Set[ObjectIdentifier] = set(absent)
+        self.probed_at = probed_at
+
+    def supports(self, device_property: DeviceProperty) -> bool:
+        object_identifier = device_property.object_identifier
+        return object_identifier not in self.unsupported and object_identifier not in self.absent
+
+    def needs_probe(self, now: float, ttl: float = ABSENT_POINTS_TTL) -> bool:
+        """Whether the sensors read as zeros should be probed (again)."""
+        return self.probed_at is None or now - self.probed_at >= ttl
+
+    def without_absent(self) -> "PointProfile":
+        """Return the profile with the sensors read as zeros polled again, until probed."""
+        return PointProfile(self.serial_number, self.unsupported)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": PROFILE_VERSION,
+            "serial_number": self.serial_number,
+            "unsupported": sorted([int(t), i] for t, i in self.unsupported),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PointProfile":
+        if data.get("version") != PROFILE_VERSION:
+            raise ValueError(f"unsupported profile version: {data.get('version')}")
+
+        return cls(
+            data["serial_number"],
+            [(ObjectType(t), i) for t, i in data["unsupported"]],
+        )
+
+
+class ProfileCache:
+    """Point profiles stored as JSON files in the directory, one per serial number."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+
+    def _path(self, serial_number: str) -> str:
+        return os.path.join(self.directory, re.sub(r"[^0-9A-Za-z_-]", "_", serial_number) + ".json")
+
+    def load(self, serial_number: str) -> Optional[PointProfile]:
+        """Return the stored profile, or None if there is no valid one."""
+        try:
+            with open(self._path(serial_number)) as f:
+                profile = PointProfile.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if profile.serial_number != serial_number:
+            return None
+
+        return profile
+
+    def save(self, profile: PointProfile) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+
+        path = self._path(profile.serial_number)
+
+        # replace the file atomically, so a concurrent load() never reads a partial profile
+        with open(path + ".tmp", "w") as f:
+            json.dump(profile.to_dict(), f)
+
+        os.replace(path + ".tmp", path)
+
+
+def _present_value(device_state: DeviceState, object_identifier: ObjectIdentifier) -> Any:
+    for read_value, value in device_state.get(object_identifier, []):
+        if read_value == ReadValue.PRESENT_VALUE:
+            return value
+
+    return None
+
+
+def unsupported_points(
+    errors: PropertyErrors, unsupported: Iterable[ObjectIdentifier] = ()
+) -> Set[ObjectIdentifier]:
+    """Return the points unknown to the device, based on the errors of a read."""
+    # other errors (e.g. the device is busy) may be temporary, such points are still polled
+    unsupported = set(unsupported)
+    unsupported.update(
+        object_identifier
+        for (object_identifier, read_value), error_code in errors.items()
+        if read_value == ReadValue.PRESENT_VALUE
+        and object_identifier[0] != ObjectType.DEVICE
+        and error_code in UNKNOWN_POINT_ERRORS
+    )
+
+    return unsupported
+
+
+async def probe(
+    client: BACnetClient,
+    serial_number: str,
+    device_properties: List[DeviceProperty],
+    device_state: DeviceState,
+    errors: PropertyErrors,
+    samples: int = DEFAULT_PROBE_SAMPLES,
+    interval: float = DEFAULT_PROBE_INTERVAL,
+    unsupported: Iterable[ObjectIdentifier] = (),
+) -> PointProfile:
+    """Return the profile of the device, based on a read of all polled properties.
+
+    device_state, errors -- the values, and the property access errors, of the read.
+    unsupported -- points already known to be unsupported, e.g. from a stored profile.
+    """
+    loop = asyncio.get_running_loop()
+
+    unsupported = unsupported_points(errors, unsupported)
+
+    # sensors read as zero are read again, any other value proves the sensor is fitted
+    candidates = [
+        dp
+        for dp in PROBED_PROPERTIES
+        if dp in device_properties
+        and dp.object_identifier not in unsupported
+        and _present_value(device_state, dp.object_identifier) == 0
+    ]
+
+    for _ in range(samples - 1):
+        if not candidates:
+            break
+
+        await asyncio.sleep(interval)
+
+        device_state = await client.read_multiple(candidates)
+        candidates = [
+            dp for dp in candidates if _present_value(device_state, dp.object_identifier) == 0
+        ]
+
+    absent = [dp.object_identifier for dp in candidates]
+
+    return PointProfile(serial_number, unsupported, absent, loop.time())
@@ -0,0 +1,83 @@
+"""Retransmission of unanswered requests.
+
+The timeout of each request follows the round-trip time measured for the device
+(as TCP does, see RFC 6298), and is backed off exponentially with every retry.
+"""
+import random
+from typing import NamedTuple, Optional
+
+# smoothing factors of the round-trip time and its variation, and the variation multiplier
+RTT_ALPHA = 1 / 8
+RTT_BETA = 1 / 4
+RTT_K = 4
+
+# clock granularity in seconds, the smallest variation added to the timeout
+RTT_GRANULARITY = 0.01
+
+
+class RetryPolicy(NamedTuple):
+    """How the requests not answered in time are retried.
+
+    retries -- number of retransmissions, after the first request.
+    backoff -- multiplier of the timeout with every retry.
+    jitter -- up to this part of the timeout is randomly added to it,
+              so requests to many devices are not retried in lockstep.
+    initial_timeout -- timeout in seconds, until the round-trip time is measured.
+    min_timeout, max_timeout -- bounds of the timeout in seconds.
+    adaptive -- derive the timeout from the measured round-trip time,
+                otherwise always start with initial_timeout.
+    """
+
+    retries: int = 2
+    backoff: float = 2.0
+    jitter: float = 0.1
+    initial_timeout: float = 1.0
+    min_timeout: float = 0.05
+    max_timeout: float = 4.0
+    adaptive: bool = True
+
+    def retry_timeout(self, timeout: float) -> float:
+        """Return the timeout of the next retry."""
+        return min(self.max_timeout, timeout * self.backoff)
+
+    def jittered(self, timeout: float) -> float:
+        return timeout * (1 + random.random() * self.jitter)
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class RTTEstimator:
+    """Smoothed round-trip time (SRTT) and its variation (RTTVAR) of a single device."""
+
+    def __init__(self, policy: RetryPolicy = DEFAULT_RETRY_POLICY):
+        self.policy = policy
+        self.srtt: Optional[float] = None
+        self.rttvar: Optional[float] = None
+        self._timeout = policy.initial_timeout
+
+    @property
+    def timeout(self) -> float:
+        """Timeout (RTO) of the next request in seconds."""
+        if not self.policy.adaptive:
+            return self.policy.initial_timeout
+
+        return self._timeout
+
+    def sample(self, rtt: float) -> None:
+        """Update the estimate with the round-trip time of a request, which was not retried."""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar = (1 - RTT_BETA) * self.rttvar + RTT_BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - RTT_ALPHA) * self.srtt + RTT_ALPHA * rtt
+
+        self._timeout = min(
+            self.policy.max_timeout,
+            max(self.policy.min_timeout, self.srtt + max(RTT_GRANULARITY, RTT_K * self.rttvar)),
+        )
+
+    def timed_out(self) -> None:
+        """Back off the timeout after a request was not answered, until the next sample."""
+        self._timeout = self.policy.retry_timeout(self._timeout)
@@ -0,0 +1,181 @@
+"""Adaptive polling of device properties.
+
+Each property is assigned to a poll tier, which defines how often (every how many
+update cycles) it is read from the device. Properties which change are moved to
+a faster tier, while those which keep the same value are gradually moved to slower ones.
+"""
+from typing import Dict, List, Optional, Sequence
+
+from .bacnet import DeviceProperty, DeviceState, ObjectIdentifier, ObjectProperties, ObjectType
+from .nordic import (
+    AIR_FILTER_TIME_PERIOD_FOR_EXCHANGE,
+    AIR_TEMP_SETPOINT_AWAY,
+    AIR_TEMP_SETPOINT_HOME,
+    COMFORT_BUTTON,
+    COOKER_HOOD,
+    ELECTRIC_HEATER_NOM_POWER,
+    FIREPLACE_VENTILATION_RUNTIME,
+    LINEAR_SETPOINT_EXHAUST_AIR_AWAY,
+    LINEAR_SETPOINT_EXHAUST_AIR_COOKER,
+    LINEAR_SETPOINT_EXHAUST_AIR_FIRE,
+    LINEAR_SETPOINT_EXHAUST_AIR_HIGH,
+    LINEAR_SETPOINT_EXHAUST_AIR_HOME,
+    LINEAR_SETPOINT_SUPPLY_AIR_AWAY,
+    LINEAR_SETPOINT_SUPPLY_AIR_COOKER,
+    LINEAR_SETPOINT_SUPPLY_AIR_FIRE,
+    LINEAR_SETPOINT_SUPPLY_AIR_HIGH,
+    LINEAR_SETPOINT_SUPPLY_AIR_HOME,
+    RAPID_VENTILATION_RUNTIME,
+    VENTILATION_MODE,
+)
+
+# poll intervals (in update cycles) of the tiers, from the fastest to the slowest one
+DEFAULT_POLL_TIERS = (1, 4, 16, 64)
+
+# number of polls without a change, after which the property is moved to a slower tier
+DEFAULT_DEMOTE_AFTER = 3
+
+# properties which are practically static, they start in the slowest tier
+STATIC_PROPERTIES = [
+    AIR_FILTER_TIME_PERIOD_FOR_EXCHANGE,
+    ELECTRIC_HEATER_NOM_POWER,
+    LINEAR_SETPOINT_EXHAUST_AIR_AWAY,
+    LINEAR_SETPOINT_EXHAUST_AIR_COOKER,
+    LINEAR_SETPOINT_EXHAUST_AIR_FIRE,
+    LINEAR_SETPOINT_EXHAUST_AIR_HIGH,
+    LINEAR_SETPOINT_EXHAUST_AIR_HOME,
+    LINEAR_SETPOINT_SUPPLY_AIR_AWAY,
+    LINEAR_SETPOINT_SUPPLY_AIR_COOKER,
+    LINEAR_SETPOINT_SUPPLY_AIR_FIRE,
+    LINEAR_SETPOINT_SUPPLY_AIR_HIGH,
+    LINEAR_SETPOINT_SUPPLY_AIR_HOME,
+]
+
+# properties which are set from the control panel or the app, they are never moved
+# to a slower tier than DEFAULT_MAX_ADJUSTABLE_TIER, so such changes are seen soon
+ADJUSTABLE_PROPERTIES = [
+    AIR_TEMP_SETPOINT_AWAY,
+    AIR_TEMP_SETPOINT_HOME,
+    COMFORT_BUTTON,
+    COOKER_HOOD,
+    FIREPLACE_VENTILATION_RUNTIME,
+    RAPID_VENTILATION_RUNTIME,
+    VENTILATION_MODE,
+]
+
+DEFAULT_MAX_ADJUSTABLE_TIER = 1
+
+
+class PointSchedule:
+    """Poll schedule of a single property."""
+
+    def __init__(self, tier: int, max_tier: int):
+        self.tier = tier
+        self.max_tier = max_tier
+        self.last_polled: Optional[int] = None
+        self.unchanged_polls = 0
+        self.last_value: Optional[ObjectProperties] = None
+
+
+class PollScheduler:
+    def __init__(
+        self,
+        tiers: Sequence[int] = DEFAULT_POLL_TIERS,
+        demote_after: int = DEFAULT_DEMOTE_AFTER,
+        static_properties: Optional[Sequence[DeviceProperty]] = None,
+        adjustable_properties: Optional[Sequence[DeviceProperty]] = None,
+        max_adjustable_tier: int = DEFAULT_MAX_ADJUSTABLE_TIER,
+    ):
+        """Create a scheduler.
+
+        tiers -- poll intervals (in update cycles) of the tiers, from the fastest one.
+        demote_after -- number of polls without a change, after which the property
+                        is moved to a slower tier.
+        static_properties -- properties which start in the slowest tier,
+                             the device object always starts there.
+        adjustable_properties -- properties set by the user, which are never moved
+                                 to a slower tier than max_adjustable_tier.
+        """
+        if not tiers or any(interval < 1 for interval in tiers):
+            raise ValueError("tiers must be a non-empty list of positive intervals")
+
+        self.tiers = list(tiers)
+        self.demote_after = demote_after
+
+        if static_properties is None:
+            static_properties = STATIC_PROPERTIES
+
+        if adjustable_properties is None:
+            adjustable_properties = ADJUSTABLE_PROPERTIES
+
+        self._static = {dp.object_identifier for dp in static_properties}
+        self._adjustable = {dp.object_identifier for dp in adjustable_properties}
+        self.max_adjustable_tier = min(max_adjustable_tier, len(self.tiers) - 1)
+        self._schedules: Dict[ObjectIdentifier, PointSchedule] = {}
+        self.cycle = 0
+
+    def _schedule(self, object_identifier: ObjectIdentifier) -> PointSchedule:
+        schedule = self._schedules.get(object_identifier)
+        if schedule is None:
+            slowest_tier = len(self.tiers) - 1
+            if object_identifier in self._adjustable:
+                slowest_tier = self.max_adjustable_tier
+
+            if object_identifier in self._static or object_identifier[0] == ObjectType.DEVICE:
+                tier = slowest_tier
+            else:
+                tier = 0
+
+            schedule = self._schedules[object_identifier] = PointSchedule(tier, slowest_tier)
+
+        return schedule
+
+    def tier(self, device_property: DeviceProperty) -> int:
+        """Return the current tier of the property, 0 being the fastest one."""
+        return self._schedule(device_property.object_identifier).tier
+
+    def due(self, device_properties: Sequence[DeviceProperty]) -> List[DeviceProperty]:
+        """Return properties which should be read in the current cycle, in the given order."""
+        due = []
+
+        for dp in device_properties:
+            schedule = self._schedule(dp.object_identifier)
+
+            if (
+                schedule.last_polled is None
+                or self.cycle - schedule.last_polled >= self.tiers[schedule.tier]
+            ):
+                due.append(dp)
+
+        return due
+
+    def touch(self, device_properties: Sequence[DeviceProperty]) -> None:
+        """Read the properties in the next cycle, and move them to the fastest tier.
+
+        E.g. after they were written, so the written values are read back.
+        """
+        for dp in device_properties:
+            schedule = self._schedule(dp.object_identifier)
+            schedule.tier = 0
+            schedule.unchanged_polls = 0
+            schedule.last_polled = None
+
+    def record(self, device_state: DeviceState) -> None:
+        """Record values read in the current cycle, adapt the tiers and start the next cycle."""
+        for object_identifier, value in device_state.items():
+            schedule = self._schedule(object_identifier)
+
+            if schedule.last_polled is not None and value != schedule.last_value:
+                schedule.tier = max(schedule.tier - 1, 0)
+                schedule.unchanged_polls = 0
+            elif schedule.last_polled is not None:
+                schedule.unchanged_polls += 1
+
+                if schedule.unchanged_polls >= self.demote_after:
+                    schedule.tier = min(schedule.tier + 1, schedule.max_tier)
+                    schedule.unchanged_polls = 0
+
+            schedule.last_polled = self.cycle
+            schedule.last_value = value
+
+        self.cycle += 1
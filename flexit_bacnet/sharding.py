@@ -0,0 +1,496 @@
+"""Polling of a large fleet from several processes.
+
+Encoding and decoding of the requests is pure Python, so a single process (and its
+event loop) becomes CPU bound with thousands of devices. The devices are sharded
+between worker processes by consistent hashing of their addresses; each worker polls
+its shard with a FlexitFleet over its own socket, and streams the changed values back
+to the parent process, where they are merged into mirror FlexitBACnet instances.
+"""
+import asyncio
+import bisect
+import functools
+import hashlib
+import marshal
+import multiprocessing
+import os
+import threading
+import traceback
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .bacnet import (
+    DEBUG,
+    BACnetTransport,
+    DeviceState,
+    ObjectIdentifier,
+    ObjectType,
+    ReadValue,
+)
+from .cache import CachedDevice
+from .device import FlexitBACnet, _check_shared_options
+from .fleet import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_DEADLINE,
+    DEFAULT_INTERVAL,
+    DEFAULT_JITTER,
+    CycleSummary,
+    FlexitFleet,
+    PollResult,
+    PollStatus,
+    _call_listeners,
+)
+from .profile import PointProfile
+from .scheduler import PollScheduler
+
+# points of each shard on the hash ring, more of them spread the devices more evenly
+DEFAULT_REPLICAS = 64
+
+# how often the workers check whether they should stop, in seconds
+STOP_CHECK_INTERVAL = 0.2
+
+# seconds a worker has to stop, before it is terminated
+STOP_TIMEOUT = 5.0
+
+
+class WorkerError(Exception):
+    """Error in a worker process, of a device refresh or of the worker itself.
+
+    The original error cannot be passed between processes, only its description.
+    """
+
+
+def _hash(key: str) -> int:
+    # stable across processes, unlike hash()
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hashing of device addresses to shards.
+
+    When the number of shards changes, only the devices of the added (or removed) shard move.
+    """
+
+    def __init__(self, shards: int, replicas: int = DEFAULT_REPLICAS):
+        if shards < 1 or replicas < 1:
+            raise ValueError("shards and replicas must be positive")
+
+        points = sorted(
+            (_hash(f"{shard}-{replica}"), shard)
+            for shard in range(shards)
+            for replica in range(replicas)
+        )
+
+        self.shards = shards
+        self._hashes = [point for point, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def shard(self, address: str) -> int:
+        index = bisect.bisect(self._hashes, _hash(address)) % len(self._hashes)
+        return self._shards[index]
+
+
+# messages from the workers are marshalled tuples of builtin types, which are
+# much smaller and faster to encode than pickled named tuples and enums;
+# a worker which fails sends the traceback, as a string, as its last message
+
+
+def _encode_state(state: DeviceState) -> tuple:
+    return tuple(
+        (int(object_type), instance, tuple((int(rv), value) for rv, value in values))
+        for (object_type, instance), values in state.items()
+    )
+
+
+def _decode_state(encoded: tuple) -> DeviceState:
+    return {
+        (ObjectType(object_type), instance): [(ReadValue(rv), value) for rv, value in values]
+        for object_type, instance, values in encoded
+    }
+
+
+def _encode_profile(profile: PointProfile) -> tuple:
+    return (
+        profile.serial_number,
+        tuple((int(t), i) for t, i in profile.unsupported),
+        tuple((int(t), i) for t, i in profile.absent),
+    )
+
+
+def _decode_profile(encoded: tuple) -> PointProfile:
+    serial_number, unsupported, absent = encoded
+
+    # the worker probes the absent points again, the mirror only needs to skip them
+    return PointProfile(
+        serial_number,
+        [(ObjectType(t), i) for t, i in unsupported],
+        [(ObjectType(t), i) for t, i in absent],
+    )
+
+
+def _create_device(cached: CachedDevice, **kwargs: Any) -> FlexitBACnet:
+    device = FlexitBACnet(
+        cached.address,
+        cached.device_id,
+        port=cached.port,
+        max_apdu_length=cached.max_apdu_length,
+        **kwargs,
+    )
+
+    if cached.profile is not None:
+        device._set_profile(cached.profile)
+
+    return device
+
+
+class _ShardWorker:
+    """Polls a shard of the devices in a worker process, and sends the results to the parent."""
+
+    def __init__(self, connection, devices: Sequence[Tuple[int, CachedDevice]]):
+        self.connection = connection
+        self.devices = devices
+
+        # values published by each device since its last sent result, and the profiles last sent
+        self._changed: Dict[int, DeviceState] = {}
+        self._profiles: Dict[int, Optional[PointProfile]] = {}
+        self._indexes: Dict[FlexitBACnet, int] = {}
+
+        # done when the results cannot be sent to the parent process
+        self._broken: Optional[asyncio.Future] = None
+
+    async def run(
+        self,
+        stop_event,
+        fleet_options: Dict[str, Any],
+        device_options: Dict[str, Any],
+        scheduler_factory: Optional[Callable[[], PollScheduler]],
+    ):
+        self._broken = asyncio.get_running_loop().create_future()
+
+        async with BACnetTransport() as transport:
+            fleet = FlexitFleet(**fleet_options)
+
+            for index, cached in self.devices:
+                device = _create_device(
+                    cached,
+                    transport=transport,
+                    scheduler=scheduler_factory() if scheduler_factory is not None else None,
+                    **device_options,
+                )
+                device._recorded = functools.partial(self._value_recorded, index)
+                self._indexes[device] = index
+                self._profiles[index] = device.profile
+                fleet.add(device)
+
+            fleet.add_listener(self._send_summary)
+
+            async with fleet:
+                while not stop_event.is_set() and not self._broken.done():
+                    await asyncio.sleep(STOP_CHECK_INTERVAL)
+
+    def _send_summary(self, summary: CycleSummary) -> None:
+        results = tuple(self._encode_result(result) for result in summary.results)
+        message = (
+            summary.cycle,
+            summary.started_at,
+            summary.duration,
+            summary.skipped_cycles,
+            results,
+        )
+
+        try:
+            self.connection.send_bytes(marshal.dumps(message))
+        except OSError:
+            # the parent process is gone
+            if not self._broken.done():
+                self._broken.set_result(None)
+
+    def _encode_result(self, result: PollResult) -> tuple:
+        index = self._indexes[result.device]
+        error = None if result.error is None else repr(result.error)
+        state = profile = None
+
+        if result.status == PollStatus.OK:
+            changed = self._changed.pop(index, None)
+            state = _encode_state(changed) if changed else None
+
+            if result.device.profile is not self._profiles[index]:
+                self._profiles[index] = result.device.profile
+
+                if result.device.profile is not None:
+                    profile = _encode_profile(result.device.profile)
+
+        return index, int(result.status), result.wait, result.latency, error, state, profile
+
+    def _value_recorded(
+        self, index: int, object_identifier: ObjectIdentifier, read_value: ReadValue, value: Any
+    ) -> None:
+        changed = self._changed.setdefault(index, {})
+        changed.setdefault(object_identifier, []).append((read_value, value))
+
+
+def _run_worker(
+    connection,
+    stop_event,
+    devices: Sequence[Tuple[int, CachedDevice]],
+    fleet_options: Dict[str, Any],
+    device_options: Dict[str, Any],
+    scheduler_factory: Optional[Callable[[], PollScheduler]],
+) -> None:
+    """Entry point of a worker process."""
+    try:
+        worker = _ShardWorker(connection, devices)
+        asyncio.run(worker.run(stop_event, fleet_options, device_options, scheduler_factory))
+    except Exception:
+        try:
+            connection.send_bytes(marshal.dumps(traceback.format_exc()))
+        except OSError:
+            pass
+
+        raise
+    finally:
+        connection.close()
+
+
+class ShardedFleet:
+    def __init__(
+        self,
+        devices: Sequence[CachedDevice],
+        processes: Optional[int] = None,
+        interval: float = DEFAULT_INTERVAL,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        deadline: float = DEFAULT_DEADLINE,
+        jitter: float = DEFAULT_JITTER,
+        scheduler_factory: Optional[Callable[[], PollScheduler]] = None,
+        **device_options: Any,
+    ):
+        """Create a fleet polled by worker processes, see FlexitFleet.
+
+        processes -- number of worker processes, the number of CPUs by default.
+        concurrency -- largest number of devices refreshed at once, by each process.
+        scheduler_factory -- creates the scheduler of each device polled by the workers,
+                             e.g. PollScheduler; it must be picklable.
+        device_options -- arguments of FlexitBACnet, used in every process,
+                          so they must be picklable. The device_cache is only
+                          used (and written) by the parent process.
+        """
+        _check_shared_options(device_options)
+
+        self.processes = processes or os.cpu_count() or 1
+        self.ring = HashRing(self.processes)
+
+        self._fleet_options = dict(
+            interval=interval, concurrency=concurrency, deadline=deadline, jitter=jitter
+        )
+        self._cached = list(devices)
+        self._scheduler_factory = scheduler_factory
+
+        # the workers would race writing the same file, the mirrors keep the cache instead;
+        # the workers send every changed value, and the mirrors apply the deadbands
+        self._device_options = {
+            name: value
+            for name, value in device_options.items()
+            if name not in ("device_cache", "deadbands")
+        }
+
+        # mirrors of the devices polled by the workers, with the state they read
+        self.devices = [_create_device(cached, **device_options) for cached in self._cached]
+
+        self._listeners: List[Callable[[CycleSummary], None]] = []
+        self._queues: List[asyncio.Queue] = []
+
+        # failure of each worker process, which exited before stop() was called
+        self.failures: Dict[int, WorkerError] = {}
+
+        self._workers: List[multiprocessing.process.BaseProcess] = []
+        self._stop_event = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def shard(self, device: CachedDevice) -> int:
+        """Return the worker process polling the device."""
+        return self.ring.shard(device.address)
+
+    def add_listener(self, listener: Callable[[CycleSummary], None]) -> None:
+        """Call the listener with the summary of every cycle of every worker process."""
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[CycleSummary], None]) -> None:
+        self._listeners.remove(listener)
+
+    async def summaries(self) -> AsyncIterator[CycleSummary]:
+        """Iterate over summaries of the cycles of all worker processes.
+
+        Raises WorkerError when a worker process fails.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+
+        for failure in self.failures.values():
+            raise failure
+
+        self._queues.append(queue)
+
+        try:
+            while True:
+                item = await queue.get()
+
+                if isinstance(item, WorkerError):
+                    raise item
+
+                yield item
+        finally:
+            self._queues.remove(queue)
+
+    @property
+    def is_running(self) -> bool:
+        return any(worker.is_alive() for worker in self._workers)
+
+    async def start(self) -> None:
+        """Start the worker processes, which poll the devices until stop() is called."""
+        if self._workers:
+            return
+
+        shards: List[List[Tuple[int, CachedDevice]]] = [[] for _ in range(self.processes)]
+        for index, cached in enumerate(self._cached):
+            shards[self.shard(cached)].append((index, cached))
+
+        # a forked child would inherit the running event loop and the threads of the parent
+        context = multiprocessing.get_context("spawn")
+
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = context.Event()
+        self.failures = {}
+
+        for shard, devices in enumerate(shards):
+            if not devices:
+                continue
+
+            receiver, sender = context.Pipe(duplex=False)
+            worker = context.Process(
+                target=_run_worker,
+                args=(
+                    sender,
+                    self._stop_event,
+                    devices,
+                    self._fleet_options,
+                    self._device_options,
+                    self._scheduler_factory,
+                ),
+                name=f"flexit-fleet-{shard}",
+                daemon=True,
+            )
+            worker.start()
+
+            # the worker holds the only sending end, so the receiver gets EOF when it exits
+            sender.close()
+            self._workers.append(worker)
+
+            threading.Thread(
+                target=self._receive,
+                args=(shard, worker, receiver, self._stop_event),
+                name=worker.name,
+                daemon=True,
+            ).start()
+
+    async def stop(self) -> None:
+        """Stop the worker processes, terminating those which do not stop in time."""
+        if not self._workers:
+            return
+
+        workers, self._workers = self._workers, []
+        self._stop_event.set()
+
+        loop = asyncio.get_running_loop()
+
+        for worker in workers:
+            await loop.run_in_executor(None, worker.join, STOP_TIMEOUT)
+
+            if worker.is_alive():
+                worker.terminate()
+
+    async def __aenter__(self) -> "ShardedFleet":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def _receive(self, shard: int, worker, receiver, stop_event) -> None:
+        """Pass the messages of a worker to the event loop, runs in a thread."""
+        with receiver:
+            while True:
+                try:
+                    message = receiver.recv_bytes()
+                except (EOFError, OSError):
+                    break
+
+                if not self._call_soon(self._message_received, shard, message):
+                    return
+
+        if DEBUG:
+            print(f"fleet worker {shard} exited")
+
+        if stop_event.is_set():
+            return
+
+        # the worker was killed, or failed without sending the traceback
+        worker.join(STOP_TIMEOUT)
+        self._call_soon(self._worker_failed, shard, f"exited with code {worker.exitcode}")
+
+    def _call_soon(self, callback: Callable[..., None], *args: Any) -> bool:
+        try:
+            self._loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            # the event loop is closed
+            return False
+
+        return True
+
+    def _worker_failed(self, shard: int, description: str) -> None:
+        if shard in self.failures:
+            return
+
+        error = self.failures[shard] = WorkerError(f"fleet worker {shard} failed: {description}")
+
+        self._loop.call_exception_handler({"message": str(error), "exception": error})
+
+        for queue in self._queues:
+            queue.put_nowait(error)
+
+    def _message_received(self, shard: int, message: bytes) -> None:
+        decoded = marshal.loads(message)
+
+        if isinstance(decoded, str):
+            self._worker_failed(shard, decoded)
+            return
+
+        cycle, started_at, duration, skipped_cycles, encoded_results = decoded
+        results = []
+
+        for index, status, wait, latency, error, state, profile in encoded_results:
+            device = self.devices[index]
+
+            if profile is not None:
+                device._set_profile(_decode_profile(profile))
+
+            if state is not None:
+                device._merge_state(_decode_state(state))
+
+            if device.device_cache is not None and device._state is not None:
+                device_state = device._state.device_state()
+
+                if device._device_property.object_identifier in device_state:
+                    device._update_cache(device_state)
+
+            results.append(
+                PollResult(
+                    device,
+                    PollStatus(status),
+                    wait,
+                    latency,
+                    None if error is None else WorkerError(error),
+                )
+            )
+
+        summary = CycleSummary(cycle, started_at, duration, tuple(results), skipped_cycles, shard)
+        _call_listeners(self._listeners, summary)
+
+        for queue in self._queues:
+            queue.put_nowait(summary)
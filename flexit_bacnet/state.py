@@ -0,0 +1,202 @@
+"""Compact storage of the device state.
+
+Values are kept in typed arrays, indexed by slots of a layout, which is shared
+by all stores. Present values of analog objects are stored as floats, of the other
+numeric objects as integers, and all the remaining values (e.g. strings) as objects.
+"""
+from array import array
+from typing import Any, Dict, Iterable, Optional
+
+from .bacnet import (
+    DeviceProperty,
+    DeviceState,
+    ObjectIdentifier,
+    ObjectProperties,
+    ObjectType,
+    ReadValue,
+)
+
+COLUMN_FLOAT = 0
+COLUMN_INT = 1
+COLUMN_OBJECT = 2
+
+# slot presence flags
+SLOT_EMPTY = 0
+SLOT_SET = 1
+
+# value did not fit into the slot's typed column and is stored as an object instead
+SLOT_OVERFLOW = 2
+
+FLOAT_OBJECT_TYPES = (ObjectType.ANALOG_INPUT, ObjectType.ANALOG_OUTPUT, ObjectType.ANALOG_VALUE)
+INT_OBJECT_TYPES = (
+    ObjectType.BINARY_INPUT,
+    ObjectType.BINARY_OUTPUT,
+    ObjectType.BINARY_VALUE,
+    ObjectType.MULTI_STATE_VALUE,
+    ObjectType.POSITIVE_INTEGER_VALUE,
+)
+
+# marker for get() without a default value
+_MISSING = object()
+
+
+class StateLayout:
+    """Slot index of (object identifier, read value) pairs, shared by many stores.
+
+    Slots are added on first use, so the layout can grow, e.g. when a new property is polled.
+    """
+
+    def __init__(self, device_properties: Iterable[DeviceProperty] = ()):
+        self.slots: Dict[ReadValue, Dict[ObjectIdentifier, int]] = {}
+
+        # column and index within the column of each slot
+        self.columns = bytearray()
+        self.indexes = array("l")
+
+        self.column_sizes = [0, 0, 0]
+
+        for dp in device_properties:
+            for read_value in dp.read_values:
+                self.slot(dp.object_identifier, read_value)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def find(self, object_identifier: ObjectIdentifier, read_value: ReadValue) -> Optional[int]:
+        slots = self.slots.get(read_value)
+        if slots is None:
+            return None
+
+        return slots.get(object_identifier)
+
+    def slot(self, object_identifier: ObjectIdentifier, read_value: ReadValue) -> int:
+        """Return the slot of the value, adding it to the layout if needed."""
+        slots = self.slots.setdefault(read_value, {})
+
+        slot = slots.get(object_identifier)
+        if slot is not None:
+            return slot
+
+        if read_value != ReadValue.PRESENT_VALUE:
+            column = COLUMN_OBJECT
+        elif object_identifier[0] in FLOAT_OBJECT_TYPES:
+            column = COLUMN_FLOAT
+        elif object_identifier[0] in INT_OBJECT_TYPES:
+            column = COLUMN_INT
+        else:
+            column = COLUMN_OBJECT
+
+        slot = slots[object_identifier] = len(self.columns)
+
+        self.columns.append(column)
+        self.indexes.append(self.column_sizes[column])
+        self.column_sizes[column] += 1
+
+        return slot
+
+
+class DeviceStateStore:
+    """Values of a single device, stored in the slots of a shared layout."""
+
+    def __init__(self, layout: StateLayout):
+        self.layout = layout
+
+        self._present = bytearray()
+        self._floats = array("d")
+        self._ints = array("q")
+        self._objects: list = []
+        self._overflow: Dict[int, Any] = {}
+
+    def _grow(self) -> None:
+        layout = self.layout
+        sizes = layout.column_sizes
+
+        self._present.extend(bytes(len(layout) - len(self._present)))
+        self._floats.frombytes(bytes(8 * (sizes[COLUMN_FLOAT] - len(self._floats))))
+        self._ints.frombytes(bytes(8 * (sizes[COLUMN_INT] - len(self._ints))))
+        self._objects.extend([None] * (sizes[COLUMN_OBJECT] - len(self._objects)))
+
+    def get(
+        self,
+        object_identifier: ObjectIdentifier,
+        read_value: ReadValue = ReadValue.PRESENT_VALUE,
+        default: Any = _MISSING,
+    ) -> Any:
+        """Return the value, raising KeyError if it is not set and no default is given."""
+        slot = self.layout.find(object_identifier, read_value)
+
+        if slot is None or slot >= len(self._present) or self._present[slot] == SLOT_EMPTY:
+            if default is _MISSING:
+                raise KeyError((object_identifier, read_value))
+
+            return default
+
+        if self._present[slot] == SLOT_OVERFLOW:
+            return self._overflow[slot]
+
+        column = self.layout.columns[slot]
+        index = self.layout.indexes[slot]
+
+        if column == COLUMN_FLOAT:
+            return self._floats[index]
+
+        if column == COLUMN_INT:
+            return self._ints[index]
+
+        return self._objects[index]
+
+    def set(self, object_identifier: ObjectIdentifier, read_value: ReadValue, value: Any) -> None:
+        slot = self.layout.slot(object_identifier, read_value)
+
+        if slot >= len(self._present):
+            self._grow()
+
+        column = self.layout.columns[slot]
+        index = self.layout.indexes[slot]
+
+        try:
+            if column == COLUMN_FLOAT and isinstance(value, float):
+                self._floats[index] = value
+            elif column == COLUMN_INT and isinstance(value, int):
+                self._ints[index] = value
+            elif column == COLUMN_OBJECT:
+                self._objects[index] = value
+            else:
+                raise TypeError(f"unexpected value type: {type(value)}")
+        except (TypeError, OverflowError):
+            self._overflow[slot] = value
+            self._present[slot] = SLOT_OVERFLOW
+            return
+
+        if self._present[slot] == SLOT_OVERFLOW:
+            del self._overflow[slot]
+
+        self._present[slot] = SLOT_SET
+
+    def set_values(self, object_identifier: ObjectIdentifier, values: ObjectProperties) -> None:
+        for read_value, value in values:
+            self.set(object_identifier, read_value, value)
+
+    def update(self, device_state: DeviceState) -> None:
+        """Set all values read from the device."""
+        for object_identifier, values in device_state.items():
+            self.set_values(object_identifier, values)
+
+    def clear(self) -> None:
+        self._present[:] = bytes(len(self._present))
+        self._overflow.clear()
+
+    def device_state(self) -> DeviceState:
+        """Return the values as DeviceState."""
+        device_state: DeviceState = {}
+
+        present = self._present
+
+        # the layout is shared, so most of its slots may not be set in this store
+        for read_value, slots in self.layout.slots.items():
+            for object_identifier, slot in slots.items():
+                if slot < len(present) and present[slot] != SLOT_EMPTY:
+                    value = self.get(object_identifier, read_value)
+                    device_state.setdefault(object_identifier, []).append((read_value, value))
+
+        return device_state
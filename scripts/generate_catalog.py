@@ -0,0 +1,117 @@
+"""Generate flexit_bacnet/catalog_data.py from bac0_points_dump.txt.
+
+usage: python scripts/generate_catalog.py [bac0_points_dump.txt] [flexit_bacnet/catalog_data.py]
+"""
+import argparse
+import ast
+import os
+import re
+import sys
+from collections import Counter
+from typing import List, Optional, Tuple
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+
+# BACnet object types used in the dump
+OBJECT_TYPES = {
+    "analogInput": 0,
+    "analogOutput": 1,
+    "analogValue": 2,
+    "binaryInput": 3,
+    "binaryOutput": 4,
+    "binaryValue": 5,
+    "multiStateValue": 19,
+    "positiveIntegerValue": 48,
+}
+
+HEADER = '''"""Flexit Nordic point catalog.
+
+Generated by scripts/generate_catalog.py from bac0_points_dump.txt, do not edit.
+
+Each point is a tuple of: name, object type, instance id, object name, description and unit.
+"""
+
+POINTS = (
+'''
+
+Point = Tuple[str, int, int, str, str, Optional[str]]
+
+COMMENT = re.compile(r"^#\s*(?P<description>.*?)\s*(\(e\.g\. .* (?P<unit>\S+)\))?$")
+
+
+def identifier(name: str) -> str:
+    return re.sub(r"_+", "_", re.sub(r"[^0-9A-Za-z]", "_", name)).strip("_").upper()
+
+
+def parse(path: str) -> List[Point]:
+    points = []
+    description, unit = "", None
+
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+
+            if line.startswith("#"):
+                match = COMMENT.match(line)
+                description = match.group("description")
+                unit = match.group("unit")
+                if unit == "None":
+                    unit = None
+            elif "=" in line:
+                name, value = line.split("=", 1)
+                (object_type, instance_id), object_name = ast.literal_eval(value.strip())
+                points.append((
+                    identifier(name),
+                    OBJECT_TYPES[object_type],
+                    instance_id,
+                    object_name,
+                    description,
+                    unit,
+                ))
+
+    # names shared by many points (e.g. ALARM_STATE) get the instance id appended
+    counts = Counter(point[0] for point in points)
+    points = [
+        (f"{point[0]}_{point[2]}" if counts[point[0]] > 1 else point[0],) + point[1:]
+        for point in points
+    ]
+
+    names = Counter(point[0] for point in points)
+    duplicates = [name for name, count in names.items() if count > 1]
+    if duplicates:
+        raise ValueError(f"duplicate point names: {duplicates}")
+
+    return sorted(points, key=lambda point: (point[1], point[2]))
+
+
+def render(points: List[Point]) -> str:
+    return HEADER + "".join(f"    {point!r},\n" for point in points) + ")\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the Nordic point catalog.")
+    parser.add_argument(
+        "source", nargs="?", default=os.path.join(ROOT, "bac0_points_dump.txt")
+    )
+    parser.add_argument(
+        "target", nargs="?", default=os.path.join(ROOT, "flexit_bacnet", "catalog_data.py")
+    )
+
+    # --help and invalid arguments exit here, before any file is touched
+    args = parser.parse_args()
+
+    data = render(parse(args.source))
+
+    # the package imports the module, so it is replaced atomically, and never left partial
+    temporary = os.path.join(
+        os.path.dirname(os.path.abspath(args.target)), f".{os.path.basename(args.target)}.tmp"
+    )
+
+    with open(temporary, "w") as f:
+        f.write(data)
+
+    os.replace(temporary, args.target)
+
+
+if __name__ == "__main__":
+    main()
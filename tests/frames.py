@@ -0,0 +1,106 @@
+"""Hand-built BACnet/IP frames, as sent by the devices, for the tests."""
+import struct
+from typing import List, Sequence, Tuple
+
+BVLC_UNICAST = 0x0A
+
+# NPDU of the responses, without the expecting reply flag of the requests
+NPDU = b"\x01\x00"
+
+
+def frame(apdu: bytes) -> bytes:
+    return struct.pack("!BBH", 0x81, BVLC_UNICAST, 4 + len(NPDU) + len(apdu)) + NPDU + apdu
+
+
+def object_identifier(object_type: int, instance: int) -> bytes:
+    return struct.pack("!I", object_type << 22 | instance)
+
+
+# application tagged values, as enclosed in the property value of a read access result
+
+
+def real(value: float) -> bytes:
+    return b"\x44" + struct.pack("!f", value)
+
+
+def enumerated(value: int) -> bytes:
+    data = value.to_bytes(max(1, (value.bit_length() + 7) // 8), "big")
+    return bytes([0x90 | len(data)]) + data
+
+
+def unsigned(value: int) -> bytes:
+    data = value.to_bytes(max(1, (value.bit_length() + 7) // 8), "big")
+    return bytes([0x20 | len(data)]) + data
+
+
+def string(value: str) -> bytes:
+    data = b"\x00" + value.encode()
+    if len(data) < 5:
+        return bytes([0x70 | len(data)]) + data
+
+    return bytes([0x75, len(data)]) + data
+
+
+def read_access_result(
+    object_type: int, instance: int, results: Sequence[Tuple[int, object]]
+) -> bytes:
+    """Encode the results of an object, values are encoded values or (class, code) errors."""
+    data = b"\x0c" + object_identifier(object_type, instance) + b"\x1e"
+
+    for property_identifier, result in results:
+        data += bytes([0x29, property_identifier])
+
+        if isinstance(result, tuple):
+            error_class, error_code = result
+            data += b"\x5e" + enumerated(error_class) + enumerated(error_code) + b"\x5f"
+        else:
+            data += b"\x4e" + result + b"\x4f"
+
+    return data + b"\x1f"
+
+
+def complex_ack(invoke_id: int, service_choice: int, body: bytes) -> bytes:
+    return frame(bytes([0x30, invoke_id, service_choice]) + body)
+
+
+def segmented_complex_ack(
+    invoke_id: int, service_choice: int, body: bytes, segment_size: int, window_size: int
+) -> List[bytes]:
+    """Split the ComplexACK into segments, as proposed with the window size."""
+    chunks = [body[i : i + segment_size] for i in range(0, len(body), segment_size)]
+
+    return [
+        frame(
+            bytes(
+                [
+                    0x38 | (0x04 if n < len(chunks) - 1 else 0),
+                    invoke_id,
+                    n,
+                    window_size,
+                    service_choice,
+                ]
+            )
+            + chunk
+        )
+        for n, chunk in enumerate(chunks)
+    ]
+
+
+def segment_ack(data: bytes) -> Tuple[bool, int, int, int]:
+    """Decode a SegmentACK: negative flag, invoke ID, sequence number and window size."""
+    apdu = data[4 + len(NPDU) :]
+    assert apdu[0] >> 4 == 4
+
+    return bool(apdu[0] & 0x02), apdu[1], apdu[2], apdu[3]
+
+
+def simple_ack(invoke_id: int, service_choice: int) -> bytes:
+    return frame(bytes([0x20, invoke_id, service_choice]))
+
+
+def reject(invoke_id: int, reason: int) -> bytes:
+    return frame(bytes([0x60, invoke_id, reason]))
+
+
+def abort(invoke_id: int, reason: int) -> bytes:
+    return frame(bytes([0x71, invoke_id, reason]))
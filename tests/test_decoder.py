@@ -0,0 +1,122 @@
+"""Decoding of ReadPropertyMultiple responses, over the fast paths and the generic one."""
+import pytest
+from frames import (
+    abort,
+    complex_ack,
+    enumerated,
+    read_access_result,
+    real,
+    reject,
+    string,
+    unsigned,
+)
+
+from flexit_bacnet.bacnet import (
+    AbortResponse,
+    DecodingError,
+    ObjectType,
+    ReadValue,
+    RejectResponse,
+    ServiceChoice,
+    _parse_read_property_multiple_response,
+)
+
+INVOKE_ID = 3
+
+# error class property, and codes unknown-object and unknown-property
+PROPERTY = 2
+UNKNOWN_OBJECT = 31
+UNKNOWN_PROPERTY = 32
+
+PRESENT_VALUE = ReadValue.PRESENT_VALUE
+
+
+def parse(*results, errors=None):
+    response = complex_ack(INVOKE_ID, ServiceChoice.READ_PROPERTY_MULTIPLE, b"".join(results))
+    return _parse_read_property_multiple_response(response, INVOKE_ID, errors)
+
+
+def test_values_of_the_fast_paths():
+    state = parse(
+        read_access_result(0, 1, [(85, real(21.5))]),
+        read_access_result(5, 2, [(85, enumerated(1))]),
+        read_access_result(19, 3, [(85, unsigned(4))]),
+        read_access_result(48, 4, [(85, unsigned(255))]),
+    )
+
+    assert state == {
+        (ObjectType.ANALOG_INPUT, 1): [(PRESENT_VALUE, 21.5)],
+        (ObjectType.BINARY_VALUE, 2): [(PRESENT_VALUE, 1)],
+        (ObjectType.MULTI_STATE_VALUE, 3): [(PRESENT_VALUE, 4)],
+        (ObjectType.POSITIVE_INTEGER_VALUE, 4): [(PRESENT_VALUE, 255)],
+    }
+
+
+def test_values_of_the_generic_path():
+    state = parse(
+        read_access_result(48, 1, [(85, unsigned(3600))]),
+        read_access_result(19, 2, [(85, enumerated(300))]),
+        read_access_result(8, 3, [(77, string("HvacFnct21y_A")), (28, string("800220"))]),
+    )
+
+    assert state == {
+        (ObjectType.POSITIVE_INTEGER_VALUE, 1): [(PRESENT_VALUE, 3600)],
+        (ObjectType.MULTI_STATE_VALUE, 2): [(PRESENT_VALUE, 300)],
+        (ObjectType.DEVICE, 3): [
+            (ReadValue.OBJECT_NAME, "HvacFnct21y_A"),
+            (ReadValue.DESCRIPTION, "800220"),
+        ],
+    }
+
+
+def test_property_access_errors_are_zero_values_with_error_codes():
+    errors = {}
+    state = parse(
+        read_access_result(0, 1, [(85, real(1.5))]),
+        read_access_result(0, 2, [(85, (PROPERTY, UNKNOWN_PROPERTY))]),
+        read_access_result(2, 3, [(85, enumerated(300)), (77, (PROPERTY, UNKNOWN_OBJECT))]),
+        read_access_result(8, 4, [(77, (PROPERTY, UNKNOWN_PROPERTY)), (28, string("800220"))]),
+        errors=errors,
+    )
+
+    assert state == {
+        (ObjectType.ANALOG_INPUT, 1): [(PRESENT_VALUE, 1.5)],
+        (ObjectType.ANALOG_INPUT, 2): [(PRESENT_VALUE, 0)],
+        (ObjectType.ANALOG_VALUE, 3): [(PRESENT_VALUE, 300), (ReadValue.OBJECT_NAME, 0)],
+        (ObjectType.DEVICE, 4): [(ReadValue.OBJECT_NAME, 0), (ReadValue.DESCRIPTION, "800220")],
+    }
+
+    assert errors == {
+        ((ObjectType.ANALOG_INPUT, 2), PRESENT_VALUE): UNKNOWN_PROPERTY,
+        ((ObjectType.ANALOG_VALUE, 3), ReadValue.OBJECT_NAME): UNKNOWN_OBJECT,
+        ((ObjectType.DEVICE, 4), ReadValue.OBJECT_NAME): UNKNOWN_PROPERTY,
+    }
+
+
+def test_errors_are_optional():
+    state = parse(read_access_result(0, 1, [(85, (PROPERTY, UNKNOWN_PROPERTY))]))
+
+    assert state == {(ObjectType.ANALOG_INPUT, 1): [(PRESENT_VALUE, 0)]}
+
+
+def test_truncated_response():
+    result = read_access_result(0, 1, [(85, real(1.5))])
+
+    for length in range(1, len(result)):
+        with pytest.raises(DecodingError):
+            parse(result[:length])
+
+
+def test_unexpected_invoke_id():
+    response = complex_ack(INVOKE_ID + 1, ServiceChoice.READ_PROPERTY_MULTIPLE, b"")
+
+    with pytest.raises(DecodingError):
+        _parse_read_property_multiple_response(response, INVOKE_ID)
+
+
+def test_reject_and_abort():
+    with pytest.raises(RejectResponse):
+        _parse_read_property_multiple_response(reject(INVOKE_ID, 4), INVOKE_ID)
+
+    with pytest.raises(AbortResponse):
+        _parse_read_property_multiple_response(abort(INVOKE_ID, 4), INVOKE_ID)
@@ -0,0 +1,122 @@
+"""Reassembly of segmented ComplexACK responses, acknowledged window by window."""
+import asyncio
+
+from frames import (
+    complex_ack,
+    read_access_result,
+    real,
+    segment_ack,
+    segmented_complex_ack,
+    string,
+)
+
+from flexit_bacnet.bacnet import (
+    BACnetTransport,
+    ObjectType,
+    ReadValue,
+    SegmentedResponse,
+    ServiceChoice,
+    _parse_read_property_multiple_response,
+)
+
+INVOKE_ID = 9
+ADDRESS = ("192.0.2.1", 47808)
+
+# five segments of a response reading 8 analog values and the device name
+BODY = b"".join(
+    read_access_result(0, instance, [(85, real(instance / 2))]) for instance in range(8)
+) + read_access_result(8, 2, [(77, string("HvacFnct21y_A"))])
+SEGMENT_SIZE = -(-len(BODY) // 5)
+
+
+def segments(window_size=2):
+    return segmented_complex_ack(
+        INVOKE_ID, ServiceChoice.READ_PROPERTY_MULTIPLE, BODY, SEGMENT_SIZE, window_size
+    )
+
+
+def expected_state():
+    state = {(ObjectType.ANALOG_INPUT, i): [(ReadValue.PRESENT_VALUE, i / 2)] for i in range(8)}
+    state[(ObjectType.DEVICE, 2)] = [(ReadValue.OBJECT_NAME, "HvacFnct21y_A")]
+    return state
+
+
+def test_segments_are_acknowledged_once_per_window():
+    response = SegmentedResponse()
+    acks = []
+    reassembled = None
+
+    assert len(segments()) == 5
+
+    for segment in segments():
+        ack, reassembled = response.segment_received(segment)
+        acks.append(None if ack is None else segment_ack(ack))
+
+    # the first segment is acknowledged on its own, then every second one and the last one
+    assert acks == [
+        (False, INVOKE_ID, 0, 2),
+        None,
+        (False, INVOKE_ID, 2, 2),
+        None,
+        (False, INVOKE_ID, 4, 2),
+    ]
+
+    assert reassembled == complex_ack(INVOKE_ID, ServiceChoice.READ_PROPERTY_MULTIPLE, BODY)
+    assert _parse_read_property_multiple_response(reassembled, INVOKE_ID) == expected_state()
+
+
+def test_out_of_order_segment_is_negatively_acknowledged():
+    first, second, third, *rest = segments()
+    response = SegmentedResponse()
+
+    response.segment_received(first)
+
+    # the second segment was lost, retransmission starts after the first one
+    ack, reassembled = response.segment_received(third)
+    assert segment_ack(ack) == (True, INVOKE_ID, 0, 2)
+    assert reassembled is None
+
+    for segment in [second, third, *rest]:
+        ack, reassembled = response.segment_received(segment)
+
+    assert _parse_read_property_multiple_response(reassembled, INVOKE_ID) == expected_state()
+
+
+def test_window_size_is_limited():
+    response = SegmentedResponse()
+
+    ack, _ = response.segment_received(segments(window_size=0)[0])
+    assert segment_ack(ack) == (False, INVOKE_ID, 0, 1)
+
+
+class RecordingTransport(asyncio.DatagramTransport):
+    def __init__(self):
+        super().__init__()
+        self.sent = []
+
+    def sendto(self, data, addr=None):
+        self.sent.append((data, addr))
+
+    def is_closing(self):
+        return False
+
+
+def test_transport_acknowledges_and_reassembles_segments():
+    async def main():
+        recording = RecordingTransport()
+        transport = BACnetTransport()
+        transport.connection_made(recording)
+
+        request = asyncio.ensure_future(transport.request(b"request", ADDRESS, INVOKE_ID))
+        await asyncio.sleep(0)
+
+        for segment in segments():
+            transport.datagram_received(segment, ADDRESS)
+
+        response = await request
+
+        assert recording.sent[0] == (b"request", ADDRESS)
+        assert [segment_ack(data)[2] for data, _ in recording.sent[1:]] == [0, 2, 4]
+        assert _parse_read_property_multiple_response(response, INVOKE_ID) == expected_state()
+
+    asyncio.run(main())
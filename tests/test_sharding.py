@@ -0,0 +1,203 @@
+"""End-to-end tests of ShardedFleet, with worker processes polling fake devices."""
+import asyncio
+import struct
+
+import pytest
+
+from flexit_bacnet import (
+    CachedDevice,
+    DeviceCache,
+    PollScheduler,
+    PollStatus,
+    ShardedFleet,
+    WorkerError,
+)
+from flexit_bacnet.bacnet import ObjectType, ReadValue
+from flexit_bacnet.fleet import PollResult
+from flexit_bacnet.sharding import _create_device, _ShardWorker
+
+SERIAL_NUMBER = "800220-000000"
+DEVICE_NAME = "HvacFnct21y_A"
+
+PROCESSES = 2
+DEVICES_PER_SHARD = 2
+
+# seconds the workers have to start (spawned processes import the package again) and poll
+TIMEOUT = 30.0
+
+
+class FakeDevice(asyncio.DatagramProtocol):
+    """Answers ReadPropertyMultiple requests, with the instance number as every value."""
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.requests = 0
+
+    def datagram_received(self, data: bytes, addr):
+        apdu = data[6:]
+
+        # only confirmed ReadPropertyMultiple requests
+        if apdu[0] >> 4 != 0 or apdu[3] != 14:
+            return
+
+        self.requests += 1
+        response = bytes([0x30, apdu[2], 14])
+        i = 4
+
+        while i < len(apdu):
+            object_identifier = apdu[i + 1 : i + 5]
+            object_type, instance = divmod(struct.unpack("!I", object_identifier)[0], 1 << 22)
+            response += b"\x0c" + object_identifier + b"\x1e"
+            i += 6
+
+            while apdu[i] != 0x1F:
+                property_identifier = apdu[i + 1]
+                response += bytes([0x29, property_identifier, 0x4E])
+                response += self._value(object_type, instance, property_identifier)
+                response += b"\x4f"
+                i += 2
+
+            response += b"\x1f"
+            i += 1
+
+        npdu = b"\x01\x00" + response
+        self.transport.sendto(struct.pack("!BBH", 0x81, 0x0A, 4 + len(npdu)) + npdu, addr)
+
+    @staticmethod
+    def _value(object_type: int, instance: int, property_identifier: int) -> bytes:
+        if object_type == 8:
+            text = DEVICE_NAME if property_identifier == 77 else SERIAL_NUMBER
+            return bytes([0x75, len(text) + 1, 0]) + text.encode()
+
+        if object_type in (0, 1, 2):
+            return b"\x44" + struct.pack("!f", float(instance))
+
+        if object_type == 5:
+            return bytes([0x91, instance & 0xFF])
+
+        return bytes([0x21, instance & 0xFF])
+
+
+async def start_devices(fleet_shard, count_per_shard):
+    """Start fake devices on loopback addresses, so that every shard polls several of them."""
+    loop = asyncio.get_running_loop()
+    devices = []
+    per_shard = {}
+
+    for host in range(2, 255):
+        address = f"127.0.0.{host}"
+        shard = fleet_shard(CachedDevice(address, 2))
+
+        if per_shard.get(shard, 0) == count_per_shard:
+            continue
+
+        transport, fake = await loop.create_datagram_endpoint(
+            FakeDevice, local_addr=(address, 0)
+        )
+        port = transport.get_extra_info("sockname")[1]
+        per_shard[shard] = per_shard.get(shard, 0) + 1
+        devices.append((CachedDevice(address, 2, port=port), fake))
+
+        if len(devices) == PROCESSES * count_per_shard:
+            break
+
+    return devices
+
+
+async def wait_until_polled(fleet, count):
+    """Return the devices polled successfully, once each was polled."""
+    polled = set()
+
+    async for summary in fleet.summaries():
+        polled.update(result.device for result in summary.results if result.status == PollStatus.OK)
+
+        if len(polled) == count:
+            return polled
+
+
+def test_devices_of_every_shard_are_mirrored(tmp_path):
+    async def main():
+        device_cache = DeviceCache(str(tmp_path / "devices.json"))
+        shard = ShardedFleet([], processes=PROCESSES).shard
+        devices = await start_devices(shard, DEVICES_PER_SHARD)
+
+        fleet = ShardedFleet(
+            [cached for cached, _ in devices],
+            processes=PROCESSES,
+            interval=0.5,
+            jitter=0,
+            deadline=5,
+            device_cache=device_cache,
+            scheduler_factory=PollScheduler,
+        )
+        assert {fleet.shard(cached) for cached, _ in devices} == set(range(PROCESSES))
+
+        async with fleet:
+            polled = await asyncio.wait_for(wait_until_polled(fleet, len(devices)), TIMEOUT)
+
+        assert polled == set(fleet.devices)
+        assert not fleet.failures
+
+        for (cached, fake), mirror in zip(devices, fleet.devices):
+            assert fake.requests > 0
+            assert mirror.serial_number == SERIAL_NUMBER
+
+            # written by the parent process only, from the state of the mirrors
+            assert device_cache.get(cached.address, cached.port).device_name == DEVICE_NAME
+
+    asyncio.run(main())
+
+
+def test_failed_worker_is_reported():
+    async def main():
+        shard = ShardedFleet([], processes=PROCESSES).shard
+        devices = await start_devices(shard, 1)
+
+        fleet = ShardedFleet(
+            [cached for cached, _ in devices], processes=PROCESSES, interval=0.5, jitter=0
+        )
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda loop, context: None)
+
+        async with fleet:
+            await asyncio.wait_for(wait_until_polled(fleet, len(devices)), TIMEOUT)
+            fleet._workers[0].kill()
+
+            with pytest.raises(WorkerError):
+                await asyncio.wait_for(wait_until_polled(fleet, -1), TIMEOUT)
+
+        assert list(fleet.failures) == [0]
+
+    asyncio.run(main())
+
+
+def test_scheduler_cannot_be_shared():
+    with pytest.raises(ValueError):
+        ShardedFleet([CachedDevice("192.0.2.1", 2)], processes=1, scheduler=PollScheduler())
+
+
+def test_only_published_values_are_sent():
+    async def main():
+        worker = _ShardWorker(None, [])
+        device = _create_device(CachedDevice("192.0.2.1", 2))
+        device._recorded = lambda *value: worker._value_recorded(0, *value)
+        worker._indexes[device] = 0
+        worker._profiles[0] = None
+
+        def sent_state():
+            return worker._encode_result(PollResult(device, PollStatus.OK, 0, 0, None))[5]
+
+        temperature = (ObjectType.ANALOG_INPUT, 1)
+        mode = (ObjectType.MULTI_STATE_VALUE, 2)
+        present_value = ReadValue.PRESENT_VALUE
+
+        device._merge_state({temperature: [(present_value, 20.0)], mode: [(present_value, 1)]})
+        assert sent_state() == ((0, 1, ((85, 20.0),)), (19, 2, ((85, 1),)))
+
+        device._merge_state({temperature: [(present_value, 20.0)], mode: [(present_value, 1)]})
+        assert sent_state() is None
+
+        device._merge_state({temperature: [(present_value, 20.5)], mode: [(present_value, 1)]})
+        assert sent_state() == ((0, 1, ((85, 20.5),)),)
+
+    asyncio.run(main())
@@ -0,0 +1,125 @@
+"""Writing with WritePropertyMultiple, and the fallback to WriteProperty."""
+import asyncio
+import struct
+
+import pytest
+from frames import abort, reject, simple_ack
+
+from flexit_bacnet import nordic
+from flexit_bacnet.bacnet import (
+    AbortReason,
+    BACnetClient,
+    RejectReason,
+    RejectResponse,
+    ServiceChoice,
+    _parse_write_property_multiple_response,
+)
+
+# position of the invoke ID and the service choice in the request frames
+INVOKE_ID_INDEX = 8
+SERVICE_CHOICE_INDEX = 9
+
+# position of the object identifier and of the REAL value in WriteProperty requests,
+# after their tags and the property identifier
+OBJECT_IDENTIFIER_INDEX = 11
+VALUE_INDEX = 19
+
+VALUES = [
+    (nordic.AIR_TEMP_SETPOINT_HOME, 21.5),
+    (nordic.AIR_TEMP_SETPOINT_AWAY, 16.0),
+]
+
+
+class FakeDevice:
+    """Answers the requests sent by the client, WritePropertyMultiple with the given response."""
+
+    def __init__(self, write_multiple_response):
+        self.write_multiple_response = write_multiple_response
+        self.requests = []
+
+    async def send(self, request: bytes, invoke_id: int) -> bytes:
+        service_choice = request[SERVICE_CHOICE_INDEX]
+        self.requests.append(request)
+
+        assert request[INVOKE_ID_INDEX] == invoke_id
+
+        if service_choice == ServiceChoice.WRITE_PROPERTY_MULTIPLE:
+            return self.write_multiple_response(invoke_id)
+
+        return simple_ack(invoke_id, service_choice)
+
+    def services(self):
+        return [request[SERVICE_CHOICE_INDEX] for request in self.requests]
+
+    def written(self):
+        """Return object identifier and the REAL value of each WriteProperty request."""
+        return [
+            (
+                struct.unpack_from("!I", request, OBJECT_IDENTIFIER_INDEX)[0],
+                struct.unpack_from("!f", request, VALUE_INDEX)[0],
+            )
+            for request in self.requests
+            if request[SERVICE_CHOICE_INDEX] == ServiceChoice.WRITE_PROPERTY
+        ]
+
+
+def client_of(device: FakeDevice) -> BACnetClient:
+    client = BACnetClient("192.0.2.1")
+    client._send = device.send
+    return client
+
+
+def identifier(device_property):
+    return device_property.object_type << 22 | device_property.instance_id
+
+
+def test_values_are_written_in_a_single_request():
+    device = FakeDevice(lambda invoke_id: simple_ack(invoke_id, 16))
+    client = client_of(device)
+
+    asyncio.run(client.write_multiple(VALUES))
+
+    assert device.services() == [ServiceChoice.WRITE_PROPERTY_MULTIPLE]
+    assert client.write_multiple_supported
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        lambda invoke_id: reject(invoke_id, RejectReason.UNRECOGNIZED_SERVICE),
+        lambda invoke_id: abort(invoke_id, AbortReason.OTHER),
+    ],
+)
+def test_refused_request_falls_back_to_single_writes(response):
+    device = FakeDevice(response)
+    client = client_of(device)
+
+    async def main():
+        await client.write_multiple(VALUES)
+
+        # the device is not asked again
+        await client.write_multiple(VALUES[:1])
+
+    asyncio.run(main())
+
+    assert device.services() == [
+        ServiceChoice.WRITE_PROPERTY_MULTIPLE,
+        ServiceChoice.WRITE_PROPERTY,
+        ServiceChoice.WRITE_PROPERTY,
+        ServiceChoice.WRITE_PROPERTY,
+    ]
+    assert device.written() == [
+        (identifier(nordic.AIR_TEMP_SETPOINT_HOME), 21.5),
+        (identifier(nordic.AIR_TEMP_SETPOINT_AWAY), 16.0),
+        (identifier(nordic.AIR_TEMP_SETPOINT_HOME), 21.5),
+    ]
+    assert not client.write_multiple_supported
+
+
+def test_reject_is_raised_by_the_parser():
+    with pytest.raises(RejectResponse) as info:
+        _parse_write_property_multiple_response(
+            reject(7, RejectReason.UNRECOGNIZED_SERVICE), 7
+        )
+
+    assert info.value.reason == RejectReason.UNRECOGNIZED_SERVICE